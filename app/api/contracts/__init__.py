@@ -1,6 +1,6 @@
 from app.api.contracts.base import ApiModel, DeviceId, RecordId, UtcDatetime
 from app.api.contracts.commands import CommandSnapshotOut, IrrigationCommandIn
-from app.api.contracts.devices import DeviceSnapshotOut
+from app.api.contracts.devices import MAX_DEVICE_SNAPSHOT_BATCH_SIZE, DeviceSnapshotOut
 from app.api.contracts.errors import (
     ErrorBodyOut,
     ErrorDiagnosticsOut,
@@ -26,7 +26,18 @@ from app.api.contracts.strategic_coverage import (
     StrategicCoverageReportOut,
     StrategicFeatureCoverageOut,
 )
-from app.api.contracts.telemetry import TelemetryIn, TelemetryOut
+from app.api.contracts.telemetry import (
+    MAX_TELEMETRY_BATCH_SIZE,
+    MAX_TELEMETRY_PAGE_SIZE,
+    MetricStatsOut,
+    TelemetryAggregateOut,
+    TelemetryBatchAckOut,
+    TelemetryBatchItemOut,
+    TelemetryBucketOut,
+    TelemetryIn,
+    TelemetryOut,
+    TelemetryPageOut,
+)
 
 __all__ = [
     'AckResponse',
@@ -44,6 +55,10 @@ __all__ = [
     'IrrigationCommandIn',
     'LedgerRecordIn',
     'LivenessOut',
+    'MAX_DEVICE_SNAPSHOT_BATCH_SIZE',
+    'MAX_TELEMETRY_BATCH_SIZE',
+    'MAX_TELEMETRY_PAGE_SIZE',
+    'MetricStatsOut',
     'ProductModuleCoverageOut',
     'ProductReadinessReportOut',
     'RequirementCoverageOut',
@@ -53,8 +68,13 @@ __all__ = [
     'RootStatusOut',
     'StrategicCoverageReportOut',
     'StrategicFeatureCoverageOut',
+    'TelemetryAggregateOut',
+    'TelemetryBatchAckOut',
+    'TelemetryBatchItemOut',
+    'TelemetryBucketOut',
     'TelemetryIn',
     'TelemetryOut',
+    'TelemetryPageOut',
     'UtcDatetime',
     'ValidationIssueOut',
 ]
@@ -2,6 +2,8 @@ from app.api.contracts.base import ApiModel, DeviceId
 from app.api.contracts.commands import CommandSnapshotOut
 from app.api.contracts.telemetry import TelemetryOut
 
+MAX_DEVICE_SNAPSHOT_BATCH_SIZE = 500
+
 
 class DeviceSnapshotOut(ApiModel):
     device_id: DeviceId
@@ -3,6 +3,11 @@ from typing import Any
 from pydantic import Field
 
 from app.api.contracts.base import ApiModel, DeviceId, UtcDatetime
+from app.api.contracts.strategic_coverage import AckStatus
+from app.domain.entities.models import OutboxState, TelemetryBucket
+
+MAX_TELEMETRY_BATCH_SIZE = 500
+MAX_TELEMETRY_PAGE_SIZE = 500
 
 
 class TelemetryIn(ApiModel):
@@ -33,3 +38,51 @@ class TelemetryOut(ApiModel):
     ph: float = Field(ge=0, le=14)
     captured_at: UtcDatetime
     metadata: dict[str, Any] = Field(default_factory=dict, max_length=32)
+
+
+class TelemetryBatchItemOut(ApiModel):
+    index: int = Field(ge=0, description='Posicao da leitura no lote enviado.')
+    device_id: DeviceId
+    outbox_state: OutboxState = Field(
+        description='published quando o Kafka confirmou; pending fica para reconciliacao.'
+    )
+
+
+class TelemetryBatchAckOut(ApiModel):
+    status: AckStatus
+    timestamp: UtcDatetime
+    accepted: int = Field(ge=0)
+    published: int = Field(ge=0)
+    items: list[TelemetryBatchItemOut]
+
+
+class TelemetryPageOut(ApiModel):
+    items: list[TelemetryOut]
+    next_cursor: str | None = Field(
+        default=None,
+        description='Cursor opaco da proxima pagina; ausente quando o historico terminou.',
+    )
+
+
+class MetricStatsOut(ApiModel):
+    min: float
+    max: float
+    avg: float
+
+
+class TelemetryBucketOut(ApiModel):
+    bucket_start: UtcDatetime
+    count: int = Field(ge=1)
+    moisture: MetricStatsOut
+    temperature: MetricStatsOut
+    ph: MetricStatsOut
+
+
+class TelemetryAggregateOut(ApiModel):
+    device_id: DeviceId
+    bucket: TelemetryBucket
+    since: UtcDatetime
+    until: UtcDatetime
+    items: list[TelemetryBucketOut] = Field(
+        description='Somente janelas com leituras, em ordem cronologica.'
+    )
@@ -1,23 +1,35 @@
-from collections.abc import Awaitable, Callable
+from datetime import datetime
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Header, Query
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Path, Query, Response
+from fastapi.responses import StreamingResponse
 
 from app.api.contracts import (
+    MAX_DEVICE_SNAPSHOT_BATCH_SIZE,
+    MAX_TELEMETRY_BATCH_SIZE,
+    MAX_TELEMETRY_PAGE_SIZE,
     AckResponse,
     AckStatus,
     CommandSnapshotOut,
+    DeviceId,
     DeviceSnapshotOut,
     ErrorEnvelopeOut,
     IrrigationCommandIn,
     LedgerRecordIn,
+    MetricStatsOut,
     ProductModuleCoverageOut,
     ProductReadinessReportOut,
     RequirementCoverageOut,
     RequirementDetailOut,
     StrategicCoverageReportOut,
+    TelemetryAggregateOut,
+    TelemetryBatchAckOut,
+    TelemetryBatchItemOut,
+    TelemetryBucketOut,
     TelemetryIn,
     TelemetryOut,
+    TelemetryPageOut,
+    UtcDatetime,
 )
 from app.application.services.coverage_service import (
     IMPLEMENTED_REQUIREMENTS,
@@ -25,14 +37,29 @@ from app.application.services.coverage_service import (
     REQUIREMENT_CATALOG,
     STRATEGIC_COVERAGE_MATRIX,
     STRATEGIC_NEXT_STEPS,
+    RenderedJson,
     _build_requirement_detail,
     _slugify_requirement,
 )
 from app.core.dependencies import Container, get_container
+from app.core.observability import metrics_registry
 from app.core.security import require_api_key
-from app.domain.entities.models import IrrigationCommand, LedgerRecord, TelemetryReading, utc_now
+from app.domain.entities.models import (
+    IrrigationCommand,
+    LedgerRecord,
+    MetricStats,
+    OutboxState,
+    TelemetryBucket,
+    TelemetryExportFormat,
+    TelemetryReading,
+    utc_now,
+)
 
 router = APIRouter(prefix='/api/v1')
+EXPORT_MEDIA_TYPES = {
+    TelemetryExportFormat.NDJSON: 'application/x-ndjson',
+    TelemetryExportFormat.CSV: 'text/csv',
+}
 ERROR_RESPONSES: dict[int | str, dict[str, Any]] = {
     400: {'model': ErrorEnvelopeOut, 'description': 'Requisicao invalida.'},
     401: {'model': ErrorEnvelopeOut, 'description': 'Autenticacao necessaria.'},
@@ -43,12 +70,51 @@ ERROR_RESPONSES: dict[int | str, dict[str, Any]] = {
     502: {'model': ErrorEnvelopeOut, 'description': 'Falha de dependencia externa.'},
     503: {'model': ErrorEnvelopeOut, 'description': 'Dependencia temporariamente indisponivel.'},
 }
+CONDITIONAL_RESPONSES: dict[int | str, dict[str, Any]] = {
+    304: {'description': 'Nao modificado: If-None-Match casou com a ETag atual.'},
+}
+
+
+def _etag(*versions: datetime | None) -> str:
+    """ETag fraca derivada dos timestamps que versionam a resposta."""
+    tag = '-'.join(
+        format(int(version.timestamp() * 1_000_000), 'x') if version else '0'
+        for version in versions
+    )
+    return f'W/"{tag}"'
+
+
+def _conditional(response: Response, if_none_match: str | None, etag: str) -> Response | None:
+    """Responde 304 quando `If-None-Match` casa com a ETag; senao so anota a ETag."""
+    response.headers['ETag'] = etag
+    if if_none_match is None:
+        return None
+    candidates = {candidate.strip().removeprefix('W/') for candidate in if_none_match.split(',')}
+    if '*' not in candidates and etag.removeprefix('W/') not in candidates:
+        return None
+    metrics_registry.increment_counter('http_not_modified_total')
+    return Response(status_code=304, headers={'ETag': etag})
+
+
+def _precomputed(rendered: RenderedJson, if_none_match: str | None) -> Response:
+    response = Response(content=rendered.body, media_type='application/json')
+    return _conditional(response, if_none_match, rendered.etag) or response
 
 
 def _container() -> Container:
     return get_container()
 
 
+def _to_reading(payload: TelemetryIn) -> TelemetryReading:
+    return TelemetryReading(
+        device_id=payload.device_id,
+        moisture=payload.moisture,
+        temperature=payload.temperature,
+        ph=payload.ph,
+        metadata=payload.metadata,
+    )
+
+
 @router.post(
     '/telemetry',
     response_model=AckResponse,
@@ -56,45 +122,161 @@ def _container() -> Container:
     responses=ERROR_RESPONSES,
 )
 async def ingest_telemetry(payload: TelemetryIn) -> AckResponse:
-    await _container().ingest_telemetry_use_case.execute(
-        TelemetryReading(
-            device_id=payload.device_id,
-            moisture=payload.moisture,
-            temperature=payload.temperature,
-            ph=payload.ph,
-            metadata=payload.metadata,
-        )
-    )
+    await _container().ingest_telemetry_use_case.execute(_to_reading(payload))
     return AckResponse(status=AckStatus.TELEMETRY_INGESTED, timestamp=utc_now())
 
 
+@router.post(
+    '/telemetry/batch',
+    response_model=TelemetryBatchAckOut,
+    tags=['telemetria'],
+    responses=ERROR_RESPONSES,
+)
+async def ingest_telemetry_batch(
+    payload: Annotated[
+        list[TelemetryIn],
+        Body(min_length=1, max_length=MAX_TELEMETRY_BATCH_SIZE),
+    ],
+) -> TelemetryBatchAckOut:
+    states = await _container().ingest_telemetry_use_case.execute_many(
+        [_to_reading(item) for item in payload]
+    )
+    return TelemetryBatchAckOut(
+        status=AckStatus.TELEMETRY_INGESTED,
+        timestamp=utc_now(),
+        accepted=len(states),
+        published=sum(state is OutboxState.PUBLISHED for state in states),
+        items=[
+            TelemetryBatchItemOut(index=index, device_id=item.device_id, outbox_state=state)
+            for index, (item, state) in enumerate(zip(payload, states, strict=True))
+        ],
+    )
+
+
+def _to_telemetry_out(item: TelemetryReading) -> TelemetryOut:
+    return TelemetryOut(
+        device_id=item.device_id,
+        moisture=item.moisture,
+        temperature=item.temperature,
+        ph=item.ph,
+        captured_at=item.captured_at,
+        metadata=item.metadata,
+    )
+
+
 @router.get('/telemetry', response_model=list[TelemetryOut], tags=['telemetria'])
 async def list_telemetry(
     limit: int = Query(default=20, ge=1, le=200),
     device_id: str | None = Query(default=None),
 ) -> list[TelemetryOut]:
     items = await _container().list_telemetry_use_case.execute(limit=limit, device_id=device_id)
-    return [
-        TelemetryOut(
-            device_id=item.device_id,
-            moisture=item.moisture,
-            temperature=item.temperature,
-            ph=item.ph,
-            captured_at=item.captured_at,
-            metadata=item.metadata,
-        )
-        for item in items
-    ]
+    return [_to_telemetry_out(item) for item in items]
 
 
 @router.get(
-    '/telemetry/latest/{device_id}', response_model=TelemetryOut | None, tags=['telemetria']
+    '/devices/{device_id}/telemetry',
+    response_model=TelemetryPageOut,
+    tags=['telemetria'],
+    responses=ERROR_RESPONSES,
 )
-async def latest_telemetry(device_id: str) -> TelemetryOut | None:
+async def list_device_telemetry_history(
+    device_id: str,
+    limit: int = Query(default=100, ge=1, le=MAX_TELEMETRY_PAGE_SIZE),
+    cursor: str | None = Query(default=None, max_length=512),
+    since: UtcDatetime | None = Query(default=None, description='Inicio inclusivo.'),
+    until: UtcDatetime | None = Query(default=None, description='Fim exclusivo.'),
+) -> TelemetryPageOut:
+    items, next_cursor = await _container().list_telemetry_history_use_case.execute(
+        device_id, limit=limit, cursor=cursor, since=since, until=until
+    )
+    return TelemetryPageOut(
+        items=[_to_telemetry_out(item) for item in items], next_cursor=next_cursor
+    )
+
+
+def _to_stats_out(stats: MetricStats) -> MetricStatsOut:
+    return MetricStatsOut(min=stats.minimum, max=stats.maximum, avg=stats.average)
+
+
+@router.get(
+    '/devices/{device_id}/telemetry/aggregate',
+    response_model=TelemetryAggregateOut,
+    tags=['telemetria'],
+    responses=ERROR_RESPONSES,
+)
+async def aggregate_device_telemetry(
+    device_id: str,
+    bucket: TelemetryBucket = Query(default=TelemetryBucket.HOUR),
+    since: UtcDatetime | None = Query(default=None, description='Inicio inclusivo.'),
+    until: UtcDatetime | None = Query(default=None, description='Fim exclusivo; padrao agora.'),
+) -> TelemetryAggregateOut:
+    since, until, items = await _container().aggregate_telemetry_use_case.execute(
+        device_id, bucket=bucket, since=since, until=until
+    )
+    return TelemetryAggregateOut(
+        device_id=device_id,
+        bucket=bucket,
+        since=since,
+        until=until,
+        items=[
+            TelemetryBucketOut(
+                bucket_start=item.bucket_start,
+                count=item.count,
+                moisture=_to_stats_out(item.moisture),
+                temperature=_to_stats_out(item.temperature),
+                ph=_to_stats_out(item.ph),
+            )
+            for item in items
+        ],
+    )
+
+
+@router.get(
+    '/telemetry/export',
+    response_class=StreamingResponse,
+    tags=['telemetria'],
+    responses={
+        200: {
+            'description': 'Historico em streaming, em ordem cronologica.',
+            'content': {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()},
+        },
+        **ERROR_RESPONSES,
+    },
+)
+async def export_telemetry(
+    device_id: str | None = Query(default=None),
+    since: UtcDatetime | None = Query(default=None, description='Inicio inclusivo.'),
+    until: UtcDatetime | None = Query(default=None, description='Fim exclusivo.'),
+    export_format: TelemetryExportFormat = Query(
+        default=TelemetryExportFormat.NDJSON, alias='format'
+    ),
+) -> StreamingResponse:
+    chunks = _container().export_telemetry_use_case.execute(
+        export_format, device_id=device_id, since=since, until=until
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={'Content-Disposition': f'attachment; filename="telemetry.{export_format.value}"'},
+    )
+
+
+@router.get(
+    '/telemetry/latest/{device_id}',
+    response_model=TelemetryOut | None,
+    tags=['telemetria'],
+    responses=CONDITIONAL_RESPONSES,
+)
+async def latest_telemetry(
+    device_id: str,
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> TelemetryOut | Response | None:
     cached = await _container().get_cached_telemetry_use_case.execute(device_id)
     if not cached:
         return None
-    return TelemetryOut.model_validate(cached)
+    telemetry = TelemetryOut.model_validate(cached)
+    return _conditional(response, if_none_match, _etag(telemetry.captured_at)) or telemetry
 
 
 @router.post(
@@ -135,9 +317,16 @@ async def dispatch_command(
 
 
 @router.get(
-    '/commands/latest/{device_id}', response_model=CommandSnapshotOut | None, tags=['comandos']
+    '/commands/latest/{device_id}',
+    response_model=CommandSnapshotOut | None,
+    tags=['comandos'],
+    responses=CONDITIONAL_RESPONSES,
 )
-async def latest_command(device_id: str) -> CommandSnapshotOut | None:
+async def latest_command(
+    device_id: str,
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> CommandSnapshotOut | Response | None:
     cached = await _container().get_cached_command_use_case.execute(device_id)
     if not cached:
         return None
@@ -146,7 +335,8 @@ async def latest_command(device_id: str) -> CommandSnapshotOut | None:
     if 'sent_at' not in command_payload and 'created_at' in command_payload:
         command_payload['sent_at'] = command_payload.pop('created_at')
 
-    return CommandSnapshotOut.model_validate(command_payload)
+    command = CommandSnapshotOut.model_validate(command_payload)
+    return _conditional(response, if_none_match, _etag(command.sent_at)) or command
 
 
 @router.post(
@@ -182,32 +372,76 @@ async def register_ledger(
 
 
 @router.get(
-    '/devices/{device_id}/snapshot', response_model=DeviceSnapshotOut, tags=['dispositivos']
+    '/devices/{device_id}/snapshot',
+    response_model=DeviceSnapshotOut,
+    tags=['dispositivos'],
+    responses=CONDITIONAL_RESPONSES,
+)
+async def get_device_snapshot(
+    device_id: str,
+    response: Response,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> DeviceSnapshotOut | Response:
+    snapshot = DeviceSnapshotOut.model_validate(
+        await _container().get_device_snapshot_use_case.execute(device_id)
+    )
+    etag = _etag(
+        snapshot.telemetry.captured_at if snapshot.telemetry else None,
+        snapshot.command.sent_at if snapshot.command else None,
+    )
+    return _conditional(response, if_none_match, etag) or snapshot
+
+
+@router.post(
+    '/devices/snapshots',
+    response_model=list[DeviceSnapshotOut],
+    tags=['dispositivos'],
+    responses=ERROR_RESPONSES,
 )
-async def get_device_snapshot(device_id: str) -> DeviceSnapshotOut:
-    snapshot = await _container().get_device_snapshot_use_case.execute(device_id)
-    return DeviceSnapshotOut.model_validate(snapshot)
+async def get_device_snapshots(
+    device_ids: Annotated[
+        list[DeviceId],
+        Body(min_length=1, max_length=MAX_DEVICE_SNAPSHOT_BATCH_SIZE),
+    ],
+) -> list[DeviceSnapshotOut]:
+    snapshots = await _container().get_device_snapshot_use_case.execute_many(device_ids)
+    return [DeviceSnapshotOut.model_validate(snapshot) for snapshot in snapshots]
 
 
 @router.get(
-    '/requirements', response_model=list[RequirementCoverageOut], tags=['cobertura estratégica']
+    '/requirements',
+    response_model=list[RequirementCoverageOut],
+    tags=['cobertura estratégica'],
+    responses=CONDITIONAL_RESPONSES,
 )
-async def list_requirement_coverage() -> list[RequirementCoverageOut]:
-    return _container().coverage_service.list_requirement_coverage()
+async def list_requirement_coverage(
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    return _precomputed(_container().coverage_service.requirements_json, if_none_match)
 
 
 @router.get(
-    '/strategic/coverage', response_model=StrategicCoverageReportOut, tags=['cobertura estratégica']
+    '/strategic/coverage',
+    response_model=StrategicCoverageReportOut,
+    tags=['cobertura estratégica'],
+    responses=CONDITIONAL_RESPONSES,
 )
-async def strategic_coverage_report() -> StrategicCoverageReportOut:
-    return _container().coverage_service.strategic_coverage_report()
+async def strategic_coverage_report(
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    return _precomputed(_container().coverage_service.strategic_coverage_json, if_none_match)
 
 
 @router.get(
-    '/product/readiness', response_model=ProductReadinessReportOut, tags=['cobertura estratégica']
+    '/product/readiness',
+    response_model=ProductReadinessReportOut,
+    tags=['cobertura estratégica'],
+    responses=CONDITIONAL_RESPONSES,
 )
-async def product_readiness_report() -> ProductReadinessReportOut:
-    return _container().coverage_service.product_readiness_report()
+async def product_readiness_report(
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    return _precomputed(_container().coverage_service.product_readiness_json, if_none_match)
 
 
 @router.get(
@@ -219,33 +453,36 @@ async def product_module_detail(module_slug: str) -> ProductModuleCoverageOut:
     return _container().coverage_service.product_module_detail(module_slug)
 
 
-def _requirement_endpoint(
-    requirement_id: str,
-    title: str,
-) -> Callable[[], Awaitable[RequirementDetailOut]]:
-    async def _handler() -> RequirementDetailOut:
-        return _container().coverage_service.requirement_detail(requirement_id, title)
-
-    _handler.__name__ = f'requirement_{requirement_id.replace(".", "_")}'
-    return _handler
+REQUIREMENT_SLUGS = [
+    _slugify_requirement(requirement_id, title) for requirement_id, title in REQUIREMENT_CATALOG
+]
 
 
-for _requirement_id, _title in REQUIREMENT_CATALOG:
-    _slug = _slugify_requirement(_requirement_id, _title)
-    router.add_api_route(
-        f'/requirements/{_slug}',
-        _requirement_endpoint(_requirement_id, _title),
-        methods=['GET'],
-        response_model=RequirementDetailOut,
-        tags=['requirements'],
-        summary=f'Cobertura do requisito {_requirement_id}',
-    )
+@router.get(
+    '/requirements/{slug}',
+    response_model=RequirementDetailOut,
+    tags=['requirements'],
+    summary='Cobertura de um requisito do catalogo',
+    responses={
+        **CONDITIONAL_RESPONSES,
+        404: {'model': ErrorEnvelopeOut, 'description': 'Requisito nao catalogado.'},
+    },
+)
+async def requirement_detail(
+    slug: Annotated[str, Path(json_schema_extra={'enum': REQUIREMENT_SLUGS})],
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    rendered = _container().coverage_service.requirement_details_json.get(slug)
+    if rendered is None:
+        raise HTTPException(status_code=404)
+    return _precomputed(rendered, if_none_match)
 
 
 __all__ = [
     'IMPLEMENTED_REQUIREMENTS',
     'PRODUCT_MODULES',
     'REQUIREMENT_CATALOG',
+    'REQUIREMENT_SLUGS',
     'STRATEGIC_COVERAGE_MATRIX',
     'STRATEGIC_NEXT_STEPS',
     '_build_requirement_detail',
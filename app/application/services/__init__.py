@@ -1,4 +1,15 @@
 from app.application.services.coverage_service import CoverageService
 from app.application.services.idempotency_service import IdempotencyService
+from app.application.services.outbox_relay import OutboxRelay
+from app.application.services.projection_queue import ProjectionQueue
+from app.application.services.retention_worker import RetentionWorker
+from app.application.services.telemetry_ring_buffer import TelemetryRingBuffer
 
-__all__ = ['CoverageService', 'IdempotencyService']
+__all__ = [
+    'CoverageService',
+    'IdempotencyService',
+    'OutboxRelay',
+    'ProjectionQueue',
+    'RetentionWorker',
+    'TelemetryRingBuffer',
+]
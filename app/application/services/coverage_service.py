@@ -1,5 +1,9 @@
+import hashlib
+from dataclasses import dataclass
 from re import sub
-from typing import cast
+from typing import Any, cast
+
+from pydantic_core import to_json
 
 from app.api.contracts import (
     ProductModuleCoverageOut,
@@ -446,7 +450,32 @@ def _build_product_module_detail(module: dict[str, object]) -> ProductModuleCove
     )
 
 
+@dataclass(frozen=True, slots=True)
+class RenderedJson:
+    """Resposta JSON ja codificada com ETag forte do conteudo."""
+
+    body: bytes
+    etag: str
+
+
+def _render(payload: Any) -> RenderedJson:
+    body = to_json(payload)
+    return RenderedJson(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
 class CoverageService:
+    def __init__(self) -> None:
+        # Os catalogos sao constantes do modulo: renderiza uma vez e serve os mesmos bytes.
+        self.requirements_json = _render(self.list_requirement_coverage())
+        self.strategic_coverage_json = _render(self.strategic_coverage_report())
+        self.product_readiness_json = _render(self.product_readiness_report())
+        self.requirement_details_json = {
+            _slugify_requirement(requirement_id, title): _render(
+                _build_requirement_detail(requirement_id, title)
+            )
+            for requirement_id, title in REQUIREMENT_CATALOG
+        }
+
     def list_requirement_coverage(self) -> list[RequirementCoverageOut]:
         return [
             RequirementCoverageOut(
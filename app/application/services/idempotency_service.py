@@ -6,7 +6,9 @@ import re
 from collections.abc import Awaitable, Callable
 from typing import Any
 
+from app.application.services.single_flight import SingleFlight
 from app.core.exceptions import (
+    ApiError,
     IdempotencyConflictError,
     IdempotencyInProgressError,
     IdempotencyKeyRequiredError,
@@ -18,8 +20,19 @@ IDEMPOTENCY_KEY_PATTERN = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._:-]{7,127}$')
 
 
 class IdempotencyService:
-    def __init__(self, repository: IdempotencyRepositoryPort) -> None:
+    """Executa efeitos no maximo uma vez por `Idempotency-Key`.
+
+    Duplicatas concorrentes no mesmo processo (mesma chave e mesmo payload) aguardam a execucao
+    em andamento e recebem o resultado como replay, sem consultar o repositorio.
+    """
+
+    def __init__(
+        self,
+        repository: IdempotencyRepositoryPort,
+        single_flight: SingleFlight[dict[str, Any]] | None = None,
+    ) -> None:
         self.repository = repository
+        self.single_flight = single_flight or SingleFlight('idempotency')
 
     async def execute(
         self,
@@ -33,6 +46,26 @@ class IdempotencyService:
             raise IdempotencyKeyRequiredError()
 
         fingerprint = self._fingerprint(operation, payload)
+        flight_key = f'{fingerprint}:{key}'
+        leader = not self.single_flight.pending(flight_key)
+        try:
+            result = await self.single_flight.do(
+                flight_key, lambda: self._execute_once(key, operation, fingerprint, action)
+            )
+        except Exception as exc:
+            if leader or isinstance(exc, ApiError):
+                raise
+            # O desfecho da execucao original ficou incerto, como veria uma requisicao separada.
+            raise IdempotencyInProgressError() from exc
+        return result if leader else {**result, 'replayed': True}
+
+    async def _execute_once(
+        self,
+        key: str,
+        operation: str,
+        fingerprint: str,
+        action: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
         created, record = await self.repository.reserve(
             IdempotencyRecord(
                 key=key,
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from app.core.observability import metrics_registry
+
+if TYPE_CHECKING:
+    from app.application.use_cases.iot.ingest_telemetry_use_case import IngestTelemetryUseCase
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """Publica em background os eventos outbox que ficaram pendentes no caminho da requisicao."""
+
+    def __init__(
+        self,
+        ingest_use_case: IngestTelemetryUseCase,
+        *,
+        batch_size: int = 100,
+        interval_seconds: float = 1.0,
+    ) -> None:
+        self.ingest_use_case = ingest_use_case
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name='outbox-relay')
+
+    async def stop(self, timeout_seconds: float = 5.0) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout=timeout_seconds)
+        except TimeoutError:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    async def run_once(self) -> int:
+        try:
+            published = await self.ingest_use_case.reconcile_pending(self.batch_size)
+        except Exception:
+            metrics_registry.increment_counter('outbox_relay_errors_total')
+            logger.exception(
+                'telemetry.outbox.relay.failed',
+                extra={'event': 'telemetry.outbox.relay.failed'},
+            )
+            return 0
+        metrics_registry.increment_counter('outbox_relay_published_total', published)
+        return published
+
+    async def _run(self) -> None:
+        try:
+            await self.ingest_use_case.relational_repo.requeue_claimed_outbox()
+        except Exception:
+            logger.exception(
+                'telemetry.outbox.relay.failed',
+                extra={'event': 'telemetry.outbox.relay.failed'},
+            )
+
+        while not self._stopping.is_set():
+            published = await self.run_once()
+            if published >= self.batch_size:
+                continue
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval_seconds)
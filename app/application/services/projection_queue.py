@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+
+from app.core.observability import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+ProjectionJob = Callable[[], Awaitable[object]]
+
+
+class ProjectionQueue:
+    """Fila limitada em memoria que executa projecoes fora do caminho da requisicao."""
+
+    def __init__(self, name: str, *, maxsize: int = 1_000, workers: int = 4) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.workers = workers
+        self._queue: asyncio.Queue[tuple[float, ProjectionJob]] | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._accepting = False
+
+    @property
+    def running(self) -> bool:
+        return self._accepting
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self) -> None:
+        if self._accepting:
+            return
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._tasks = [
+            asyncio.create_task(self._worker(self._queue), name=f'projection-{self.name}-{index}')
+            for index in range(self.workers)
+        ]
+        self._accepting = True
+        metrics_registry.set_gauge(
+            'projection_queue_capacity', self.maxsize, labels={'queue': self.name}
+        )
+        self._publish_depth()
+
+    def submit(self, job: ProjectionJob) -> bool:
+        """Enfileira o job; retorna False quando a fila esta parada ou cheia."""
+        if not self._accepting or self._queue is None:
+            return False
+        try:
+            self._queue.put_nowait((time.perf_counter(), job))
+        except asyncio.QueueFull:
+            metrics_registry.increment_counter(
+                'projection_queue_rejected_total', labels={'queue': self.name}
+            )
+            return False
+        metrics_registry.increment_counter(
+            'projection_queue_enqueued_total', labels={'queue': self.name}
+        )
+        self._publish_depth()
+        return True
+
+    async def stop(self, timeout_seconds: float = 10.0) -> None:
+        if self._queue is None:
+            return
+        self._accepting = False
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout_seconds)
+        except TimeoutError:
+            logger.warning(
+                'projection.queue.drain.timeout',
+                extra={'event': 'projection.queue.drain.timeout', 'operation': self.name},
+            )
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        self._queue = None
+        self._publish_depth()
+
+    async def _worker(self, queue: asyncio.Queue[tuple[float, ProjectionJob]]) -> None:
+        while True:
+            enqueued_at, job = await queue.get()
+            metrics_registry.set_gauge(
+                'projection_queue_wait_seconds',
+                time.perf_counter() - enqueued_at,
+                labels={'queue': self.name},
+            )
+            try:
+                await job()
+            except Exception:
+                metrics_registry.increment_counter(
+                    'projection_queue_failed_total', labels={'queue': self.name}
+                )
+                logger.exception(
+                    'projection.queue.job.failed',
+                    extra={'event': 'projection.queue.job.failed', 'operation': self.name},
+                )
+            else:
+                metrics_registry.increment_counter(
+                    'projection_queue_processed_total', labels={'queue': self.name}
+                )
+            finally:
+                queue.task_done()
+                self._publish_depth()
+
+    def _publish_depth(self) -> None:
+        metrics_registry.set_gauge(
+            'projection_queue_depth', self.depth, labels={'queue': self.name}
+        )
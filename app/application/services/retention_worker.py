@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from datetime import datetime, timedelta
+
+from app.core.observability import metrics_registry
+from app.domain.entities.models import utc_now
+from app.domain.ports.interfaces import RelationalTelemetryRepositoryPort
+
+logger = logging.getLogger(__name__)
+
+
+class RetentionWorker:
+    """Expurga outbox publicado e idempotencia vencida e arquiva telemetria antiga em lotes."""
+
+    def __init__(
+        self,
+        relational_repo: RelationalTelemetryRepositoryPort,
+        *,
+        outbox_retention_hours: float = 72,
+        telemetry_retention_days: float = 365,
+        batch_size: int = 1_000,
+        max_batches_per_run: int = 50,
+        interval_seconds: float = 3_600,
+    ) -> None:
+        self.relational_repo = relational_repo
+        self.outbox_retention = timedelta(hours=outbox_retention_hours)
+        self.telemetry_retention = timedelta(days=telemetry_retention_days)
+        self.batch_size = batch_size
+        self.max_batches_per_run = max_batches_per_run
+        self.interval_seconds = interval_seconds
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name='retention-worker')
+
+    async def stop(self, timeout_seconds: float = 5.0) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout=timeout_seconds)
+        except TimeoutError:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    async def run_once(self, now: datetime | None = None) -> dict[str, int]:
+        now = now or utc_now()
+        return {
+            'outbox': await self._drain(
+                'outbox', self.relational_repo.purge_published_outbox, now - self.outbox_retention
+            ),
+            'telemetry': await self._drain(
+                'telemetry', self.relational_repo.archive_telemetry, now - self.telemetry_retention
+            ),
+            # A retencao varia por operacao; o repositorio calcula o corte de cada uma.
+            'idempotency': await self._drain(
+                'idempotency', self.relational_repo.purge_expired_idempotency, now
+            ),
+        }
+
+    async def _drain(
+        self,
+        table: str,
+        step: Callable[[datetime, int], Awaitable[int]],
+        cutoff: datetime,
+    ) -> int:
+        """Executa lotes em transacoes separadas ate esvaziar ou atingir o teto da rodada."""
+        total = 0
+        try:
+            for _ in range(self.max_batches_per_run):
+                if self._stopping.is_set():
+                    break
+                removed = await step(cutoff, self.batch_size)
+                total += removed
+                if removed < self.batch_size:
+                    break
+                await asyncio.sleep(0)
+        except Exception:
+            metrics_registry.increment_counter('retention_errors_total', labels={'table': table})
+            logger.exception(
+                'retention.run.failed',
+                extra={'event': 'retention.run.failed', 'operation': table},
+            )
+        metrics_registry.set_gauge('retention_last_run_rows', total, labels={'table': table})
+        metrics_registry.increment_counter('retention_rows_total', total, labels={'table': table})
+        return total
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            await self.run_once()
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval_seconds)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any, Generic, TypeVar
+
+from app.core.observability import metrics_registry
+
+T = TypeVar('T')
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce cargas concorrentes da mesma chave em uma unica execucao."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._inflight: dict[str, asyncio.Task[T]] = {}
+
+    def pending(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: str, loader: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Executa `loader` ou aguarda a execucao ja em andamento para `key`.
+
+        Todos os chamadores recebem o mesmo resultado ou a mesma excecao. O cancelamento de um
+        chamador nao cancela a carga compartilhada.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(loader(), name=f'single-flight-{self.name}')
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+            metrics_registry.increment_counter(
+                'single_flight_loads_total', labels={'group': self.name}
+            )
+        else:
+            metrics_registry.increment_counter(
+                'single_flight_shared_total', labels={'group': self.name}
+            )
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task[T]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Marca a excecao como observada quando nenhum chamador sobrou para recebe-la.
+            task.exception()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import logging
+from datetime import UTC, datetime
+from typing import Any
+
+from app.core.exceptions import TransientIntegrationError
+from app.core.observability import metrics_registry
+from app.domain.entities.models import TelemetryReading
+from app.domain.ports.interfaces import CachePort
+
+logger = logging.getLogger(__name__)
+
+ALL_DEVICES = '*'
+
+
+class TelemetryQueryCache:
+    """Cache read-through de `GET /telemetry` guardando as `window` leituras mais recentes.
+
+    Cada consulta normalizada (`device_id` ou todos os dispositivos) vira uma chave no
+    `CachePort`; qualquer `limit <= window` e servido fatiando a mesma janela. A ingestao
+    acrescenta as novas leituras nas janelas ja existentes, entao o proximo poll nao vai ao SQL.
+    """
+
+    def __init__(self, cache: CachePort, *, window: int = 200, ttl_seconds: int = 30) -> None:
+        self.cache = cache
+        self.window = window
+        self.ttl_seconds = ttl_seconds
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key(device_id: str | None) -> str:
+        return f'telemetry:recent:{device_id or ALL_DEVICES}'
+
+    async def get(self, limit: int, device_id: str | None) -> list[TelemetryReading] | None:
+        if limit > self.window:
+            return None
+        entry = await self.cache.get(self.key(device_id)) or {}
+        items = entry.get('items')
+        if not isinstance(items, list) or (len(items) < limit and not entry.get('complete')):
+            self._record(hit=False)
+            return None
+        self._record(hit=True)
+        return [_decode(item) for item in items[:limit]]
+
+    async def fill(self, device_id: str | None, readings: list[TelemetryReading]) -> None:
+        """Grava a janela consultada com `limit=window` no SQL."""
+        entry = {
+            'items': [_encode(reading) for reading in readings[: self.window]],
+            'complete': len(readings) < self.window,
+        }
+        await self._store({self.key(device_id): entry})
+
+    async def append(self, readings: list[TelemetryReading]) -> None:
+        """Acrescenta leituras recem-gravadas nas janelas em cache dos dispositivos afetados."""
+        if not readings:
+            return
+        by_key: dict[str, list[TelemetryReading]] = {self.key(None): list(readings)}
+        for reading in readings:
+            by_key.setdefault(self.key(reading.device_id), []).append(reading)
+        keys = list(by_key)
+        current = await self.cache.get_many(keys)
+        updates: dict[str, dict[str, Any]] = {}
+        for key, entry in zip(keys, current, strict=True):
+            if entry is None or not isinstance(entry.get('items'), list):
+                continue
+            merged = [_encode(reading) for reading in by_key[key]] + entry['items']
+            merged.sort(key=lambda item: _captured_at(item['captured_at']), reverse=True)
+            updates[key] = {
+                'items': merged[: self.window],
+                'complete': bool(entry.get('complete')) and len(merged) <= self.window,
+            }
+        await self._store(updates)
+
+    async def _store(self, entries: dict[str, dict[str, Any]]) -> None:
+        if not entries:
+            return
+        try:
+            await self.cache.set_many(entries, ttl_seconds=self.ttl_seconds)
+        except TransientIntegrationError:
+            logger.warning('Falha transitória ao atualizar cache de consultas de telemetria.')
+
+    def _record(self, *, hit: bool) -> None:
+        if hit:
+            self._hits += 1
+            metrics_registry.increment_counter('telemetry_query_cache_hits_total')
+        else:
+            self._misses += 1
+            metrics_registry.increment_counter('telemetry_query_cache_misses_total')
+        metrics_registry.set_gauge(
+            'telemetry_query_cache_hit_ratio', self._hits / (self._hits + self._misses)
+        )
+
+
+def _encode(reading: TelemetryReading) -> dict[str, Any]:
+    return {
+        'device_id': reading.device_id,
+        'moisture': reading.moisture,
+        'temperature': reading.temperature,
+        'ph': reading.ph,
+        'captured_at': reading.captured_at.isoformat(),
+        'metadata': reading.metadata,
+    }
+
+
+def _captured_at(value: str | datetime) -> datetime:
+    parsed = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def _decode(item: dict[str, Any]) -> TelemetryReading:
+    return TelemetryReading(
+        device_id=item['device_id'],
+        moisture=item['moisture'],
+        temperature=item['temperature'],
+        ph=item['ph'],
+        captured_at=_captured_at(item['captured_at']),
+        metadata=item.get('metadata') or {},
+    )
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from collections import OrderedDict
+from datetime import UTC, datetime
+from typing import Any
+
+from app.core.observability import metrics_registry
+from app.domain.entities.models import TelemetryReading
+
+
+class DeviceRing:
+    """Ultimas `capacity` leituras de um dispositivo em colunas `array('d')` pre-alocadas."""
+
+    __slots__ = (
+        'capacity',
+        'complete',
+        'device_id',
+        'head',
+        'metadata',
+        'moisture',
+        'ph',
+        'size',
+        'temperature',
+        'timestamp',
+    )
+
+    def __init__(self, device_id: str, capacity: int) -> None:
+        self.device_id = device_id
+        self.capacity = capacity
+        self.moisture = array('d', bytes(8 * capacity))
+        self.temperature = array('d', bytes(8 * capacity))
+        self.ph = array('d', bytes(8 * capacity))
+        self.timestamp = array('d', bytes(8 * capacity))
+        self.metadata: list[dict[str, Any] | None] = [None] * capacity
+        self.head = 0
+        self.size = 0
+        # True quando o anel contem todo o historico conhecido do dispositivo.
+        self.complete = False
+
+    @property
+    def nbytes(self) -> int:
+        columns = self.moisture, self.temperature, self.ph, self.timestamp
+        return sum(column.itemsize * len(column) for column in columns) + sys.getsizeof(
+            self.metadata
+        )
+
+    def append(self, reading: TelemetryReading) -> None:
+        if self.size == self.capacity:
+            self.complete = False
+        else:
+            self.size += 1
+        index = self.head
+        self.moisture[index] = reading.moisture
+        self.temperature[index] = reading.temperature
+        self.ph[index] = reading.ph
+        self.timestamp[index] = reading.captured_at.timestamp()
+        self.metadata[index] = reading.metadata
+        self.head = (index + 1) % self.capacity
+
+    def newest(self, limit: int) -> list[TelemetryReading]:
+        count = min(limit, self.size)
+        return [self._reading((self.head - offset - 1) % self.capacity) for offset in range(count)]
+
+    def _reading(self, index: int) -> TelemetryReading:
+        return TelemetryReading(
+            device_id=self.device_id,
+            moisture=self.moisture[index],
+            temperature=self.temperature[index],
+            ph=self.ph[index],
+            captured_at=datetime.fromtimestamp(self.timestamp[index], UTC),
+            metadata=self.metadata[index] or {},
+        )
+
+
+class TelemetryRingBuffer:
+    """Buffer em processo das leituras recentes por dispositivo, com LRU de dispositivos.
+
+    O conteudo reflete apenas o que este processo ingeriu ou semeou a partir do SQL.
+    """
+
+    def __init__(self, *, capacity_per_device: int = 256, max_devices: int = 10_000) -> None:
+        self.capacity_per_device = capacity_per_device
+        self.max_devices = max_devices
+        self._rings: OrderedDict[str, DeviceRing] = OrderedDict()
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes das colunas e slots; todos os aneis tem a mesma capacidade."""
+        first = next(iter(self._rings.values()), None)
+        return first.nbytes * len(self._rings) if first is not None else 0
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+    def append(self, reading: TelemetryReading) -> None:
+        self._ring(reading.device_id).append(reading)
+
+    def extend(self, readings: list[TelemetryReading]) -> None:
+        for reading in readings:
+            self._ring(reading.device_id).append(reading)
+
+    def seed(self, device_id: str, newest_first: list[TelemetryReading], *, complete: bool) -> None:
+        """Carrega o historico vindo do SQL se o dispositivo ainda nao estiver no buffer."""
+        if device_id in self._rings:
+            return
+        ring = self._ring(device_id)
+        for reading in reversed(newest_first[: self.capacity_per_device]):
+            ring.append(reading)
+        ring.complete = complete and len(newest_first) <= self.capacity_per_device
+
+    def latest(self, device_id: str) -> TelemetryReading | None:
+        ring = self._rings.get(device_id)
+        if ring is None or ring.size == 0:
+            self._record('latest', hit=False)
+            return None
+        self._rings.move_to_end(device_id)
+        self._record('latest', hit=True)
+        return ring.newest(1)[0]
+
+    def recent(self, device_id: str, limit: int) -> list[TelemetryReading] | None:
+        """Ultimas `limit` leituras, ou None quando o buffer nao garante a resposta completa."""
+        ring = self._rings.get(device_id)
+        if ring is None or (ring.size < limit and not ring.complete):
+            self._record('recent', hit=False)
+            return None
+        self._rings.move_to_end(device_id)
+        self._record('recent', hit=True)
+        return ring.newest(limit)
+
+    def _ring(self, device_id: str) -> DeviceRing:
+        ring = self._rings.get(device_id)
+        if ring is not None:
+            self._rings.move_to_end(device_id)
+            return ring
+        ring = self._rings[device_id] = DeviceRing(device_id, self.capacity_per_device)
+        if len(self._rings) > self.max_devices:
+            self._rings.popitem(last=False)
+        self._publish_size()
+        return ring
+
+    def _publish_size(self) -> None:
+        metrics_registry.set_gauge('telemetry_ring_buffer_devices', len(self._rings))
+        metrics_registry.set_gauge('telemetry_ring_buffer_bytes', self.nbytes)
+
+    @staticmethod
+    def _record(read: str, *, hit: bool) -> None:
+        metrics_registry.increment_counter(
+            'telemetry_ring_buffer_hits_total' if hit else 'telemetry_ring_buffer_misses_total',
+            labels={'read': read},
+        )
@@ -1,17 +1,25 @@
+from app.application.use_cases.iot.aggregate_telemetry_use_case import AggregateTelemetryUseCase
 from app.application.use_cases.iot.dispatch_irrigation_command_use_case import (
     DispatchIrrigationCommandUseCase,
 )
+from app.application.use_cases.iot.export_telemetry_use_case import ExportTelemetryUseCase
 from app.application.use_cases.iot.get_cached_command_use_case import GetCachedCommandUseCase
 from app.application.use_cases.iot.get_cached_telemetry_use_case import GetCachedTelemetryUseCase
 from app.application.use_cases.iot.get_device_snapshot_use_case import GetDeviceSnapshotUseCase
 from app.application.use_cases.iot.ingest_telemetry_use_case import IngestTelemetryUseCase
+from app.application.use_cases.iot.list_telemetry_history_use_case import (
+    ListTelemetryHistoryUseCase,
+)
 from app.application.use_cases.iot.list_telemetry_use_case import ListTelemetryUseCase
 
 __all__ = [
+    'AggregateTelemetryUseCase',
     'DispatchIrrigationCommandUseCase',
+    'ExportTelemetryUseCase',
     'GetCachedCommandUseCase',
     'GetCachedTelemetryUseCase',
     'GetDeviceSnapshotUseCase',
     'IngestTelemetryUseCase',
+    'ListTelemetryHistoryUseCase',
     'ListTelemetryUseCase',
 ]
@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta
+
+from app.core.exceptions import InvalidTimeRangeError
+from app.domain.entities.models import TelemetryAggregate, TelemetryBucket, utc_now
+from app.domain.ports.interfaces import RelationalTelemetryRepositoryPort
+
+DEFAULT_AGGREGATE_BUCKETS = 288
+MAX_AGGREGATE_BUCKETS = 10_000
+
+
+class AggregateTelemetryUseCase:
+    def __init__(self, relational_repo: RelationalTelemetryRepositoryPort) -> None:
+        self.relational_repo = relational_repo
+
+    async def execute(
+        self,
+        device_id: str,
+        *,
+        bucket: TelemetryBucket,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> tuple[datetime, datetime, list[TelemetryAggregate]]:
+        """Resolve a janela padrao (288 buckets ate agora) e limita o total de buckets."""
+        until = until or utc_now()
+        since = since or until - timedelta(seconds=bucket.seconds * DEFAULT_AGGREGATE_BUCKETS)
+        if since >= until:
+            raise InvalidTimeRangeError()
+        if (until - since).total_seconds() / bucket.seconds > MAX_AGGREGATE_BUCKETS:
+            raise InvalidTimeRangeError(
+                f'O intervalo excede {MAX_AGGREGATE_BUCKETS} buckets de {bucket.value}.'
+            )
+        items = await self.relational_repo.aggregate(
+            device_id, bucket=bucket, since=since, until=until
+        )
+        return since, until, items
@@ -0,0 +1,78 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from app.core.exceptions import InvalidTimeRangeError
+from app.domain.entities.models import TelemetryExportFormat, TelemetryReading
+from app.domain.ports.interfaces import RelationalTelemetryRepositoryPort
+
+CSV_COLUMNS = ('device_id', 'captured_at', 'moisture', 'temperature', 'ph', 'metadata')
+
+
+class ExportTelemetryUseCase:
+    """Exporta o historico em blocos de texto sem materializar o intervalo em memoria."""
+
+    def __init__(
+        self, relational_repo: RelationalTelemetryRepositoryPort, *, rows_per_chunk: int = 1_000
+    ) -> None:
+        self.relational_repo = relational_repo
+        self.rows_per_chunk = rows_per_chunk
+
+    def execute(
+        self,
+        export_format: TelemetryExportFormat,
+        *,
+        device_id: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[bytes]:
+        if since is not None and until is not None and since >= until:
+            raise InvalidTimeRangeError()
+        readings = self.relational_repo.stream_readings(
+            device_id, since=since, until=until, batch_size=self.rows_per_chunk
+        )
+        if export_format is TelemetryExportFormat.CSV:
+            return self._csv_chunks(readings)
+        return self._ndjson_chunks(readings)
+
+    async def _ndjson_chunks(
+        self, readings: AsyncIterator[TelemetryReading]
+    ) -> AsyncIterator[bytes]:
+        lines: list[str] = []
+        async for reading in readings:
+            lines.append(json.dumps(self._row(reading), separators=(',', ':')))
+            if len(lines) >= self.rows_per_chunk:
+                yield ('\n'.join(lines) + '\n').encode()
+                lines = []
+        if lines:
+            yield ('\n'.join(lines) + '\n').encode()
+
+    async def _csv_chunks(self, readings: AsyncIterator[TelemetryReading]) -> AsyncIterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(CSV_COLUMNS)
+        rows = 0
+        async for reading in readings:
+            row = self._row(reading)
+            row['metadata'] = json.dumps(row['metadata'], separators=(',', ':'))
+            writer.writerow([row[column] for column in CSV_COLUMNS])
+            rows += 1
+            if rows % self.rows_per_chunk == 0:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    @staticmethod
+    def _row(reading: TelemetryReading) -> dict[str, object]:
+        return {
+            'device_id': reading.device_id,
+            'captured_at': reading.captured_at.isoformat(),
+            'moisture': reading.moisture,
+            'temperature': reading.temperature,
+            'ph': reading.ph,
+            'metadata': reading.metadata,
+        }
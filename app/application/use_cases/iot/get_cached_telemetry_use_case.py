@@ -1,11 +1,110 @@
+import asyncio
+import logging
+import math
+import random
+import time
+from collections.abc import Callable
+from dataclasses import asdict
 from typing import Any
 
-from app.domain.ports.interfaces import CachePort
+from app.application.services.single_flight import SingleFlight
+from app.application.services.telemetry_ring_buffer import TelemetryRingBuffer
+from app.application.use_cases.iot.ingest_telemetry_use_case import LATEST_TELEMETRY_TTL_SECONDS
+from app.core.exceptions import TransientIntegrationError
+from app.core.observability import metrics_registry
+from app.domain.ports.interfaces import CachePort, RelationalTelemetryRepositoryPort
+
+logger = logging.getLogger(__name__)
 
 
 class GetCachedTelemetryUseCase:
-    def __init__(self, cache: CachePort) -> None:
+    """Ultima leitura do dispositivo: ring buffer, cache e, na falta, o relacional.
+
+    Com `relational_repo`, faltas concorrentes da mesma chave compartilham uma unica consulta
+    (single-flight) e as chaves carregadas aqui sao renovadas antes de expirar com a regra
+    probabilistica XFetch: `agora - custo * beta * ln(U) >= expiracao`.
+    """
+
+    MAX_TRACKED_KEYS = 10_000
+
+    def __init__(
+        self,
+        cache: CachePort,
+        ring_buffer: TelemetryRingBuffer | None = None,
+        relational_repo: RelationalTelemetryRepositoryPort | None = None,
+        single_flight: SingleFlight[dict[str, Any] | None] | None = None,
+        ttl_seconds: int = LATEST_TELEMETRY_TTL_SECONDS,
+        early_refresh_beta: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self.cache = cache
+        self.ring_buffer = ring_buffer
+        self.relational_repo = relational_repo
+        self.single_flight = single_flight or SingleFlight('telemetry_latest')
+        self.ttl_seconds = ttl_seconds
+        self.early_refresh_beta = early_refresh_beta
+        self._clock = clock
+        self._expiry: dict[str, tuple[float, float]] = {}
+        self._refreshes: set[asyncio.Task[dict[str, Any] | None]] = set()
 
     async def execute(self, device_id: str) -> dict[str, Any] | None:
-        return await self.cache.get(f'telemetry:{device_id}')
+        if self.ring_buffer is not None:
+            reading = self.ring_buffer.latest(device_id)
+            if reading is not None:
+                return asdict(reading)
+        key = f'telemetry:{device_id}'
+        cached = await self.cache.get(key)
+        repository = self.relational_repo
+        if repository is None:
+            return cached
+        if cached is not None:
+            if self._should_refresh_early(key):
+                self._schedule_refresh(repository, key, device_id)
+            return cached
+        return await self.single_flight.do(key, lambda: self._load(repository, key, device_id))
+
+    def _should_refresh_early(self, key: str) -> bool:
+        tracked = self._expiry.get(key)
+        if tracked is None or self.early_refresh_beta <= 0:
+            return False
+        expires_at, load_seconds = tracked
+        # 1 - random() fica em (0, 1], evitando log(0).
+        jitter = -load_seconds * self.early_refresh_beta * math.log(1.0 - random.random())
+        return self._clock() + jitter >= expires_at
+
+    def _schedule_refresh(
+        self, repository: RelationalTelemetryRepositoryPort, key: str, device_id: str
+    ) -> None:
+        if self.single_flight.pending(key):
+            return
+        metrics_registry.increment_counter('telemetry_latest_early_refresh_total')
+        task = asyncio.create_task(
+            self.single_flight.do(key, lambda: self._load(repository, key, device_id))
+        )
+        self._refreshes.add(task)
+        task.add_done_callback(self._refresh_done)
+
+    def _refresh_done(self, task: asyncio.Task[dict[str, Any] | None]) -> None:
+        self._refreshes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning('Falha ao renovar antecipadamente a ultima telemetria.')
+
+    async def _load(
+        self, repository: RelationalTelemetryRepositoryPort, key: str, device_id: str
+    ) -> dict[str, Any] | None:
+        started = self._clock()
+        items = await repository.list_recent(limit=1, device_id=device_id)
+        metrics_registry.increment_counter('telemetry_latest_backend_loads_total')
+        if not items:
+            return None
+        value = asdict(items[0])
+        try:
+            await self.cache.set(key, value, ttl_seconds=self.ttl_seconds)
+        except TransientIntegrationError:
+            logger.warning('Falha transitória ao atualizar cache de telemetria.')
+        finished = self._clock()
+        self._expiry.pop(key, None)
+        if len(self._expiry) >= self.MAX_TRACKED_KEYS:
+            del self._expiry[next(iter(self._expiry))]
+        self._expiry[key] = (finished + self.ttl_seconds, finished - started)
+        return value
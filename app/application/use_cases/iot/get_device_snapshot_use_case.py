@@ -1,13 +1,80 @@
+import asyncio
+import logging
+from dataclasses import asdict
 from typing import Any
 
-from app.domain.ports.interfaces import CachePort
+from app.application.services.telemetry_ring_buffer import TelemetryRingBuffer
+from app.core.exceptions import InfrastructureError
+from app.core.observability import metrics_registry
+from app.domain.ports.interfaces import CachePort, RelationalTelemetryRepositoryPort
+
+logger = logging.getLogger(__name__)
 
 
 class GetDeviceSnapshotUseCase:
-    def __init__(self, cache: CachePort) -> None:
+    def __init__(
+        self,
+        cache: CachePort,
+        ring_buffer: TelemetryRingBuffer | None = None,
+        relational_repo: RelationalTelemetryRepositoryPort | None = None,
+        fallback_concurrency: int = 8,
+    ) -> None:
         self.cache = cache
+        self.ring_buffer = ring_buffer
+        self.relational_repo = relational_repo
+        self.fallback_concurrency = fallback_concurrency
 
     async def execute(self, device_id: str) -> dict[str, Any]:
-        telemetry = await self.cache.get(f'telemetry:{device_id}')
-        command = await self.cache.get(f'command:{device_id}')
-        return {'device_id': device_id, 'telemetry': telemetry, 'command': command}
+        return (await self.execute_many([device_id]))[0]
+
+    async def execute_many(self, device_ids: list[str]) -> list[dict[str, Any]]:
+        """Monta os snapshots com uma unica leitura em lote no cache.
+
+        A telemetria ausente no cache e buscada no relacional com no maximo
+        `fallback_concurrency` consultas simultaneas.
+        """
+        unique_ids = list(dict.fromkeys(device_ids))
+        telemetry: dict[str, dict[str, Any] | None] = {}
+        if self.ring_buffer is not None:
+            for device_id in unique_ids:
+                reading = self.ring_buffer.latest(device_id)
+                if reading is not None:
+                    telemetry[device_id] = asdict(reading)
+
+        keys = [f'telemetry:{device_id}' for device_id in unique_ids if device_id not in telemetry]
+        keys.extend(f'command:{device_id}' for device_id in unique_ids)
+        cached = dict(zip(keys, await self.cache.get_many(keys), strict=True))
+        for device_id in unique_ids:
+            if device_id not in telemetry:
+                telemetry[device_id] = cached.get(f'telemetry:{device_id}')
+
+        misses = [device_id for device_id in unique_ids if telemetry[device_id] is None]
+        if misses and self.relational_repo is not None:
+            telemetry.update(await self._load_latest(self.relational_repo, misses))
+
+        return [
+            {
+                'device_id': device_id,
+                'telemetry': telemetry[device_id],
+                'command': cached[f'command:{device_id}'],
+            }
+            for device_id in device_ids
+        ]
+
+    async def _load_latest(
+        self, repository: RelationalTelemetryRepositoryPort, device_ids: list[str]
+    ) -> dict[str, dict[str, Any] | None]:
+        semaphore = asyncio.Semaphore(self.fallback_concurrency)
+
+        async def load(device_id: str) -> dict[str, Any] | None:
+            async with semaphore:
+                try:
+                    items = await repository.list_recent(limit=1, device_id=device_id)
+                except InfrastructureError:
+                    logger.warning('Falha ao buscar telemetria no relacional para o snapshot.')
+                    return None
+            return asdict(items[0]) if items else None
+
+        metrics_registry.increment_counter('device_snapshot_fallback_total', len(device_ids))
+        loaded = await asyncio.gather(*(load(device_id) for device_id in device_ids))
+        return dict(zip(device_ids, loaded, strict=True))
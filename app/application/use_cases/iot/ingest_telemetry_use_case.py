@@ -1,9 +1,15 @@
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from dataclasses import asdict
 from datetime import datetime
+from typing import cast
 
+from app.application.services.projection_queue import ProjectionQueue
+from app.application.services.telemetry_query_cache import TelemetryQueryCache
+from app.application.services.telemetry_ring_buffer import TelemetryRingBuffer
 from app.core.exceptions import TransientIntegrationError
-from app.domain.entities.models import TelemetryReading
+from app.domain.entities.models import OutboxEvent, OutboxState, TelemetryReading
 from app.domain.ports.interfaces import (
     CachePort,
     DocumentTelemetryRepositoryPort,
@@ -13,6 +19,8 @@ from app.domain.ports.interfaces import (
 
 logger = logging.getLogger(__name__)
 
+LATEST_TELEMETRY_TTL_SECONDS = 600
+
 
 class IngestTelemetryUseCase:
     def __init__(
@@ -21,15 +29,72 @@ class IngestTelemetryUseCase:
         cache: CachePort,
         relational_repo: RelationalTelemetryRepositoryPort,
         document_repo: DocumentTelemetryRepositoryPort,
+        projection_queue: ProjectionQueue | None = None,
+        concurrent_fan_out: bool = False,
+        ring_buffer: TelemetryRingBuffer | None = None,
+        query_cache: TelemetryQueryCache | None = None,
     ) -> None:
         self.telemetry_publisher = telemetry_publisher
         self.cache = cache
         self.relational_repo = relational_repo
         self.document_repo = document_repo
+        self.projection_queue = projection_queue
+        self.concurrent_fan_out = concurrent_fan_out
+        self.ring_buffer = ring_buffer
+        self.query_cache = query_cache
 
     async def execute(self, reading: TelemetryReading) -> None:
         outbox_event_id = await self.relational_repo.save_with_outbox(reading)
+        if self.ring_buffer is not None:
+            self.ring_buffer.append(reading)
+        if self.projection_queue is not None and self.projection_queue.submit(
+            lambda: self._project(reading, outbox_event_id)
+        ):
+            return
+        await self._project(reading, outbox_event_id)
+
+    async def execute_many(self, readings: list[TelemetryReading]) -> list[OutboxState]:
+        outbox_event_ids = await self.relational_repo.save_many_with_outbox(readings)
+        if self.ring_buffer is not None:
+            self.ring_buffer.extend(readings)
+        if self.projection_queue is not None and self.projection_queue.submit(
+            lambda: self._project_many(readings, outbox_event_ids)
+        ):
+            return [OutboxState.PENDING] * len(readings)
+        return await self._project_many(readings, outbox_event_ids)
+
+    async def _project(self, reading: TelemetryReading, outbox_event_id: str) -> None:
+        await self._fan_out(
+            lambda: self._save_document(reading),
+            lambda: self._publish(reading, outbox_event_id),
+            lambda: self._cache_latest([reading]),
+        )
+
+    async def _project_many(
+        self, readings: list[TelemetryReading], outbox_event_ids: list[str]
+    ) -> list[OutboxState]:
+        results = await self._fan_out(
+            lambda: self._save_documents(readings),
+            lambda: self._publish_many(readings, outbox_event_ids),
+            lambda: self._cache_latest(readings),
+        )
+        return cast(list[OutboxState], results[1])
 
+    async def _fan_out(self, *branches: Callable[[], Awaitable[object]]) -> list[object]:
+        """Executa as projecoes independentes, em sequencia ou concorrentes.
+
+        Cada ramo trata as proprias falhas esperadas; no modo concorrente um erro inesperado
+        so propaga depois que todos os ramos terminam.
+        """
+        if not self.concurrent_fan_out:
+            return [await branch() for branch in branches]
+        results = await asyncio.gather(*(branch() for branch in branches), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    async def _save_document(self, reading: TelemetryReading) -> None:
         try:
             await self.document_repo.save(reading)
         except Exception:
@@ -38,6 +103,16 @@ class IngestTelemetryUseCase:
                 extra={'event': 'telemetry.document_projection.failed'},
             )
 
+    async def _save_documents(self, readings: list[TelemetryReading]) -> None:
+        try:
+            await self.document_repo.save_many(readings)
+        except Exception:
+            logger.exception(
+                'telemetry.document_projection.failed',
+                extra={'event': 'telemetry.document_projection.failed'},
+            )
+
+    async def _publish(self, reading: TelemetryReading, outbox_event_id: str) -> None:
         try:
             await self.telemetry_publisher.publish_telemetry(reading)
         except TransientIntegrationError:
@@ -45,27 +120,71 @@ class IngestTelemetryUseCase:
         else:
             await self.relational_repo.mark_outbox_published(outbox_event_id)
 
+    async def _publish_many(
+        self, readings: list[TelemetryReading], outbox_event_ids: list[str]
+    ) -> list[OutboxState]:
         try:
-            await self.cache.set(f'telemetry:{reading.device_id}', asdict(reading), ttl_seconds=600)
+            delivered = await self.telemetry_publisher.publish_telemetry_batch(readings)
         except TransientIntegrationError:
-            logger.warning('Falha transitória ao atualizar cache de telemetria.')
+            logger.warning('Falha transitória ao publicar lote; persistência local mantida.')
+            return [OutboxState.PENDING] * len(readings)
+        published_ids = [
+            event_id for event_id, ok in zip(outbox_event_ids, delivered, strict=True) if ok
+        ]
+        await self.relational_repo.mark_outbox_published_many(published_ids)
+        return [OutboxState.PUBLISHED if ok else OutboxState.PENDING for ok in delivered]
 
-    async def reconcile_pending(self, limit: int = 100) -> int:
-        published = 0
-        for event in await self.relational_repo.list_pending_outbox(limit):
-            payload = dict(event.payload)
-            captured_at = payload.get('captured_at')
-            if isinstance(captured_at, str):
-                payload['captured_at'] = datetime.fromisoformat(captured_at)
-            reading = TelemetryReading(**payload)
+    async def _cache_latest(self, readings: list[TelemetryReading]) -> None:
+        latest: dict[str, TelemetryReading] = {}
+        for reading in readings:
+            current = latest.get(reading.device_id)
+            if current is None or reading.captured_at >= current.captured_at:
+                latest[reading.device_id] = reading
+        for reading in latest.values():
             try:
-                await self.telemetry_publisher.publish_telemetry(reading)
-            except TransientIntegrationError:
-                logger.warning(
-                    'telemetry.outbox.retry.failed',
-                    extra={'event': 'telemetry.outbox.retry.failed'},
+                await self.cache.set(
+                    f'telemetry:{reading.device_id}',
+                    asdict(reading),
+                    ttl_seconds=LATEST_TELEMETRY_TTL_SECONDS,
                 )
-                continue
-            await self.relational_repo.mark_outbox_published(event.event_id)
-            published += 1
-        return published
+            except TransientIntegrationError:
+                logger.warning('Falha transitória ao atualizar cache de telemetria.')
+        if self.query_cache is not None:
+            await self.query_cache.append(readings)
+
+    async def reconcile_pending(self, limit: int = 100) -> int:
+        events = await self.relational_repo.claim_pending_outbox(limit)
+        if not events:
+            return 0
+
+        event_ids = [event.event_id for event in events]
+        try:
+            delivered = await self.telemetry_publisher.publish_telemetry_batch(
+                [self._reading_from_outbox(event) for event in events]
+            )
+        except TransientIntegrationError:
+            logger.warning(
+                'telemetry.outbox.retry.failed',
+                extra={'event': 'telemetry.outbox.retry.failed'},
+            )
+            await self.relational_repo.release_outbox(event_ids)
+            return 0
+
+        published = [event_id for event_id, ok in zip(event_ids, delivered, strict=True) if ok]
+        failed = [event_id for event_id, ok in zip(event_ids, delivered, strict=True) if not ok]
+        await self.relational_repo.mark_outbox_published_many(published)
+        if failed:
+            logger.warning(
+                'telemetry.outbox.retry.failed',
+                extra={'event': 'telemetry.outbox.retry.failed'},
+            )
+            await self.relational_repo.release_outbox(failed)
+        return len(published)
+
+    @staticmethod
+    def _reading_from_outbox(event: OutboxEvent) -> TelemetryReading:
+        payload = dict(event.payload)
+        captured_at = payload.get('captured_at')
+        if isinstance(captured_at, str):
+            payload['captured_at'] = datetime.fromisoformat(captured_at)
+        return TelemetryReading(**payload)
@@ -0,0 +1,54 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from app.core.exceptions import InvalidCursorError, InvalidTimeRangeError
+from app.domain.entities.models import TelemetryCursor, TelemetryReading
+from app.domain.ports.interfaces import RelationalTelemetryRepositoryPort
+
+
+def encode_cursor(cursor: TelemetryCursor) -> str:
+    raw = json.dumps({'t': cursor.captured_at.isoformat(), 'id': cursor.reading_id})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token: str) -> TelemetryCursor:
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        payload = json.loads(raw)
+        captured_at = datetime.fromisoformat(payload['t'])
+        reading_id = payload['id']
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursorError() from exc
+    if not isinstance(reading_id, int) or captured_at.tzinfo is None:
+        raise InvalidCursorError()
+    return TelemetryCursor(captured_at, reading_id)
+
+
+class ListTelemetryHistoryUseCase:
+    """Historico paginado por keyset: o custo de cada pagina independe da profundidade."""
+
+    def __init__(self, relational_repo: RelationalTelemetryRepositoryPort) -> None:
+        self.relational_repo = relational_repo
+
+    async def execute(
+        self,
+        device_id: str,
+        *,
+        limit: int = 100,
+        cursor: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> tuple[list[TelemetryReading], str | None]:
+        if since is not None and until is not None and since >= until:
+            raise InvalidTimeRangeError()
+        page = await self.relational_repo.list_page(
+            device_id,
+            limit=limit,
+            since=since,
+            until=until,
+            after=decode_cursor(cursor) if cursor else None,
+        )
+        next_cursor = encode_cursor(page.next_cursor) if page.next_cursor else None
+        return page.items, next_cursor
@@ -1,12 +1,41 @@
+from app.application.services.telemetry_query_cache import TelemetryQueryCache
+from app.application.services.telemetry_ring_buffer import TelemetryRingBuffer
 from app.domain.entities.models import TelemetryReading
 from app.domain.ports.interfaces import RelationalTelemetryRepositoryPort
 
 
 class ListTelemetryUseCase:
-    def __init__(self, relational_repo: RelationalTelemetryRepositoryPort) -> None:
+    def __init__(
+        self,
+        relational_repo: RelationalTelemetryRepositoryPort,
+        ring_buffer: TelemetryRingBuffer | None = None,
+        query_cache: TelemetryQueryCache | None = None,
+    ) -> None:
         self.relational_repo = relational_repo
+        self.ring_buffer = ring_buffer
+        self.query_cache = query_cache
 
     async def execute(
         self, limit: int = 20, device_id: str | None = None
     ) -> list[TelemetryReading]:
-        return await self.relational_repo.list_recent(limit=limit, device_id=device_id)
+        if self.ring_buffer is not None and device_id:
+            buffered = self.ring_buffer.recent(device_id, limit)
+            if buffered is not None:
+                return buffered
+
+        query_cache = self.query_cache
+        if query_cache is not None and limit > query_cache.window:
+            query_cache = None
+        fetch_limit = limit
+        if query_cache is not None:
+            cached = await query_cache.get(limit, device_id)
+            if cached is not None:
+                return cached
+            fetch_limit = query_cache.window
+
+        items = await self.relational_repo.list_recent(limit=fetch_limit, device_id=device_id)
+        if query_cache is not None:
+            await query_cache.fill(device_id, items)
+        if self.ring_buffer is not None and device_id:
+            self.ring_buffer.seed(device_id, items, complete=len(items) < fetch_limit)
+        return items[:limit]
@@ -3,21 +3,34 @@ from functools import lru_cache
 
 from app.application.services.coverage_service import CoverageService
 from app.application.services.idempotency_service import IdempotencyService
+from app.application.services.outbox_relay import OutboxRelay
+from app.application.services.projection_queue import ProjectionQueue
+from app.application.services.retention_worker import RetentionWorker
+from app.application.services.telemetry_query_cache import TelemetryQueryCache
+from app.application.services.telemetry_ring_buffer import TelemetryRingBuffer
 from app.application.use_cases.governance.register_ledger_record_use_case import (
     RegisterLedgerRecordUseCase,
 )
+from app.application.use_cases.iot.aggregate_telemetry_use_case import AggregateTelemetryUseCase
 from app.application.use_cases.iot.dispatch_irrigation_command_use_case import (
     DispatchIrrigationCommandUseCase,
 )
+from app.application.use_cases.iot.export_telemetry_use_case import ExportTelemetryUseCase
 from app.application.use_cases.iot.get_cached_command_use_case import GetCachedCommandUseCase
 from app.application.use_cases.iot.get_cached_telemetry_use_case import GetCachedTelemetryUseCase
 from app.application.use_cases.iot.get_device_snapshot_use_case import GetDeviceSnapshotUseCase
 from app.application.use_cases.iot.ingest_telemetry_use_case import IngestTelemetryUseCase
+from app.application.use_cases.iot.list_telemetry_history_use_case import (
+    ListTelemetryHistoryUseCase,
+)
 from app.application.use_cases.iot.list_telemetry_use_case import ListTelemetryUseCase
-from app.core.settings import Settings, get_settings
+from app.core.settings import IdempotencyBackend, Settings, get_settings
+from app.domain.ports.interfaces import CachePort, IdempotencyRepositoryPort
 from app.infrastructure.adapters.aws_iot_adapter import AwsIotCoreAdapter
 from app.infrastructure.adapters.kafka_adapter import KafkaTelemetryAdapter
+from app.infrastructure.adapters.near_cache import NearCacheAdapter
 from app.infrastructure.adapters.redis_adapter import RedisCacheAdapter
+from app.infrastructure.adapters.redis_idempotency import RedisIdempotencyRepository
 from app.infrastructure.adapters.web3_adapter import Web3BlockchainAdapter
 from app.infrastructure.persistence.document_repository import MongoTelemetryRepository
 from app.infrastructure.persistence.relational_repository import SqlAlchemyTelemetryRepository
@@ -27,39 +40,138 @@ class Container:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
 
-        self.cache = RedisCacheAdapter(settings)
+        self.redis_cache = RedisCacheAdapter(settings)
+        self.near_cache = NearCacheAdapter(
+            self.redis_cache,
+            self.redis_cache.client,
+            channel=settings.near_cache_channel,
+            l1_ttl_seconds=settings.near_cache_ttl_seconds,
+            max_entries=settings.near_cache_max_entries,
+            max_bytes=settings.near_cache_max_bytes,
+            publish_timeout_seconds=settings.external_timeout_seconds,
+        )
+        self.cache: CachePort = self.near_cache if settings.near_cache_enabled else self.redis_cache
         self.telemetry_publisher = KafkaTelemetryAdapter(settings)
         self.command_adapter = AwsIotCoreAdapter(settings)
         self.blockchain_adapter = Web3BlockchainAdapter(settings)
         self.relational_repo = SqlAlchemyTelemetryRepository(settings)
         self.document_repo = MongoTelemetryRepository(settings)
         self.coverage_service = CoverageService()
-        self.idempotency_service = IdempotencyService(self.relational_repo)
+        self.redis_idempotency = RedisIdempotencyRepository(
+            settings, self.redis_cache.client, self.relational_repo
+        )
+        self.idempotency_repo: IdempotencyRepositoryPort = (
+            self.redis_idempotency
+            if settings.idempotency_backend is IdempotencyBackend.REDIS
+            else self.relational_repo
+        )
+        self.idempotency_service = IdempotencyService(self.idempotency_repo)
+        self.projection_queue = ProjectionQueue(
+            'telemetry',
+            maxsize=settings.telemetry_projection_queue_size,
+            workers=settings.telemetry_projection_workers,
+        )
+        self.telemetry_ring_buffer = (
+            TelemetryRingBuffer(
+                capacity_per_device=settings.telemetry_ring_buffer_capacity,
+                max_devices=settings.telemetry_ring_buffer_max_devices,
+            )
+            if settings.telemetry_ring_buffer_enabled
+            else None
+        )
+        self.telemetry_query_cache = (
+            TelemetryQueryCache(
+                self.cache,
+                window=settings.telemetry_query_cache_window,
+                ttl_seconds=settings.telemetry_query_cache_ttl_seconds,
+            )
+            if settings.telemetry_query_cache_enabled
+            else None
+        )
 
         self.ingest_telemetry_use_case = IngestTelemetryUseCase(
             telemetry_publisher=self.telemetry_publisher,
             cache=self.cache,
             relational_repo=self.relational_repo,
             document_repo=self.document_repo,
+            projection_queue=(
+                self.projection_queue if settings.telemetry_async_projection_enabled else None
+            ),
+            concurrent_fan_out=settings.telemetry_concurrent_fanout_enabled,
+            ring_buffer=self.telemetry_ring_buffer,
+            query_cache=self.telemetry_query_cache,
+        )
+        self.outbox_relay = OutboxRelay(
+            self.ingest_telemetry_use_case,
+            batch_size=settings.outbox_relay_batch_size,
+            interval_seconds=settings.outbox_relay_interval_seconds,
+        )
+        self.retention_worker = RetentionWorker(
+            self.relational_repo,
+            outbox_retention_hours=settings.outbox_published_retention_hours,
+            telemetry_retention_days=settings.telemetry_raw_retention_days,
+            batch_size=settings.retention_batch_size,
+            max_batches_per_run=settings.retention_max_batches_per_run,
+            interval_seconds=settings.retention_interval_seconds,
         )
         self.dispatch_irrigation_command_use_case = DispatchIrrigationCommandUseCase(
             command_port=self.command_adapter,
             cache=self.cache,
         )
-        self.list_telemetry_use_case = ListTelemetryUseCase(relational_repo=self.relational_repo)
-        self.get_cached_telemetry_use_case = GetCachedTelemetryUseCase(cache=self.cache)
+        self.list_telemetry_use_case = ListTelemetryUseCase(
+            relational_repo=self.relational_repo,
+            ring_buffer=self.telemetry_ring_buffer,
+            query_cache=self.telemetry_query_cache,
+        )
+        self.list_telemetry_history_use_case = ListTelemetryHistoryUseCase(
+            relational_repo=self.relational_repo
+        )
+        self.export_telemetry_use_case = ExportTelemetryUseCase(
+            relational_repo=self.relational_repo
+        )
+        self.aggregate_telemetry_use_case = AggregateTelemetryUseCase(
+            relational_repo=self.relational_repo
+        )
+        self.get_cached_telemetry_use_case = GetCachedTelemetryUseCase(
+            cache=self.cache,
+            ring_buffer=self.telemetry_ring_buffer,
+            relational_repo=self.relational_repo,
+            early_refresh_beta=settings.telemetry_latest_early_refresh_beta,
+        )
         self.get_cached_command_use_case = GetCachedCommandUseCase(cache=self.cache)
-        self.get_device_snapshot_use_case = GetDeviceSnapshotUseCase(cache=self.cache)
+        self.get_device_snapshot_use_case = GetDeviceSnapshotUseCase(
+            cache=self.cache,
+            ring_buffer=self.telemetry_ring_buffer,
+            relational_repo=self.relational_repo,
+            fallback_concurrency=settings.device_snapshot_fallback_concurrency,
+        )
         self.register_ledger_record_use_case = RegisterLedgerRecordUseCase(
             blockchain_port=self.blockchain_adapter,
         )
 
     async def close(self) -> None:
+        with suppress(Exception):
+            await self.projection_queue.stop(
+                self.settings.telemetry_projection_drain_timeout_seconds
+            )
+
+        with suppress(Exception):
+            await self.outbox_relay.stop()
+
+        with suppress(Exception):
+            await self.retention_worker.stop()
+
         with suppress(Exception):
             await self.telemetry_publisher.close()
 
         with suppress(Exception):
-            await self.cache.close()
+            await self.near_cache.stop()
+
+        with suppress(Exception):
+            await self.redis_idempotency.close()
+
+        with suppress(Exception):
+            await self.redis_cache.close()
 
         with suppress(Exception):
             await self.command_adapter.close()
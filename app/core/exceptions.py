@@ -13,6 +13,8 @@ class ErrorCode(StrEnum):
     INFRASTRUCTURE_FAILURE = 'INFRASTRUCTURE_FAILURE'
     INTERNAL_SERVER_ERROR = 'INTERNAL_SERVER_ERROR'
     RATE_LIMITED = 'RATE_LIMITED'
+    INVALID_CURSOR = 'INVALID_CURSOR'
+    INVALID_TIME_RANGE = 'INVALID_TIME_RANGE'
 
 
 class InfrastructureError(Exception):
@@ -74,3 +76,21 @@ class IdempotencyInProgressError(ApiError):
             status_code=409,
             retryable=True,
         )
+
+
+class InvalidCursorError(ApiError):
+    def __init__(self) -> None:
+        super().__init__(
+            message='Cursor de paginacao invalido ou expirado.',
+            code=ErrorCode.INVALID_CURSOR,
+            status_code=400,
+        )
+
+
+class InvalidTimeRangeError(ApiError):
+    def __init__(self, message: str = 'O inicio do intervalo deve ser anterior ao fim.') -> None:
+        super().__init__(
+            message=message,
+            code=ErrorCode.INVALID_TIME_RANGE,
+            status_code=400,
+        )
@@ -70,6 +70,54 @@ OTEL_REQUIRED_MODULES = (
 )
 _telemetry_configured = False
 
+METRIC_DESCRIPTIONS: dict[str, str] = {
+    'outbox_relay_published_total': 'Eventos outbox publicados pelo relay em background.',
+    'outbox_relay_errors_total': 'Ciclos do relay de outbox encerrados com erro.',
+    'retention_rows_total': 'Linhas expurgadas/arquivadas pela retencao (rotulo table).',
+    'retention_last_run_rows': 'Linhas expurgadas/arquivadas na ultima rodada de retencao.',
+    'retention_errors_total': 'Rodadas de retencao interrompidas por erro.',
+    'idempotency_redis_fallback_total': (
+        'Operacoes de idempotencia desviadas para o SQL por falha do Redis.'
+    ),
+    'idempotency_durable_log_pending': 'Desfechos de idempotencia aguardando gravacao no SQL.',
+    'idempotency_durable_log_failed_total': 'Falhas ao gravar desfechos de idempotencia no SQL.',
+    'idempotency_durable_conflicts_total': (
+        'Desfechos cuja chave ja existia no log duravel (chave perdida pelo Redis).'
+    ),
+    'http_not_modified_total': 'Respostas 304 para If-None-Match que casou com a ETag.',
+    'telemetry_query_cache_hits_total': 'Listagens servidas pelo cache (consultas SQL evitadas).',
+    'telemetry_query_cache_misses_total': 'Listagens que precisaram consultar o SQL.',
+    'telemetry_query_cache_hit_ratio': 'Fracao acumulada de listagens servidas pelo cache.',
+    'single_flight_loads_total': 'Cargas executadas pelo single-flight (rotulo group).',
+    'single_flight_shared_total': 'Chamadas que aguardaram uma carga ja em andamento.',
+    'telemetry_latest_backend_loads_total': 'Consultas ao relacional para a ultima leitura.',
+    'telemetry_latest_early_refresh_total': 'Renovacoes antecipadas (XFetch) da ultima leitura.',
+    'device_snapshot_fallback_total': 'Dispositivos do snapshot buscados no relacional.',
+    'telemetry_ring_buffer_devices': 'Dispositivos mantidos no ring buffer em processo.',
+    'telemetry_ring_buffer_bytes': 'Memoria das colunas do ring buffer de telemetria.',
+    'telemetry_ring_buffer_hits_total': 'Leituras atendidas pelo ring buffer (rotulo read).',
+    'telemetry_ring_buffer_misses_total': 'Leituras que precisaram de Redis ou SQL.',
+    'local_cache_hits_total': 'Leituras atendidas pelo cache em processo (rotulo cache).',
+    'local_cache_misses_total': 'Leituras ausentes ou expiradas no cache em processo.',
+    'local_cache_evictions_total': 'Entradas removidas por limite de tamanho (LRU).',
+    'local_cache_expirations_total': 'Entradas removidas por TTL vencido.',
+    'local_cache_entries': 'Entradas no cache em processo.',
+    'local_cache_bytes': 'Bytes aproximados (JSON) mantidos no cache em processo.',
+    'near_cache_hits_total': 'Leituras do near-cache atendidas por nivel (rotulo tier: l1, l2).',
+    'near_cache_misses_total': 'Leituras do near-cache ausentes na L1 e no Redis.',
+    'near_cache_rtt_saved_seconds_total': 'Idas ao Redis evitadas por acertos na L1 (estimativa).',
+    'near_cache_l2_rtt_seconds': 'Media movel da latencia de leitura no Redis (L2).',
+    'near_cache_invalidations_total': 'Invalidacoes do near-cache enviadas/recebidas (direction).',
+    'near_cache_invalidation_errors_total': 'Falhas ao publicar ou assinar invalidacoes.',
+    'projection_queue_enqueued_total': 'Jobs de projecao aceitos pela fila em memoria.',
+    'projection_queue_rejected_total': 'Jobs recusados por fila cheia (executados inline).',
+    'projection_queue_processed_total': 'Jobs de projecao concluidos pelos workers.',
+    'projection_queue_failed_total': 'Jobs de projecao encerrados com erro.',
+    'projection_queue_depth': 'Jobs aguardando na fila de projecao.',
+    'projection_queue_capacity': 'Capacidade maxima da fila de projecao.',
+    'projection_queue_wait_seconds': 'Tempo de espera na fila do ultimo job iniciado.',
+}
+
 
 def redact_text(value: str) -> str:
     redacted = EMAIL_PATTERN.sub('[REDACTED_EMAIL]', value)
@@ -231,6 +279,8 @@ class MetricsRegistry:
         self._external_counter: dict[str, MetricsRegistry._OperationStats] = defaultdict(
             MetricsRegistry._OperationStats
         )
+        self._counters: dict[tuple[str, tuple[tuple[str, str], ...]], float] = defaultdict(float)
+        self._gauges: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
 
     def track_start(self) -> None:
         with self._lock:
@@ -255,6 +305,20 @@ class MetricsRegistry:
     ) -> None:
         self._track_operation(self._external_counter, integration, elapsed_seconds, ok)
 
+    def increment_counter(
+        self, name: str, amount: float = 1.0, labels: dict[str, str] | None = None
+    ) -> None:
+        with self._lock:
+            self._counters[(name, self._label_items(labels))] += amount
+
+    def set_gauge(self, name: str, value: float, labels: dict[str, str] | None = None) -> None:
+        with self._lock:
+            self._gauges[(name, self._label_items(labels))] = value
+
+    @staticmethod
+    def _label_items(labels: dict[str, str] | None) -> tuple[tuple[str, str], ...]:
+        return tuple(sorted((labels or {}).items()))
+
     def _track_operation(
         self,
         target: dict[str, MetricsRegistry._OperationStats],
@@ -340,8 +404,30 @@ class MetricsRegistry:
             'integration',
             self._external_counter,
         )
+        self._append_named_metrics(lines, 'counter', self._counters)
+        self._append_named_metrics(lines, 'gauge', self._gauges)
         return '\n'.join(lines) + '\n'
 
+    def _append_named_metrics(
+        self,
+        lines: list[str],
+        metric_type: str,
+        values: dict[tuple[str, tuple[tuple[str, str], ...]], float],
+    ) -> None:
+        described: set[str] = set()
+        for (name, labels), value in sorted(values.items()):
+            if name not in described:
+                described.add(name)
+                if name in METRIC_DESCRIPTIONS:
+                    lines.append(f'# HELP {name} {METRIC_DESCRIPTIONS[name]}')
+                lines.append(f'# TYPE {name} {metric_type}')
+            rendered_labels = ','.join(
+                f'{key}="{self._escape_label(label)}"' for key, label in labels
+            )
+            suffix = f'{{{rendered_labels}}}' if rendered_labels else ''
+            rendered_value = f'{value:.0f}' if float(value).is_integer() else f'{value:.6f}'
+            lines.append(f'{name}{suffix} {rendered_value}')
+
     def _append_operation_metrics(
         self,
         lines: list[str],
@@ -1,3 +1,4 @@
+import importlib.util
 import os
 from enum import StrEnum
 from functools import lru_cache
@@ -22,6 +23,17 @@ class LogLevel(StrEnum):
     CRITICAL = 'CRITICAL'
 
 
+class PayloadCodecName(StrEnum):
+    JSON = 'json'
+    ORJSON = 'orjson'
+    MSGPACK = 'msgpack'
+
+
+class IdempotencyBackend(StrEnum):
+    SQL = 'sql'
+    REDIS = 'redis'
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file='.env',
@@ -53,6 +65,7 @@ class Settings(BaseSettings):
             'Authorization',
             'Content-Type',
             'Idempotency-Key',
+            'If-None-Match',
             'X-API-Key',
             'X-Request-ID',
         ]
@@ -65,8 +78,50 @@ class Settings(BaseSettings):
     kafka_bootstrap_servers: str = Field(default='localhost:9092', min_length=1, max_length=512)
     kafka_topic_telemetry: str = Field(default='hortelan.telemetry', min_length=1, max_length=249)
     kafka_topic_commands: str = Field(default='hortelan.commands', min_length=1, max_length=249)
+    kafka_linger_ms: int = Field(default=5, ge=0, le=1_000)
+    kafka_max_batch_bytes: int = Field(default=65_536, ge=1_024, le=16_777_216)
+
+    telemetry_concurrent_fanout_enabled: bool = False
+    telemetry_rollups_enabled: bool = True
+    telemetry_query_cache_enabled: bool = False
+    telemetry_query_cache_window: int = Field(default=200, ge=1, le=1_000)
+    telemetry_query_cache_ttl_seconds: int = Field(default=30, ge=1, le=3_600)
+    telemetry_latest_early_refresh_beta: float = Field(default=1.0, ge=0, le=10)
+    device_snapshot_fallback_concurrency: int = Field(default=8, ge=1, le=64)
+    telemetry_ring_buffer_enabled: bool = False
+    telemetry_ring_buffer_capacity: int = Field(default=256, ge=1, le=100_000)
+    telemetry_ring_buffer_max_devices: int = Field(default=10_000, ge=1, le=1_000_000)
+    telemetry_async_projection_enabled: bool = False
+    telemetry_projection_queue_size: int = Field(default=1_000, ge=1, le=100_000)
+    telemetry_projection_workers: int = Field(default=4, ge=1, le=64)
+    telemetry_projection_drain_timeout_seconds: float = Field(default=10.0, gt=0, le=120)
+
+    outbox_relay_enabled: bool = True
+    outbox_relay_batch_size: int = Field(default=100, ge=1, le=5_000)
+    outbox_relay_interval_seconds: float = Field(default=1.0, gt=0, le=300)
+
+    retention_enabled: bool = True
+    retention_interval_seconds: float = Field(default=3_600, gt=0, le=86_400)
+    retention_batch_size: int = Field(default=1_000, ge=1, le=50_000)
+    retention_max_batches_per_run: int = Field(default=50, ge=1, le=10_000)
+    outbox_published_retention_hours: float = Field(default=72, gt=0, le=24 * 365)
+    telemetry_raw_retention_days: float = Field(default=365, gt=0, le=3_650)
 
     redis_url: str = 'redis://localhost:6379/0'
+    payload_codec: PayloadCodecName = PayloadCodecName.JSON
+    cache_fallback_max_entries: int = Field(default=10_000, ge=1, le=1_000_000)
+    cache_fallback_max_bytes: int = Field(default=32 * 1024 * 1024, ge=1_024, le=2**31)
+    near_cache_enabled: bool = False
+    near_cache_ttl_seconds: float = Field(default=2.0, gt=0, le=300)
+    near_cache_max_entries: int = Field(default=10_000, ge=1, le=1_000_000)
+    near_cache_max_bytes: int = Field(default=16 * 1024 * 1024, ge=1_024, le=2**31)
+    near_cache_channel: str = 'hortelan:cache:invalidate'
+    idempotency_backend: IdempotencyBackend = IdempotencyBackend.SQL
+    idempotency_ttl_seconds: int = Field(default=86_400, ge=60, le=30 * 86_400)
+    idempotency_default_retention_hours: float = Field(default=24, gt=0, le=24 * 365)
+    idempotency_retention_hours: dict[str, float] = Field(
+        default_factory=lambda: {'commands.dispatch': 24.0, 'ledger.register': 720.0}
+    )
     relational_db_url: str = Field(
         default_factory=lambda: (
             'sqlite+aiosqlite:////tmp/hortelan.db'
@@ -119,6 +174,20 @@ class Settings(BaseSettings):
             raise ValueError('REDIS_URL deve usar redis:// ou rediss://')
         return value
 
+    @field_validator('payload_codec')
+    @classmethod
+    def validate_payload_codec(cls, value: PayloadCodecName) -> PayloadCodecName:
+        if value is not PayloadCodecName.JSON and importlib.util.find_spec(value.value) is None:
+            raise ValueError(f'PAYLOAD_CODEC={value.value} exige o pacote {value.value} instalado')
+        return value
+
+    @field_validator('idempotency_retention_hours')
+    @classmethod
+    def validate_idempotency_retention(cls, value: dict[str, float]) -> dict[str, float]:
+        if any(not 0 < hours <= 24 * 365 for hours in value.values()):
+            raise ValueError('IDEMPOTENCY_RETENTION_HOURS aceita de 0 a 8760 horas por operacao')
+        return value
+
     @field_validator('mongo_url')
     @classmethod
     def validate_mongo_url(cls, value: str) -> str:
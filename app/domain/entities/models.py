@@ -13,6 +13,21 @@ class IrrigationAction(StrEnum):
     STOP = 'stop'
 
 
+class TelemetryExportFormat(StrEnum):
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+
+class TelemetryBucket(StrEnum):
+    FIVE_MINUTES = '5m'
+    HOUR = '1h'
+    DAY = '1d'
+
+    @property
+    def seconds(self) -> int:
+        return {'5m': 300, '1h': 3_600, '1d': 86_400}[self.value]
+
+
 class IdempotencyState(StrEnum):
     PROCESSING = 'processing'
     COMPLETED = 'completed'
@@ -21,6 +36,7 @@ class IdempotencyState(StrEnum):
 
 class OutboxState(StrEnum):
     PENDING = 'pending'
+    CLAIMED = 'claimed'
     PUBLISHED = 'published'
 
 
@@ -34,6 +50,36 @@ class TelemetryReading:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(frozen=True, slots=True)
+class TelemetryCursor:
+    """Posicao de keyset `(captured_at, id)` da ultima leitura entregue."""
+
+    captured_at: datetime
+    reading_id: int
+
+
+@dataclass(slots=True)
+class TelemetryPage:
+    items: list[TelemetryReading]
+    next_cursor: TelemetryCursor | None = None
+
+
+@dataclass(slots=True)
+class MetricStats:
+    minimum: float
+    maximum: float
+    average: float
+
+
+@dataclass(slots=True)
+class TelemetryAggregate:
+    bucket_start: datetime
+    count: int
+    moisture: MetricStats
+    temperature: MetricStats
+    ph: MetricStats
+
+
 @dataclass(slots=True)
 class IrrigationCommand:
     device_id: str
@@ -58,6 +104,7 @@ class IdempotencyRecord:
     fingerprint: str
     state: IdempotencyState
     response: dict[str, Any] | None = None
+    created_at: datetime | None = None
 
 
 @dataclass(slots=True)
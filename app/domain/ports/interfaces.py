@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
 
 from app.domain.entities.models import (
@@ -6,6 +8,10 @@ from app.domain.entities.models import (
     IrrigationCommand,
     LedgerRecord,
     OutboxEvent,
+    TelemetryAggregate,
+    TelemetryBucket,
+    TelemetryCursor,
+    TelemetryPage,
     TelemetryReading,
 )
 
@@ -14,6 +20,9 @@ class TelemetryPublisherPort(ABC):
     @abstractmethod
     async def publish_telemetry(self, reading: TelemetryReading) -> None: ...
 
+    @abstractmethod
+    async def publish_telemetry_batch(self, readings: list[TelemetryReading]) -> list[bool]: ...
+
 
 class DeviceCommandPort(ABC):
     @abstractmethod
@@ -27,6 +36,12 @@ class CachePort(ABC):
     @abstractmethod
     async def get(self, key: str) -> dict[str, Any] | None: ...
 
+    @abstractmethod
+    async def set_many(self, items: dict[str, dict[str, Any]], ttl_seconds: int = 300) -> None: ...
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> list[dict[str, Any] | None]: ...
+
 
 class BlockchainPort(ABC):
     @abstractmethod
@@ -37,22 +52,80 @@ class RelationalTelemetryRepositoryPort(ABC):
     @abstractmethod
     async def save_with_outbox(self, reading: TelemetryReading) -> str: ...
 
+    @abstractmethod
+    async def save_many_with_outbox(self, readings: list[TelemetryReading]) -> list[str]: ...
+
     @abstractmethod
     async def list_recent(
         self, limit: int = 20, device_id: str | None = None
     ) -> list[TelemetryReading]: ...
 
+    @abstractmethod
+    async def list_page(
+        self,
+        device_id: str,
+        *,
+        limit: int,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: TelemetryCursor | None = None,
+    ) -> TelemetryPage: ...
+
+    @abstractmethod
+    async def aggregate(
+        self,
+        device_id: str,
+        *,
+        bucket: TelemetryBucket,
+        since: datetime,
+        until: datetime,
+    ) -> list[TelemetryAggregate]: ...
+
+    @abstractmethod
+    def stream_readings(
+        self,
+        device_id: str | None = None,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        batch_size: int = 1_000,
+    ) -> AsyncIterator[TelemetryReading]: ...
+
     @abstractmethod
     async def list_pending_outbox(self, limit: int = 100) -> list[OutboxEvent]: ...
 
+    @abstractmethod
+    async def claim_pending_outbox(self, limit: int = 100) -> list[OutboxEvent]: ...
+
+    @abstractmethod
+    async def release_outbox(self, event_ids: list[str]) -> None: ...
+
+    @abstractmethod
+    async def requeue_claimed_outbox(self) -> int: ...
+
     @abstractmethod
     async def mark_outbox_published(self, event_id: str) -> None: ...
 
+    @abstractmethod
+    async def mark_outbox_published_many(self, event_ids: list[str]) -> None: ...
+
+    @abstractmethod
+    async def purge_published_outbox(self, older_than: datetime, limit: int = 1_000) -> int: ...
+
+    @abstractmethod
+    async def archive_telemetry(self, older_than: datetime, limit: int = 1_000) -> int: ...
+
+    @abstractmethod
+    async def purge_expired_idempotency(self, now: datetime, limit: int = 1_000) -> int: ...
+
 
 class DocumentTelemetryRepositoryPort(ABC):
     @abstractmethod
     async def save(self, reading: TelemetryReading) -> None: ...
 
+    @abstractmethod
+    async def save_many(self, readings: list[TelemetryReading]) -> None: ...
+
 
 class IdempotencyRepositoryPort(ABC):
     @abstractmethod
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 from dataclasses import asdict
 
@@ -11,6 +10,7 @@ from app.core.resilience import ExternalCallPolicy
 from app.core.settings import Settings
 from app.domain.entities.models import TelemetryReading
 from app.domain.ports.interfaces import TelemetryPublisherPort
+from app.infrastructure.serialization import build_codec
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +19,8 @@ class KafkaTelemetryAdapter(TelemetryPublisherPort):
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
         self._producer: AIOKafkaProducer | None = None
+        self._codec = build_codec(settings.payload_codec)
+        self._headers = [('content-type', self._codec.content_type.encode('ascii'))]
         self._policy = ExternalCallPolicy.from_settings(
             'kafka_telemetry', 'kafka.publish_telemetry', settings
         )
@@ -28,7 +30,9 @@ class KafkaTelemetryAdapter(TelemetryPublisherPort):
         if self._producer is None:
             try:
                 self._producer = AIOKafkaProducer(
-                    bootstrap_servers=self.settings.kafka_bootstrap_servers
+                    bootstrap_servers=self.settings.kafka_bootstrap_servers,
+                    linger_ms=self.settings.kafka_linger_ms,
+                    max_batch_size=self.settings.kafka_max_batch_bytes,
                 )
                 async with asyncio.timeout(self.settings.external_timeout_seconds):
                     await self._producer.start()
@@ -49,10 +53,12 @@ class KafkaTelemetryAdapter(TelemetryPublisherPort):
             self._circuit_breaker.on_failure()
             raise TransientIntegrationError('Producer Kafka indisponível')
 
-        payload = json.dumps(asdict(reading), default=str).encode('utf-8')
+        payload = self._encode(reading)
         try:
             async with asyncio.timeout(self.settings.external_timeout_seconds):
-                await producer.send_and_wait(self.settings.kafka_topic_telemetry, payload)
+                await producer.send_and_wait(
+                    self.settings.kafka_topic_telemetry, payload, headers=self._headers
+                )
         except Exception as exc:
             self._policy.failure(started)
             logger.exception('Falha ao publicar telemetria no Kafka')
@@ -60,6 +66,49 @@ class KafkaTelemetryAdapter(TelemetryPublisherPort):
         else:
             self._policy.success(started)
 
+    async def publish_telemetry_batch(self, readings: list[TelemetryReading]) -> list[bool]:
+        if not readings:
+            return []
+
+        try:
+            started = self._policy.start()
+        except CircuitBreakerOpenError as exc:
+            raise TransientIntegrationError('Circuit breaker aberto para Kafka') from exc
+
+        producer = await self._producer_or_create()
+        if producer is None:
+            self._circuit_breaker.on_failure()
+            raise TransientIntegrationError('Producer Kafka indisponível')
+
+        try:
+            async with asyncio.timeout(self.settings.external_timeout_seconds):
+                deliveries = [
+                    await producer.send(
+                        self.settings.kafka_topic_telemetry,
+                        self._encode(reading),
+                        headers=self._headers,
+                    )
+                    for reading in readings
+                ]
+                results = await asyncio.gather(*deliveries, return_exceptions=True)
+        except Exception as exc:
+            self._policy.failure(started)
+            logger.exception('Falha ao publicar lote de telemetria no Kafka')
+            raise TransientIntegrationError(
+                'Falha ao publicar lote de telemetria no Kafka'
+            ) from exc
+
+        delivered = [not isinstance(result, BaseException) for result in results]
+        if all(delivered):
+            self._policy.success(started)
+        else:
+            self._policy.failure(started)
+            logger.warning('Entrega parcial do lote de telemetria no Kafka')
+        return delivered
+
+    def _encode(self, reading: TelemetryReading) -> bytes:
+        return self._codec.encode(asdict(reading))
+
     async def close(self) -> None:
         if self._producer:
             await self._producer.stop()
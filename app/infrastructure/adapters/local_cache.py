@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.observability import metrics_registry
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: dict[str, Any]
+    expires_at: float | None
+    size: int
+
+
+class LocalCache:
+    """Cache em processo com LRU limitado por entradas e bytes e TTL por entrada."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_entries: int = 10_000,
+        max_bytes: int = 32 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Tamanho aproximado: bytes do JSON serializado de cada valor."""
+        return self._bytes
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at is not None and entry.expires_at <= self._clock():
+            self._remove(key)
+            self._count('local_cache_expirations_total')
+            entry = None
+        if entry is None:
+            self._count('local_cache_misses_total')
+            return None
+        self._entries.move_to_end(key)
+        self._count('local_cache_hits_total')
+        return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: dict[str, Any],
+        ttl_seconds: float | None,
+        *,
+        size: int | None = None,
+    ) -> None:
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            self.delete(key)
+            return
+        if size is None:
+            size = len(json.dumps(value, default=str))
+        if key in self._entries:
+            self._remove(key)
+        expires_at = self._clock() + ttl_seconds if ttl_seconds is not None else None
+        self._entries[key] = _Entry(value, expires_at, size)
+        self._bytes += size
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._count('local_cache_evictions_total')
+        self._publish_size()
+
+    def delete(self, key: str) -> None:
+        if key in self._entries:
+            self._remove(key)
+            self._publish_size()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+        self._publish_size()
+
+    def _remove(self, key: str) -> None:
+        self._bytes -= self._entries.pop(key).size
+
+    def _count(self, name: str) -> None:
+        metrics_registry.increment_counter(name, labels={'cache': self.name})
+
+    def _publish_size(self) -> None:
+        labels = {'cache': self.name}
+        metrics_registry.set_gauge('local_cache_entries', len(self._entries), labels=labels)
+        metrics_registry.set_gauge('local_cache_bytes', self._bytes, labels=labels)
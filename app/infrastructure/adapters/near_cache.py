@@ -0,0 +1,187 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from contextlib import suppress
+from typing import Any
+
+from redis.asyncio import Redis
+
+from app.core.observability import metrics_registry
+from app.domain.ports.interfaces import CachePort
+from app.infrastructure.adapters.local_cache import LocalCache
+
+logger = logging.getLogger(__name__)
+
+
+class NearCacheAdapter(CachePort):
+    """Cache em dois niveis: L1 em processo na frente do Redis (L2).
+
+    Cada escrita publica a chave em um canal Redis para que os outros processos descartem a
+    copia local. A L1 usa TTL curto (`l1_ttl_seconds`), que limita a desatualizacao mesmo se
+    uma invalidacao se perder.
+    """
+
+    def __init__(
+        self,
+        l2: CachePort,
+        client: Redis,
+        *,
+        channel: str = 'hortelan:cache:invalidate',
+        l1_ttl_seconds: float = 2.0,
+        max_entries: int = 10_000,
+        max_bytes: int = 16 * 1024 * 1024,
+        publish_timeout_seconds: float = 0.2,
+        reconnect_interval_seconds: float = 1.0,
+    ) -> None:
+        self.l2 = l2
+        self.client = client
+        self.channel = channel
+        self.l1_ttl_seconds = l1_ttl_seconds
+        self.publish_timeout_seconds = publish_timeout_seconds
+        self.reconnect_interval_seconds = reconnect_interval_seconds
+        self.origin = uuid.uuid4().hex
+        self._l1 = LocalCache('near_cache', max_entries=max_entries, max_bytes=max_bytes)
+        self._l2_rtt_seconds = 0.0
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._listen(), name='near-cache-invalidation')
+
+    async def stop(self, timeout_seconds: float = 5.0) -> None:
+        if self._task is None:
+            return
+        self._stopping.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout=timeout_seconds)
+        except TimeoutError:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    async def set(self, key: str, value: dict[str, Any], ttl_seconds: int = 300) -> None:
+        await self.set_many({key: value}, ttl_seconds)
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        return (await self.get_many([key]))[0]
+
+    async def set_many(self, items: dict[str, dict[str, Any]], ttl_seconds: int = 300) -> None:
+        for key in items:
+            self._l1.delete(key)
+        await self.l2.set_many(items, ttl_seconds)
+        for key, value in items.items():
+            self._l1.set(key, value, min(ttl_seconds, self.l1_ttl_seconds))
+        if items:
+            await self._publish_invalidation(list(items))
+
+    async def get_many(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        results = [self._l1.get(key) for key in keys]
+        missing = [index for index, value in enumerate(results) if value is None]
+        l1_hits = len(keys) - len(missing)
+        if l1_hits:
+            metrics_registry.increment_counter(
+                'near_cache_hits_total', l1_hits, labels={'tier': 'l1'}
+            )
+            # Uma leitura servida inteiramente pela L1 economiza uma ida ao Redis.
+            if not missing:
+                metrics_registry.increment_counter(
+                    'near_cache_rtt_saved_seconds_total', self._l2_rtt_seconds
+                )
+        if not missing:
+            return results
+
+        started = time.perf_counter()
+        fetched = await self.l2.get_many([keys[index] for index in missing])
+        self._observe_l2_rtt(time.perf_counter() - started)
+        for index, value in zip(missing, fetched, strict=True):
+            if value is None:
+                metrics_registry.increment_counter('near_cache_misses_total')
+                continue
+            metrics_registry.increment_counter('near_cache_hits_total', labels={'tier': 'l2'})
+            self._l1.set(keys[index], value, self.l1_ttl_seconds)
+            results[index] = value
+        return results
+
+    def invalidate(self, keys: list[str]) -> None:
+        for key in keys:
+            self._l1.delete(key)
+        metrics_registry.increment_counter(
+            'near_cache_invalidations_total', labels={'direction': 'received'}
+        )
+
+    async def close(self) -> None:
+        await self.stop()
+        close = getattr(self.l2, 'close', None)
+        if close is not None:
+            await close()
+
+    def _observe_l2_rtt(self, elapsed_seconds: float) -> None:
+        # Media movel exponencial: estima quanto cada acerto na L1 economiza de ida ao Redis.
+        if self._l2_rtt_seconds == 0.0:
+            self._l2_rtt_seconds = elapsed_seconds
+        else:
+            self._l2_rtt_seconds += 0.1 * (elapsed_seconds - self._l2_rtt_seconds)
+        metrics_registry.set_gauge('near_cache_l2_rtt_seconds', self._l2_rtt_seconds)
+
+    async def _publish_invalidation(self, keys: list[str]) -> None:
+        message = json.dumps({'keys': keys, 'origin': self.origin})
+        try:
+            async with asyncio.timeout(self.publish_timeout_seconds):
+                await self.client.publish(self.channel, message)
+        except Exception:
+            metrics_registry.increment_counter('near_cache_invalidation_errors_total')
+            logger.warning(
+                'cache.near.invalidation.publish.failed',
+                extra={'event': 'cache.near.invalidation.publish.failed'},
+            )
+            return
+        metrics_registry.increment_counter(
+            'near_cache_invalidations_total', labels={'direction': 'sent'}
+        )
+
+    def _handle_message(self, data: object) -> None:
+        try:
+            payload = json.loads(data) if isinstance(data, str | bytes) else None
+        except json.JSONDecodeError:
+            payload = None
+        if not isinstance(payload, dict):
+            payload = {}
+        keys = payload.get('keys')
+        if not isinstance(keys, list) or not all(isinstance(key, str) for key in keys):
+            logger.warning('Mensagem de invalidacao ignorada por formato invalido')
+            return
+        if payload.get('origin') == self.origin:
+            return
+        self.invalidate(keys)
+
+    async def _listen(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                async with self.client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    # Invalidacoes podem ter se perdido enquanto nao havia assinatura.
+                    self._l1.clear()
+                    while not self._stopping.is_set():
+                        message = await pubsub.get_message(timeout=1.0)
+                        if message is not None and message.get('type') == 'message':
+                            self._handle_message(message.get('data'))
+            except Exception:
+                metrics_registry.increment_counter('near_cache_invalidation_errors_total')
+                logger.warning(
+                    'cache.near.invalidation.listen.failed',
+                    extra={'event': 'cache.near.invalidation.listen.failed'},
+                )
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=self.reconnect_interval_seconds
+                    )
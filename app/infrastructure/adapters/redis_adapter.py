@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 from typing import Any
 
@@ -10,6 +9,8 @@ from app.core.exceptions import TransientIntegrationError
 from app.core.resilience import ExternalCallPolicy
 from app.core.settings import Settings
 from app.domain.ports.interfaces import CachePort
+from app.infrastructure.adapters.local_cache import LocalCache
+from app.infrastructure.serialization import build_codec, decode_payload
 
 logger = logging.getLogger(__name__)
 
@@ -17,20 +18,38 @@ logger = logging.getLogger(__name__)
 class RedisCacheAdapter(CachePort):
     def __init__(self, settings: Settings) -> None:
         self._timeout_seconds = settings.external_timeout_seconds
-        self.client = Redis.from_url(settings.redis_url, decode_responses=True)
-        self._fallback_store: dict[str, dict[str, Any]] = {}
+        self.client = Redis.from_url(settings.redis_url)
+        self._codec = build_codec(settings.payload_codec)
+        self._fallback_store = LocalCache(
+            'redis_fallback',
+            max_entries=settings.cache_fallback_max_entries,
+            max_bytes=settings.cache_fallback_max_bytes,
+        )
         self._policy = ExternalCallPolicy.from_settings('redis_cache', 'redis', settings)
         self._circuit_breaker = self._policy.circuit_breaker
 
     async def set(self, key: str, value: dict[str, Any], ttl_seconds: int = 300) -> None:
-        self._fallback_store[key] = value
+        await self.set_many({key: value}, ttl_seconds)
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        return (await self.get_many([key]))[0]
+
+    async def set_many(self, items: dict[str, dict[str, Any]], ttl_seconds: int = 300) -> None:
+        payloads = {key: self._codec.encode(value) for key, value in items.items()}
+        for key, value in items.items():
+            self._fallback_store.set(key, value, ttl_seconds, size=len(payloads[key]))
+        if not payloads:
+            return
         try:
             started = self._policy.start()
         except CircuitBreakerOpenError:
             return
         try:
             async with asyncio.timeout(self._timeout_seconds):
-                await self.client.set(key, json.dumps(value, default=str), ex=ttl_seconds)
+                async with self.client.pipeline(transaction=False) as pipe:
+                    for key, payload in payloads.items():
+                        pipe.set(key, payload, ex=ttl_seconds)
+                    await pipe.execute()
         except Exception as exc:
             self._policy.failure(started)
             logger.warning('Falha ao gravar no Redis; mantendo fallback em memória')
@@ -38,32 +57,49 @@ class RedisCacheAdapter(CachePort):
         else:
             self._policy.success(started)
 
-    async def get(self, key: str) -> dict[str, Any] | None:
+    async def get_many(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        """Le todas as chaves em uma ida ao Redis: `MGET` e um `PTTL` por chave no pipeline."""
+        if not keys:
+            return []
         try:
             started = self._policy.start()
         except CircuitBreakerOpenError:
-            return self._fallback_store.get(key)
+            return [self._fallback_store.get(key) for key in keys]
         try:
             async with asyncio.timeout(self._timeout_seconds):
-                value = await self.client.get(key)
+                async with self.client.pipeline(transaction=False) as pipe:
+                    pipe.mget(keys)
+                    for key in keys:
+                        pipe.pttl(key)
+                    values, *ttls = await pipe.execute()
         except Exception:
             logger.warning('Falha ao ler Redis; retornando fallback em memória')
             self._policy.failure(started)
-            return self._fallback_store.get(key)
+            return [self._fallback_store.get(key) for key in keys]
 
         self._policy.success(started)
-        if value:
-            try:
-                parsed = json.loads(value)
-            except json.JSONDecodeError:
-                logger.warning('Valor Redis ignorado por conter JSON invalido')
-                return self._fallback_store.get(key)
-            if not isinstance(parsed, dict):
-                logger.warning('Valor Redis ignorado por nao ser um objeto JSON')
-                return self._fallback_store.get(key)
-            self._fallback_store[key] = parsed
-            return parsed
-        return self._fallback_store.get(key)
+        return [
+            self._parse(key, value, ttl_ms)
+            for key, value, ttl_ms in zip(keys, values, ttls, strict=True)
+        ]
+
+    def _parse(
+        self, key: str, value: bytes | str | None, ttl_ms: int | None
+    ) -> dict[str, Any] | None:
+        if not value:
+            return self._fallback_store.get(key)
+        try:
+            parsed = decode_payload(value)
+        except ValueError:
+            logger.warning('Valor Redis ignorado por conter payload invalido')
+            return self._fallback_store.get(key)
+        if not isinstance(parsed, dict):
+            logger.warning('Valor Redis ignorado por nao ser um objeto')
+            return self._fallback_store.get(key)
+        # PTTL -1 indica chave sem expiracao no Redis.
+        ttl_seconds = ttl_ms / 1000 if ttl_ms is not None and ttl_ms >= 0 else None
+        self._fallback_store.set(key, parsed, ttl_seconds, size=len(value))
+        return parsed
 
     async def close(self) -> None:
         await self.client.aclose()
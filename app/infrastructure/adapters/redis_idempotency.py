@@ -0,0 +1,188 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from typing import Any
+
+from redis.asyncio import Redis
+
+from app.core.circuit_breaker import CircuitBreakerOpenError
+from app.core.exceptions import InfrastructureError, TransientIntegrationError
+from app.core.observability import metrics_registry
+from app.core.resilience import ExternalCallPolicy
+from app.core.settings import Settings
+from app.domain.entities.models import IdempotencyRecord, IdempotencyState
+from app.domain.ports.interfaces import IdempotencyRepositoryPort
+from app.infrastructure.serialization import build_codec, decode_payload
+
+logger = logging.getLogger(__name__)
+
+
+class RedisIdempotencyRepository(IdempotencyRepositoryPort):
+    """Reservas de idempotencia no Redis, com o repositorio SQL como log duravel assincrono.
+
+    `SET NX PX GET` reserva a chave e devolve o registro existente na mesma ida ao Redis, entao
+    um replay custa uma leitura em vez de um INSERT com conflito seguido de SELECT. O desfecho
+    de cada operacao e gravado no SQL em segundo plano. Se o Redis falhar na reserva, a operacao
+    inteira segue pelo repositorio duravel.
+    """
+
+    MAX_TRACKED_KEYS = 10_000
+
+    def __init__(
+        self,
+        settings: Settings,
+        client: Redis,
+        durable: IdempotencyRepositoryPort,
+        *,
+        key_prefix: str = 'idempotency:',
+    ) -> None:
+        self.client = client
+        self.durable = durable
+        self.key_prefix = key_prefix
+        self.ttl_ms = settings.idempotency_ttl_seconds * 1000
+        self._codec = build_codec(settings.payload_codec)
+        self._policy = ExternalCallPolicy.from_settings('redis_idempotency', 'redis', settings)
+        # Reservas deste processo aguardando desfecho; `None` marca reserva feita no SQL.
+        self._reserved: dict[str, IdempotencyRecord | None] = {}
+        self._writes: set[asyncio.Task[None]] = set()
+
+    async def reserve(self, record: IdempotencyRecord) -> tuple[bool, IdempotencyRecord]:
+        payload = self._codec.encode(_to_payload(record))
+        try:
+            previous = await self._execute(
+                lambda: self.client.set(
+                    self._key(record.key), payload, nx=True, px=self.ttl_ms, get=True
+                )
+            )
+        except TransientIntegrationError:
+            metrics_registry.increment_counter('idempotency_redis_fallback_total')
+            logger.warning('Redis indisponivel; reservando idempotencia no repositorio duravel')
+            created, existing = await self.durable.reserve(record)
+            if created:
+                self._track(record.key, None)
+            return created, existing
+        if previous is None:
+            self._track(record.key, record)
+            return True, record
+        return False, _from_payload(record.key, decode_payload(previous))
+
+    async def complete(self, key: str, response: dict[str, Any]) -> None:
+        await self._finish(key, IdempotencyState.COMPLETED, response)
+
+    async def mark_unknown(self, key: str) -> None:
+        await self._finish(key, IdempotencyState.UNKNOWN, None)
+
+    async def close(self, timeout_seconds: float = 5.0) -> None:
+        """Aguarda as gravacoes pendentes no log duravel."""
+        if not self._writes:
+            return
+        with suppress(TimeoutError):
+            await asyncio.wait_for(
+                asyncio.gather(*self._writes, return_exceptions=True), timeout=timeout_seconds
+            )
+
+    async def _finish(
+        self, key: str, state: IdempotencyState, response: dict[str, Any] | None
+    ) -> None:
+        if key not in self._reserved:
+            raise InfrastructureError('Reserva de idempotencia inexistente')
+        reserved = self._reserved.pop(key)
+        if reserved is None:
+            await self._write_state(key, state, response)
+            return
+        record = IdempotencyRecord(
+            key=key,
+            operation=reserved.operation,
+            fingerprint=reserved.fingerprint,
+            state=state,
+            response=response,
+        )
+        payload = self._codec.encode(_to_payload(record))
+        try:
+            await self._execute(lambda: self.client.set(self._key(key), payload, px=self.ttl_ms))
+        except TransientIntegrationError:
+            # Sem Redis, o desfecho vai ao SQL antes de responder; a reserva expira no Redis.
+            metrics_registry.increment_counter('idempotency_redis_fallback_total')
+            logger.warning('Redis indisponivel; gravando desfecho de idempotencia no SQL')
+            await self._log(record)
+            return
+        task = asyncio.create_task(self._log(record))
+        self._writes.add(task)
+        task.add_done_callback(self._write_done)
+        metrics_registry.set_gauge('idempotency_durable_log_pending', len(self._writes))
+
+    async def _log(self, record: IdempotencyRecord) -> None:
+        created, _ = await self.durable.reserve(
+            IdempotencyRecord(
+                key=record.key,
+                operation=record.operation,
+                fingerprint=record.fingerprint,
+                state=IdempotencyState.PROCESSING,
+            )
+        )
+        if not created:
+            # A chave ja estava no SQL: o Redis a perdeu (expiracao ou flush) antes do replay.
+            metrics_registry.increment_counter('idempotency_durable_conflicts_total')
+            logger.warning('Chave de idempotencia ja registrada no log duravel')
+            return
+        await self._write_state(record.key, record.state, record.response)
+
+    async def _write_state(
+        self, key: str, state: IdempotencyState, response: dict[str, Any] | None
+    ) -> None:
+        if state is IdempotencyState.COMPLETED and response is not None:
+            await self.durable.complete(key, response)
+        else:
+            await self.durable.mark_unknown(key)
+
+    def _write_done(self, task: asyncio.Task[None]) -> None:
+        self._writes.discard(task)
+        metrics_registry.set_gauge('idempotency_durable_log_pending', len(self._writes))
+        if not task.cancelled() and task.exception() is not None:
+            metrics_registry.increment_counter('idempotency_durable_log_failed_total')
+            logger.warning('Falha ao gravar desfecho de idempotencia no log duravel')
+
+    async def _execute(self, command: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            started = self._policy.start()
+        except CircuitBreakerOpenError as exc:
+            raise TransientIntegrationError('Circuito do Redis aberto') from exc
+        try:
+            async with asyncio.timeout(self._policy.timeout_seconds):
+                result = await command()
+        except Exception as exc:
+            self._policy.failure(started)
+            raise TransientIntegrationError('Falha ao acessar idempotencia no Redis') from exc
+        self._policy.success(started)
+        return result
+
+    def _key(self, key: str) -> str:
+        return f'{self.key_prefix}{key}'
+
+    def _track(self, key: str, record: IdempotencyRecord | None) -> None:
+        # Chamadas canceladas entre a reserva e o desfecho nao voltam aqui; limita o que sobra.
+        if len(self._reserved) >= self.MAX_TRACKED_KEYS:
+            del self._reserved[next(iter(self._reserved))]
+        self._reserved[key] = record
+
+
+def _to_payload(record: IdempotencyRecord) -> dict[str, Any]:
+    return {
+        'operation': record.operation,
+        'fingerprint': record.fingerprint,
+        'state': record.state.value,
+        'response': record.response,
+    }
+
+
+def _from_payload(key: str, payload: Any) -> IdempotencyRecord:
+    if not isinstance(payload, dict):
+        raise InfrastructureError('Registro de idempotencia invalido no Redis')
+    return IdempotencyRecord(
+        key=key,
+        operation=str(payload.get('operation')),
+        fingerprint=str(payload.get('fingerprint')),
+        state=IdempotencyState(str(payload.get('state'))),
+        response=payload.get('response'),
+    )
@@ -21,5 +21,11 @@ class MongoTelemetryRepository(DocumentTelemetryRepositoryPort):
     async def save(self, reading: TelemetryReading) -> None:
         await self.collection.insert_one(asdict(reading))
 
+    async def save_many(self, readings: list[TelemetryReading]) -> None:
+        if readings:
+            await self.collection.insert_many(
+                [asdict(reading) for reading in readings], ordered=False
+            )
+
     async def close(self) -> None:
         await self.client.close()
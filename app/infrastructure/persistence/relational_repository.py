@@ -2,10 +2,32 @@ from __future__ import annotations
 
 import time
 import uuid
-from datetime import UTC, datetime
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, Float, Index, String, select, text
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    ColumnElement,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
@@ -16,14 +38,20 @@ from app.core.settings import Settings
 from app.domain.entities.models import (
     IdempotencyRecord,
     IdempotencyState,
+    MetricStats,
     OutboxEvent,
     OutboxState,
+    TelemetryAggregate,
+    TelemetryBucket,
+    TelemetryCursor,
+    TelemetryPage,
     TelemetryReading,
 )
 from app.domain.ports.interfaces import (
     IdempotencyRepositoryPort,
     RelationalTelemetryRepositoryPort,
 )
+from app.infrastructure.serialization import json_serializer
 
 
 class Base(DeclarativeBase):
@@ -49,6 +77,7 @@ class TelemetryORM(Base):
 
 class IdempotencyORM(Base):
     __tablename__ = 'idempotency_records'
+    __table_args__ = (Index('ix_idempotency_operation_created', 'operation', 'created_at'),)
 
     key: Mapped[str] = mapped_column(String(128), primary_key=True)
     operation: Mapped[str] = mapped_column(String(128), nullable=False)
@@ -66,6 +95,52 @@ class IdempotencyORM(Base):
     )
 
 
+class TelemetryArchiveORM(Base):
+    """Leituras brutas antigas movidas pela retencao; os rollups seguem cobrindo o periodo."""
+
+    __tablename__ = 'telemetry_readings_archive'
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    device_id: Mapped[str] = mapped_column(String(128))
+    moisture: Mapped[float] = mapped_column(Float)
+    temperature: Mapped[float] = mapped_column(Float)
+    ph: Mapped[float] = mapped_column(Float)
+    captured_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    metadata_json: Mapped[dict[str, Any]] = mapped_column('metadata', JSON, default=dict)
+
+    __table_args__ = (Index('ix_telemetry_archive_device_captured', 'device_id', 'captured_at'),)
+
+
+class _RollupColumns:
+    device_id: Mapped[str] = mapped_column(String(128), primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    count: Mapped[int] = mapped_column(nullable=False)
+    moisture_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    moisture_min: Mapped[float] = mapped_column(Float, nullable=False)
+    moisture_max: Mapped[float] = mapped_column(Float, nullable=False)
+    temperature_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    temperature_min: Mapped[float] = mapped_column(Float, nullable=False)
+    temperature_max: Mapped[float] = mapped_column(Float, nullable=False)
+    ph_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    ph_min: Mapped[float] = mapped_column(Float, nullable=False)
+    ph_max: Mapped[float] = mapped_column(Float, nullable=False)
+
+
+class TelemetryHourlyRollupORM(_RollupColumns, Base):
+    __tablename__ = 'telemetry_rollup_hourly'
+
+
+class TelemetryDailyRollupORM(_RollupColumns, Base):
+    __tablename__ = 'telemetry_rollup_daily'
+
+
+ROLLUP_TABLES: dict[TelemetryBucket, type[_RollupColumns]] = {
+    TelemetryBucket.HOUR: TelemetryHourlyRollupORM,
+    TelemetryBucket.DAY: TelemetryDailyRollupORM,
+}
+ROLLUP_METRICS = ('moisture', 'temperature', 'ph')
+
+
 class OutboxORM(Base):
     __tablename__ = 'outbox_events'
 
@@ -78,16 +153,88 @@ class OutboxORM(Base):
     attempt_count: Mapped[int] = mapped_column(default=0, nullable=False)
 
 
+class _MetricAccumulator:
+    __slots__ = ('maximum', 'minimum', 'total')
+
+    def __init__(self) -> None:
+        self.minimum = float('inf')
+        self.maximum = float('-inf')
+        self.total = 0.0
+
+    def add(self, value: float) -> None:
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.total += value
+
+    def stats(self, count: int) -> MetricStats:
+        return MetricStats(self.minimum, self.maximum, self.total / count)
+
+    def rollup_columns(self, metric: str) -> dict[str, float]:
+        return {
+            f'{metric}_sum': self.total,
+            f'{metric}_min': self.minimum,
+            f'{metric}_max': self.maximum,
+        }
+
+
+class _BucketStats:
+    """Acumulador de passada unica para o fallback de agregacao em Python."""
+
+    __slots__ = ('count', 'moisture', 'ph', 'temperature')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.moisture = _MetricAccumulator()
+        self.temperature = _MetricAccumulator()
+        self.ph = _MetricAccumulator()
+
+    def add(self, reading: TelemetryReading) -> None:
+        self.count += 1
+        self.moisture.add(reading.moisture)
+        self.temperature.add(reading.temperature)
+        self.ph.add(reading.ph)
+
+    def to_aggregate(self, bucket_start: datetime) -> TelemetryAggregate:
+        return TelemetryAggregate(
+            bucket_start=bucket_start,
+            count=self.count,
+            moisture=self.moisture.stats(self.count),
+            temperature=self.temperature.stats(self.count),
+            ph=self.ph.stats(self.count),
+        )
+
+    def to_rollup_row(self, device_id: str, bucket_start: datetime) -> dict[str, Any]:
+        return {
+            'device_id': device_id,
+            'bucket_start': bucket_start,
+            'count': self.count,
+            **self.moisture.rollup_columns('moisture'),
+            **self.temperature.rollup_columns('temperature'),
+            **self.ph.rollup_columns('ph'),
+        }
+
+
 class SqlAlchemyTelemetryRepository(RelationalTelemetryRepositoryPort, IdempotencyRepositoryPort):
     def __init__(self, settings: Settings) -> None:
         self.engine = create_async_engine(
-            settings.relational_db_url, echo=False, pool_pre_ping=True
+            settings.relational_db_url,
+            echo=False,
+            pool_pre_ping=True,
+            json_serializer=json_serializer(settings.payload_codec),
         )
         self.session_factory = async_sessionmaker(
             self.engine,
             expire_on_commit=False,
             class_=AsyncSession,
         )
+        self.rollups_enabled = settings.telemetry_rollups_enabled
+        self.idempotency_default_retention = timedelta(
+            hours=settings.idempotency_default_retention_hours
+        )
+        self.idempotency_retention = {
+            operation: timedelta(hours=hours)
+            for operation, hours in settings.idempotency_retention_hours.items()
+        }
 
     async def init_schema(self) -> None:
         async with self.engine.begin() as connection:
@@ -102,33 +249,10 @@ class SqlAlchemyTelemetryRepository(RelationalTelemetryRepositoryPort, Idempoten
         event_id = uuid.uuid4().hex
         try:
             async with self.session_factory.begin() as session:
-                session.add(
-                    TelemetryORM(
-                        device_id=reading.device_id,
-                        moisture=reading.moisture,
-                        temperature=reading.temperature,
-                        ph=reading.ph,
-                        captured_at=reading.captured_at,
-                        metadata_json=reading.metadata,
-                    )
-                )
-                session.add(
-                    OutboxORM(
-                        event_id=event_id,
-                        event_type='telemetry.ingested',
-                        aggregate_id=reading.device_id,
-                        payload_json={
-                            'device_id': reading.device_id,
-                            'moisture': reading.moisture,
-                            'temperature': reading.temperature,
-                            'ph': reading.ph,
-                            'captured_at': reading.captured_at.isoformat(),
-                            'metadata': reading.metadata,
-                        },
-                        state=OutboxState.PENDING.value,
-                        occurred_at=reading.captured_at,
-                    )
-                )
+                session.add(TelemetryORM(**self._telemetry_row(reading)))
+                session.add(OutboxORM(**self._outbox_row(event_id, reading)))
+                if self.rollups_enabled:
+                    await self._upsert_rollups(session, [reading])
         except Exception as exc:
             metrics_registry.track_db_query(
                 'telemetry.save', time.perf_counter() - started, ok=False
@@ -137,6 +261,35 @@ class SqlAlchemyTelemetryRepository(RelationalTelemetryRepositoryPort, Idempoten
         metrics_registry.track_db_query('telemetry.save', time.perf_counter() - started)
         return event_id
 
+    async def save_many_with_outbox(self, readings: list[TelemetryReading]) -> list[str]:
+        if not readings:
+            return []
+
+        started = time.perf_counter()
+        event_ids = [uuid.uuid4().hex for _ in readings]
+        try:
+            async with self.session_factory.begin() as session:
+                await session.execute(
+                    insert(TelemetryORM),
+                    [self._telemetry_row(reading) for reading in readings],
+                )
+                await session.execute(
+                    insert(OutboxORM),
+                    [
+                        self._outbox_row(event_id, reading)
+                        for event_id, reading in zip(event_ids, readings, strict=True)
+                    ],
+                )
+                if self.rollups_enabled:
+                    await self._upsert_rollups(session, readings)
+        except Exception as exc:
+            metrics_registry.track_db_query(
+                'telemetry.save_many', time.perf_counter() - started, ok=False
+            )
+            raise InfrastructureError('Falha ao persistir lote de telemetria') from exc
+        metrics_registry.track_db_query('telemetry.save_many', time.perf_counter() - started)
+        return event_ids
+
     async def list_recent(
         self,
         limit: int = 20,
@@ -159,18 +312,375 @@ class SqlAlchemyTelemetryRepository(RelationalTelemetryRepositoryPort, Idempoten
             raise InfrastructureError('Falha ao consultar telemetria') from exc
         metrics_registry.track_db_query('telemetry.list_recent', time.perf_counter() - started)
 
+        return [self._to_reading(item) for item in items]
+
+    async def list_page(
+        self,
+        device_id: str,
+        *,
+        limit: int,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: TelemetryCursor | None = None,
+    ) -> TelemetryPage:
+        started = time.perf_counter()
+        statement = (
+            select(TelemetryORM)
+            .where(TelemetryORM.device_id == device_id)
+            .order_by(TelemetryORM.captured_at.desc(), TelemetryORM.id.desc())
+            .limit(limit + 1)
+        )
+        if since is not None:
+            statement = statement.where(TelemetryORM.captured_at >= self._as_utc(since))
+        if until is not None:
+            statement = statement.where(TelemetryORM.captured_at < self._as_utc(until))
+        if after is not None:
+            statement = statement.where(
+                tuple_(TelemetryORM.captured_at, TelemetryORM.id)
+                < tuple_(
+                    literal(self._as_utc(after.captured_at), DateTime(timezone=True)),
+                    literal(after.reading_id),
+                )
+            )
+
+        try:
+            async with self.session_factory() as session:
+                items = (await session.scalars(statement)).all()
+        except Exception as exc:
+            metrics_registry.track_db_query(
+                'telemetry.list_page', time.perf_counter() - started, ok=False
+            )
+            raise InfrastructureError('Falha ao consultar historico de telemetria') from exc
+        metrics_registry.track_db_query('telemetry.list_page', time.perf_counter() - started)
+
+        page = items[:limit]
+        next_cursor = None
+        if len(items) > limit:
+            last = page[-1]
+            next_cursor = TelemetryCursor(self._as_utc(last.captured_at), last.id)
+        return TelemetryPage([self._to_reading(item) for item in page], next_cursor)
+
+    async def aggregate(
+        self,
+        device_id: str,
+        *,
+        bucket: TelemetryBucket,
+        since: datetime,
+        until: datetime,
+    ) -> list[TelemetryAggregate]:
+        """Agrega por janela a partir dos rollups (1h/1d) ou com `GROUP BY` sobre as leituras.
+
+        Dialetos sem expressao de bucketing agregam em Python sobre `stream_readings`.
+        """
+        if self.rollups_enabled and bucket in ROLLUP_TABLES:
+            return await self._aggregate_rollups(device_id, bucket, since, until)
+
+        bucket_expression = self._bucket_expression(bucket.seconds)
+        if bucket_expression is None:
+            return await self._aggregate_streaming(device_id, bucket, since, until)
+
+        started = time.perf_counter()
+        bucket_start = bucket_expression.label('bucket_start')
+        columns = [
+            TelemetryORM.moisture,
+            TelemetryORM.temperature,
+            TelemetryORM.ph,
+        ]
+        statement = (
+            select(
+                bucket_start,
+                func.count().label('count'),
+                *(
+                    aggregate(column)
+                    for column in columns
+                    for aggregate in (func.min, func.max, func.avg)
+                ),
+            )
+            .where(
+                TelemetryORM.device_id == device_id,
+                TelemetryORM.captured_at >= self._as_utc(since),
+                TelemetryORM.captured_at < self._as_utc(until),
+            )
+            .group_by(bucket_start)
+            .order_by(bucket_start)
+        )
+        try:
+            async with self.session_factory() as session:
+                rows = (await session.execute(statement)).all()
+        except Exception as exc:
+            metrics_registry.track_db_query(
+                'telemetry.aggregate', time.perf_counter() - started, ok=False
+            )
+            raise InfrastructureError('Falha ao agregar telemetria') from exc
+        metrics_registry.track_db_query('telemetry.aggregate', time.perf_counter() - started)
+
         return [
-            TelemetryReading(
-                device_id=item.device_id,
-                moisture=item.moisture,
-                temperature=item.temperature,
-                ph=item.ph,
-                captured_at=self._as_utc(item.captured_at),
-                metadata=item.metadata_json,
+            TelemetryAggregate(
+                bucket_start=datetime.fromtimestamp(int(row[0]), UTC),
+                count=int(row[1]),
+                moisture=MetricStats(float(row[2]), float(row[3]), float(row[4])),
+                temperature=MetricStats(float(row[5]), float(row[6]), float(row[7])),
+                ph=MetricStats(float(row[8]), float(row[9]), float(row[10])),
             )
-            for item in items
+            for row in rows
         ]
 
+    async def _aggregate_rollups(
+        self,
+        device_id: str,
+        bucket: TelemetryBucket,
+        since: datetime,
+        until: datetime,
+    ) -> list[TelemetryAggregate]:
+        """Le as janelas completas que intersectam `[since, until)`."""
+        started = time.perf_counter()
+        table = ROLLUP_TABLES[bucket]
+        statement = (
+            select(table)
+            .where(
+                table.device_id == device_id,
+                table.bucket_start >= self._bucket_floor(since, bucket),
+                table.bucket_start < self._as_utc(until),
+            )
+            .order_by(table.bucket_start)
+        )
+        try:
+            async with self.session_factory() as session:
+                rows = (await session.scalars(statement)).all()
+        except Exception as exc:
+            metrics_registry.track_db_query(
+                'telemetry.aggregate_rollup', time.perf_counter() - started, ok=False
+            )
+            raise InfrastructureError('Falha ao agregar telemetria') from exc
+        metrics_registry.track_db_query('telemetry.aggregate_rollup', time.perf_counter() - started)
+
+        return [
+            TelemetryAggregate(
+                bucket_start=self._as_utc(row.bucket_start),
+                count=row.count,
+                moisture=MetricStats(
+                    row.moisture_min, row.moisture_max, row.moisture_sum / row.count
+                ),
+                temperature=MetricStats(
+                    row.temperature_min, row.temperature_max, row.temperature_sum / row.count
+                ),
+                ph=MetricStats(row.ph_min, row.ph_max, row.ph_sum / row.count),
+            )
+            for row in rows
+        ]
+
+    async def rebuild_rollups(
+        self,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        batch_size: int = 5_000,
+    ) -> int:
+        """Recalcula os rollups a partir das leituras brutas, alinhando o intervalo a dias UTC.
+
+        Deve rodar com a ingestao pausada: leituras gravadas durante o rebuild podem ser
+        contadas duas vezes ou omitidas.
+        """
+        if since is not None:
+            since = self._bucket_floor(since, TelemetryBucket.DAY)
+        if until is not None:
+            day_start = self._bucket_floor(until, TelemetryBucket.DAY)
+            until = day_start if day_start == self._as_utc(until) else day_start + timedelta(days=1)
+        try:
+            async with self.session_factory.begin() as session:
+                for table in ROLLUP_TABLES.values():
+                    statement = delete(table)
+                    if since is not None:
+                        statement = statement.where(table.bucket_start >= since)
+                    if until is not None:
+                        statement = statement.where(table.bucket_start < until)
+                    await session.execute(statement)
+        except Exception as exc:
+            raise InfrastructureError('Falha ao recalcular rollups de telemetria') from exc
+
+        processed = 0
+        pending: list[TelemetryReading] = []
+        async for reading in self.stream_readings(since=since, until=until):
+            pending.append(reading)
+            if len(pending) >= batch_size:
+                processed += await self._flush_rollups(pending)
+                pending = []
+        if pending:
+            processed += await self._flush_rollups(pending)
+        return processed
+
+    async def _flush_rollups(self, readings: list[TelemetryReading]) -> int:
+        try:
+            async with self.session_factory.begin() as session:
+                await self._upsert_rollups(session, readings)
+        except Exception as exc:
+            raise InfrastructureError('Falha ao recalcular rollups de telemetria') from exc
+        return len(readings)
+
+    async def _upsert_rollups(
+        self, session: AsyncSession, readings: list[TelemetryReading]
+    ) -> None:
+        """Soma o lote aos rollups horario e diario na transacao corrente."""
+        dialect = self._dialect_name()
+        for bucket, table in ROLLUP_TABLES.items():
+            rows = self._rollup_rows(readings, bucket)
+            if dialect in ('sqlite', 'postgresql'):
+                await session.execute(self._rollup_upsert(dialect, table, rows))
+                continue
+            for row in rows:
+                current = await session.get(table, (row['device_id'], row['bucket_start']))
+                if current is None:
+                    session.add(table(**row))
+                    continue
+                current.count += row['count']
+                for metric in ROLLUP_METRICS:
+                    setattr(
+                        current,
+                        f'{metric}_sum',
+                        getattr(current, f'{metric}_sum') + row[f'{metric}_sum'],
+                    )
+                    setattr(
+                        current,
+                        f'{metric}_min',
+                        min(getattr(current, f'{metric}_min'), row[f'{metric}_min']),
+                    )
+                    setattr(
+                        current,
+                        f'{metric}_max',
+                        max(getattr(current, f'{metric}_max'), row[f'{metric}_max']),
+                    )
+
+    @staticmethod
+    def _rollup_upsert(
+        dialect: str, table: type[_RollupColumns], rows: list[dict[str, Any]]
+    ) -> Any:
+        insert_factory = sqlite_insert if dialect == 'sqlite' else postgresql_insert
+        lowest, highest = (
+            (func.min, func.max) if dialect == 'sqlite' else (func.least, func.greatest)
+        )
+        statement = insert_factory(table).values(rows)
+        excluded = statement.excluded
+        updates: dict[str, Any] = {'count': table.count + excluded['count']}
+        for metric in ROLLUP_METRICS:
+            updates[f'{metric}_sum'] = getattr(table, f'{metric}_sum') + excluded[f'{metric}_sum']
+            updates[f'{metric}_min'] = lowest(
+                getattr(table, f'{metric}_min'), excluded[f'{metric}_min']
+            )
+            updates[f'{metric}_max'] = highest(
+                getattr(table, f'{metric}_max'), excluded[f'{metric}_max']
+            )
+        return statement.on_conflict_do_update(
+            index_elements=['device_id', 'bucket_start'], set_=updates
+        )
+
+    @classmethod
+    def _rollup_rows(
+        cls, readings: list[TelemetryReading], bucket: TelemetryBucket
+    ) -> list[dict[str, Any]]:
+        grouped: dict[tuple[str, datetime], _BucketStats] = {}
+        for reading in readings:
+            key = (reading.device_id, cls._bucket_floor(reading.captured_at, bucket))
+            stats = grouped.get(key)
+            if stats is None:
+                stats = grouped[key] = _BucketStats()
+            stats.add(reading)
+        return [
+            stats.to_rollup_row(device_id, bucket_start)
+            for (device_id, bucket_start), stats in grouped.items()
+        ]
+
+    def _dialect_name(self) -> str:
+        return self.engine.dialect.name
+
+    @classmethod
+    def _bucket_floor(cls, value: datetime, bucket: TelemetryBucket) -> datetime:
+        epoch = int(cls._as_utc(value).timestamp())
+        return datetime.fromtimestamp(epoch // bucket.seconds * bucket.seconds, UTC)
+
+    def _bucket_expression(self, bucket_seconds: int) -> ColumnElement[int] | None:
+        """Inicio da janela em segundos epoch UTC, ou None quando o dialeto nao e suportado."""
+        dialect = self._dialect_name()
+        if dialect == 'sqlite':
+            epoch = cast(func.strftime('%s', TelemetryORM.captured_at), Integer)
+        elif dialect == 'postgresql':
+            epoch = cast(func.floor(func.extract('epoch', TelemetryORM.captured_at)), BigInteger)
+        else:
+            return None
+        # Literal inline: o mesmo texto aparece no SELECT e no GROUP BY em qualquer driver.
+        width = literal(bucket_seconds, Integer, literal_execute=True)
+        return epoch // width * width
+
+    async def _aggregate_streaming(
+        self,
+        device_id: str,
+        bucket: TelemetryBucket,
+        since: datetime,
+        until: datetime,
+    ) -> list[TelemetryAggregate]:
+        buckets: dict[int, _BucketStats] = {}
+        async for reading in self.stream_readings(device_id, since=since, until=until):
+            start = int(reading.captured_at.timestamp()) // bucket.seconds * bucket.seconds
+            stats = buckets.get(start)
+            if stats is None:
+                stats = buckets[start] = _BucketStats()
+            stats.add(reading)
+        return [
+            buckets[start].to_aggregate(datetime.fromtimestamp(start, UTC))
+            for start in sorted(buckets)
+        ]
+
+    async def stream_readings(
+        self,
+        device_id: str | None = None,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        batch_size: int = 1_000,
+    ) -> AsyncIterator[TelemetryReading]:
+        """Percorre o historico em ordem cronologica com cursor de servidor e `yield_per`.
+
+        Seleciona colunas em vez de entidades para nao acumular objetos no identity map.
+        """
+        started = time.perf_counter()
+        statement = (
+            select(
+                TelemetryORM.device_id,
+                TelemetryORM.moisture,
+                TelemetryORM.temperature,
+                TelemetryORM.ph,
+                TelemetryORM.captured_at,
+                TelemetryORM.metadata_json,
+            )
+            .order_by(TelemetryORM.captured_at, TelemetryORM.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if device_id:
+            statement = statement.where(TelemetryORM.device_id == device_id)
+        if since is not None:
+            statement = statement.where(TelemetryORM.captured_at >= self._as_utc(since))
+        if until is not None:
+            statement = statement.where(TelemetryORM.captured_at < self._as_utc(until))
+
+        try:
+            async with self.session_factory() as session:
+                result = await session.stream(statement)
+                async for partition in result.partitions():
+                    for row in partition:
+                        yield TelemetryReading(
+                            device_id=row.device_id,
+                            moisture=row.moisture,
+                            temperature=row.temperature,
+                            ph=row.ph,
+                            captured_at=self._as_utc(row.captured_at),
+                            metadata=row.metadata_json,
+                        )
+        except Exception as exc:
+            metrics_registry.track_db_query(
+                'telemetry.export', time.perf_counter() - started, ok=False
+            )
+            raise InfrastructureError('Falha ao exportar telemetria') from exc
+        metrics_registry.track_db_query('telemetry.export', time.perf_counter() - started)
+
     async def list_pending_outbox(self, limit: int = 100) -> list[OutboxEvent]:
         statement = (
             select(OutboxORM)
@@ -180,18 +690,73 @@ class SqlAlchemyTelemetryRepository(RelationalTelemetryRepositoryPort, Idempoten
         )
         async with self.session_factory() as session:
             items = (await session.scalars(statement)).all()
-        return [
-            OutboxEvent(
-                event_id=item.event_id,
-                event_type=item.event_type,
-                aggregate_id=item.aggregate_id,
-                payload=item.payload_json,
-                state=OutboxState(item.state),
-                occurred_at=self._as_utc(item.occurred_at),
-                attempt_count=item.attempt_count,
+        return [self._to_outbox_event(item) for item in items]
+
+    async def claim_pending_outbox(self, limit: int = 100) -> list[OutboxEvent]:
+        started = time.perf_counter()
+        pending = (
+            select(OutboxORM.event_id)
+            .where(OutboxORM.state == OutboxState.PENDING.value)
+            .order_by(OutboxORM.occurred_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        statement = (
+            update(OutboxORM)
+            .where(OutboxORM.event_id.in_(pending))
+            .values(
+                state=OutboxState.CLAIMED.value,
+                attempt_count=OutboxORM.attempt_count + 1,
             )
-            for item in items
-        ]
+            .returning(OutboxORM)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            async with self.session_factory.begin() as session:
+                items = (await session.scalars(statement)).all()
+                claimed = sorted(
+                    (self._to_outbox_event(item) for item in items),
+                    key=lambda event: event.occurred_at,
+                )
+        except Exception as exc:
+            metrics_registry.track_db_query('outbox.claim', time.perf_counter() - started, ok=False)
+            raise InfrastructureError('Falha ao reservar eventos outbox') from exc
+        metrics_registry.track_db_query('outbox.claim', time.perf_counter() - started)
+        return claimed
+
+    async def release_outbox(self, event_ids: list[str]) -> None:
+        if not event_ids:
+            return
+
+        statement = (
+            update(OutboxORM)
+            .where(
+                OutboxORM.event_id.in_(event_ids),
+                OutboxORM.state == OutboxState.CLAIMED.value,
+            )
+            .values(state=OutboxState.PENDING.value)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            async with self.session_factory.begin() as session:
+                await session.execute(statement)
+        except Exception as exc:
+            raise InfrastructureError('Falha ao liberar eventos outbox') from exc
+
+    async def requeue_claimed_outbox(self) -> int:
+        statement = (
+            update(OutboxORM)
+            .where(OutboxORM.state == OutboxState.CLAIMED.value)
+            .values(state=OutboxState.PENDING.value)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            async with self.session_factory.begin() as session:
+                result = await session.execute(statement)
+        except Exception as exc:
+            raise InfrastructureError('Falha ao devolver eventos outbox reservados') from exc
+        return int(getattr(result, 'rowcount', 0) or 0)
 
     async def mark_outbox_published(self, event_id: str) -> None:
         async with self.session_factory.begin() as session:
@@ -201,8 +766,147 @@ class SqlAlchemyTelemetryRepository(RelationalTelemetryRepositoryPort, Idempoten
             existing.state = OutboxState.PUBLISHED.value
             existing.attempt_count += 1
 
+    async def mark_outbox_published_many(self, event_ids: list[str]) -> None:
+        if not event_ids:
+            return
+
+        started = time.perf_counter()
+        statement = (
+            update(OutboxORM)
+            .where(OutboxORM.event_id.in_(event_ids))
+            .values(
+                state=OutboxState.PUBLISHED.value,
+                attempt_count=OutboxORM.attempt_count + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            async with self.session_factory.begin() as session:
+                await session.execute(statement)
+        except Exception as exc:
+            metrics_registry.track_db_query(
+                'outbox.mark_published', time.perf_counter() - started, ok=False
+            )
+            raise InfrastructureError('Falha ao marcar eventos outbox publicados') from exc
+        metrics_registry.track_db_query('outbox.mark_published', time.perf_counter() - started)
+
+    async def purge_published_outbox(self, older_than: datetime, limit: int = 1_000) -> int:
+        """Apaga ate `limit` eventos ja publicados anteriores a `older_than`."""
+        started = time.perf_counter()
+        expired = (
+            select(OutboxORM.event_id)
+            .where(
+                OutboxORM.state == OutboxState.PUBLISHED.value,
+                OutboxORM.occurred_at < self._as_utc(older_than),
+            )
+            .limit(limit)
+        )
+        statement = (
+            delete(OutboxORM)
+            .where(OutboxORM.event_id.in_(expired.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            async with self.session_factory.begin() as session:
+                result = await session.execute(statement)
+        except Exception as exc:
+            metrics_registry.track_db_query('outbox.purge', time.perf_counter() - started, ok=False)
+            raise InfrastructureError('Falha ao expurgar eventos outbox publicados') from exc
+        metrics_registry.track_db_query('outbox.purge', time.perf_counter() - started)
+        return int(getattr(result, 'rowcount', 0) or 0)
+
+    async def archive_telemetry(self, older_than: datetime, limit: int = 1_000) -> int:
+        """Move ate `limit` leituras anteriores a `older_than` para a tabela de arquivo."""
+        started = time.perf_counter()
+        columns = [
+            TelemetryORM.id,
+            TelemetryORM.device_id,
+            TelemetryORM.moisture,
+            TelemetryORM.temperature,
+            TelemetryORM.ph,
+            TelemetryORM.captured_at,
+            TelemetryORM.metadata_json,
+        ]
+        try:
+            async with self.session_factory.begin() as session:
+                ids = list(
+                    (
+                        await session.scalars(
+                            select(TelemetryORM.id)
+                            .where(TelemetryORM.captured_at < self._as_utc(older_than))
+                            .order_by(TelemetryORM.captured_at)
+                            .limit(limit)
+                            .with_for_update(skip_locked=True)
+                        )
+                    ).all()
+                )
+                if ids:
+                    await session.execute(
+                        insert(TelemetryArchiveORM).from_select(
+                            [getattr(TelemetryArchiveORM, column.key) for column in columns],
+                            select(*columns).where(TelemetryORM.id.in_(ids)),
+                        )
+                    )
+                    await session.execute(
+                        delete(TelemetryORM)
+                        .where(TelemetryORM.id.in_(ids))
+                        .execution_options(synchronize_session=False)
+                    )
+        except Exception as exc:
+            metrics_registry.track_db_query(
+                'telemetry.archive', time.perf_counter() - started, ok=False
+            )
+            raise InfrastructureError('Falha ao arquivar telemetria antiga') from exc
+        metrics_registry.track_db_query('telemetry.archive', time.perf_counter() - started)
+        return len(ids)
+
     async def reserve(self, record: IdempotencyRecord) -> tuple[bool, IdempotencyRecord]:
         started = time.perf_counter()
+        try:
+            created = await self._insert_idempotency(record)
+            existing = record if created else await self._get_idempotency(record.key)
+            if not created and self._idempotency_is_expired(existing):
+                # Registro vencido que o sweeper ainda nao removeu: vale como primeiro uso.
+                await self._delete_expired_idempotency(record.key)
+                created = await self._insert_idempotency(record)
+                existing = record if created else await self._get_idempotency(record.key)
+        except InfrastructureError:
+            metrics_registry.track_db_query(
+                'idempotency.reserve', time.perf_counter() - started, ok=False
+            )
+            raise
+        except Exception as exc:
+            metrics_registry.track_db_query(
+                'idempotency.reserve',
+                time.perf_counter() - started,
+                ok=False,
+            )
+            raise InfrastructureError('Falha ao reservar idempotencia') from exc
+
+        metrics_registry.track_db_query('idempotency.reserve', time.perf_counter() - started)
+        return created, existing
+
+    async def purge_expired_idempotency(self, now: datetime, limit: int = 1_000) -> int:
+        """Apaga ate `limit` registros de idempotencia alem da retencao da sua operacao."""
+        started = time.perf_counter()
+        expired = select(IdempotencyORM.key).where(self._idempotency_expired(now)).limit(limit)
+        statement = (
+            delete(IdempotencyORM)
+            .where(IdempotencyORM.key.in_(expired.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            async with self.session_factory.begin() as session:
+                result = await session.execute(statement)
+        except Exception as exc:
+            metrics_registry.track_db_query(
+                'idempotency.purge', time.perf_counter() - started, ok=False
+            )
+            raise InfrastructureError('Falha ao expurgar registros de idempotencia') from exc
+        metrics_registry.track_db_query('idempotency.purge', time.perf_counter() - started)
+        return int(getattr(result, 'rowcount', 0) or 0)
+
+    async def _insert_idempotency(self, record: IdempotencyRecord) -> bool:
         try:
             async with self.session_factory.begin() as session:
                 session.add(
@@ -215,19 +919,36 @@ class SqlAlchemyTelemetryRepository(RelationalTelemetryRepositoryPort, Idempoten
                 )
                 await session.flush()
         except IntegrityError:
-            existing = await self._get_idempotency(record.key)
-            metrics_registry.track_db_query('idempotency.reserve', time.perf_counter() - started)
-            return False, existing
-        except Exception as exc:
-            metrics_registry.track_db_query(
-                'idempotency.reserve',
-                time.perf_counter() - started,
-                ok=False,
-            )
-            raise InfrastructureError('Falha ao reservar idempotencia') from exc
+            return False
+        return True
 
-        metrics_registry.track_db_query('idempotency.reserve', time.perf_counter() - started)
-        return True, record
+    async def _delete_expired_idempotency(self, key: str) -> None:
+        statement = delete(IdempotencyORM).where(
+            IdempotencyORM.key == key, self._idempotency_expired(datetime.now(UTC))
+        )
+        async with self.session_factory.begin() as session:
+            await session.execute(statement)
+
+    def _idempotency_is_expired(self, record: IdempotencyRecord) -> bool:
+        if record.created_at is None:
+            return False
+        retention = self.idempotency_retention.get(
+            record.operation, self.idempotency_default_retention
+        )
+        return self._as_utc(record.created_at) < datetime.now(UTC) - retention
+
+    def _idempotency_expired(self, now: datetime) -> ColumnElement[bool]:
+        """Filtro dos registros vencidos: retencao da operacao ou, sem ela, a padrao."""
+        now = self._as_utc(now)
+        conditions = [
+            (IdempotencyORM.operation == operation) & (IdempotencyORM.created_at < now - retention)
+            for operation, retention in self.idempotency_retention.items()
+        ]
+        conditions.append(
+            IdempotencyORM.operation.not_in(list(self.idempotency_retention))
+            & (IdempotencyORM.created_at < now - self.idempotency_default_retention)
+        )
+        return or_(*conditions)
 
     async def complete(self, key: str, response: dict[str, Any]) -> None:
         await self._update_idempotency(key, IdempotencyState.COMPLETED, response)
@@ -246,6 +967,7 @@ class SqlAlchemyTelemetryRepository(RelationalTelemetryRepositoryPort, Idempoten
             fingerprint=existing.fingerprint,
             state=IdempotencyState(existing.state),
             response=existing.response_json,
+            created_at=existing.created_at,
         )
 
     async def _update_idempotency(
@@ -275,6 +997,59 @@ class SqlAlchemyTelemetryRepository(RelationalTelemetryRepositoryPort, Idempoten
             raise InfrastructureError('Falha ao atualizar idempotencia') from exc
         metrics_registry.track_db_query('idempotency.update', time.perf_counter() - started)
 
+    @classmethod
+    def _to_outbox_event(cls, item: OutboxORM) -> OutboxEvent:
+        return OutboxEvent(
+            event_id=item.event_id,
+            event_type=item.event_type,
+            aggregate_id=item.aggregate_id,
+            payload=item.payload_json,
+            state=OutboxState(item.state),
+            occurred_at=cls._as_utc(item.occurred_at),
+            attempt_count=item.attempt_count,
+        )
+
+    @staticmethod
+    def _telemetry_row(reading: TelemetryReading) -> dict[str, Any]:
+        return {
+            'device_id': reading.device_id,
+            'moisture': reading.moisture,
+            'temperature': reading.temperature,
+            'ph': reading.ph,
+            'captured_at': reading.captured_at,
+            'metadata_json': reading.metadata,
+        }
+
+    @staticmethod
+    def _outbox_row(event_id: str, reading: TelemetryReading) -> dict[str, Any]:
+        return {
+            'event_id': event_id,
+            'event_type': 'telemetry.ingested',
+            'aggregate_id': reading.device_id,
+            'payload_json': {
+                'device_id': reading.device_id,
+                'moisture': reading.moisture,
+                'temperature': reading.temperature,
+                'ph': reading.ph,
+                'captured_at': reading.captured_at.isoformat(),
+                'metadata': reading.metadata,
+            },
+            'state': OutboxState.PENDING.value,
+            'occurred_at': reading.captured_at,
+            'attempt_count': 0,
+        }
+
+    @classmethod
+    def _to_reading(cls, item: TelemetryORM) -> TelemetryReading:
+        return TelemetryReading(
+            device_id=item.device_id,
+            moisture=item.moisture,
+            temperature=item.temperature,
+            ph=item.ph,
+            captured_at=cls._as_utc(item.captured_at),
+            metadata=item.metadata_json,
+        )
+
     @staticmethod
     def _as_utc(value: datetime) -> datetime:
         if value.tzinfo is None:
@@ -0,0 +1,125 @@
+"""Codecs de payload para cache e mensageria.
+
+Payloads JSON (stdlib ou orjson) sao gravados sem cabecalho e continuam legiveis por
+consumidores antigos. Formatos binarios levam um byte de versao no inicio, que nunca colide
+com o primeiro byte de um documento JSON; `decode_payload` reconhece os dois formatos, o que
+permite trocar o codec aos poucos durante o rollout.
+"""
+
+import importlib
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from datetime import date, datetime
+from types import ModuleType
+from typing import Any
+
+from app.core.settings import PayloadCodecName
+
+MSGPACK_V1 = 0x01
+
+
+def _optional_module(name: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+_orjson = _optional_module('orjson')
+_msgpack = _optional_module('msgpack')
+
+
+def _require(module: ModuleType | None, name: str) -> ModuleType:
+    if module is None:
+        raise ImportError(f'O codec {name} exige o pacote {name}: pip install ".[codecs]"')
+    return module
+
+
+class PayloadCodec(ABC):
+    name: PayloadCodecName
+    content_type: str
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes: ...
+
+    def decode(self, data: bytes | str) -> Any:
+        return decode_payload(data)
+
+
+class JsonCodec(PayloadCodec):
+    name = PayloadCodecName.JSON
+    content_type = 'application/json'
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, default=str).encode('utf-8')
+
+
+class OrjsonCodec(PayloadCodec):
+    name = PayloadCodecName.ORJSON
+    content_type = 'application/json'
+
+    def __init__(self) -> None:
+        self._orjson = _require(_orjson, 'orjson')
+        self._options = self._orjson.OPT_NON_STR_KEYS
+
+    def encode(self, value: Any) -> bytes:
+        encoded: bytes = self._orjson.dumps(value, default=str, option=self._options)
+        return encoded
+
+
+class MsgpackCodec(PayloadCodec):
+    name = PayloadCodecName.MSGPACK
+    content_type = 'application/vnd.hortelan.msgpack; v=1'
+
+    def __init__(self) -> None:
+        self._msgpack = _require(_msgpack, 'msgpack')
+
+    def encode(self, value: Any) -> bytes:
+        body: bytes = self._msgpack.packb(value, default=_msgpack_default, use_bin_type=True)
+        return bytes((MSGPACK_V1,)) + body
+
+
+def _msgpack_default(value: Any) -> str:
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    return str(value)
+
+
+_CODECS: dict[PayloadCodecName, type[PayloadCodec]] = {
+    PayloadCodecName.JSON: JsonCodec,
+    PayloadCodecName.ORJSON: OrjsonCodec,
+    PayloadCodecName.MSGPACK: MsgpackCodec,
+}
+
+
+def build_codec(name: PayloadCodecName) -> PayloadCodec:
+    return _CODECS[name]()
+
+
+def decode_payload(data: bytes | str) -> Any:
+    """Decodifica qualquer formato suportado; entrada malformada gera `ValueError`."""
+    if isinstance(data, str):
+        return json.loads(data)
+    if data[:1] == bytes((MSGPACK_V1,)):
+        try:
+            return _require(_msgpack, 'msgpack').unpackb(data[1:], raw=False)
+        except ImportError:
+            raise
+        except Exception as exc:
+            raise ValueError('Payload msgpack invalido') from exc
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def json_serializer(name: PayloadCodecName) -> Callable[[Any], str]:
+    """Serializador das colunas JSON do SQLAlchemy; orjson so quando for o codec escolhido."""
+    if name is not PayloadCodecName.ORJSON:
+        return json.dumps
+    codec = OrjsonCodec()
+
+    def dumps(value: Any) -> str:
+        return codec.encode(value).decode('utf-8')
+
+    return dumps
@@ -53,6 +53,14 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     container = get_container()
     try:
         await container.relational_repo.init_schema()
+        if settings.telemetry_async_projection_enabled:
+            container.projection_queue.start()
+        if settings.outbox_relay_enabled:
+            container.outbox_relay.start()
+        if settings.retention_enabled:
+            container.retention_worker.start()
+        if settings.near_cache_enabled:
+            container.near_cache.start()
         logger.info('application.started', extra={'event': 'application.started'})
         yield
     finally:
@@ -95,6 +103,7 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=settings.cors_methods,
     allow_headers=settings.cors_headers,
+    expose_headers=['ETag'],
 )
 app.include_router(router)
 register_exception_handlers(app)
@@ -0,0 +1,49 @@
+"""Recalcula os rollups horario e diario de telemetria a partir das leituras brutas.
+
+Rode com a ingestao pausada (ou antes de habilitar `TELEMETRY_ROLLUPS_ENABLED`): o intervalo
+e alinhado a dias UTC, apagado e recomputado em lotes.
+
+Uso:
+    python scripts/backfill_rollups.py --since 2026-01-01 --until 2026-07-01
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime
+
+from app.core.settings import Settings
+from app.infrastructure.persistence.relational_repository import SqlAlchemyTelemetryRepository
+
+
+async def backfill(
+    settings: Settings,
+    *,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    batch_size: int = 5_000,
+) -> int:
+    repository = SqlAlchemyTelemetryRepository(settings)
+    try:
+        await repository.init_schema()
+        return await repository.rebuild_rollups(since=since, until=until, batch_size=batch_size)
+    finally:
+        await repository.engine.dispose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Recalcula rollups de telemetria.')
+    parser.add_argument('--since', type=datetime.fromisoformat, default=None)
+    parser.add_argument('--until', type=datetime.fromisoformat, default=None)
+    parser.add_argument('--batch-size', type=int, default=5_000)
+    args = parser.parse_args()
+
+    processed = await backfill(
+        Settings(), since=args.since, until=args.until, batch_size=args.batch_size
+    )
+    print(f'leituras_processadas={processed}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
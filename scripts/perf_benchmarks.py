@@ -0,0 +1,667 @@
+"""Benchmarks em processo para os caminhos criticos do backend.
+
+Diferente de `perf_baseline.py`, nao exige API em execucao: cada cenario monta os
+componentes reais necessarios (SQLite temporario, casos de uso) e substitui apenas as
+integracoes externas por adapters nulos.
+
+Uso:
+    python scripts/perf_benchmarks.py ingest --readings 2000 --batch-size 100
+    python scripts/perf_benchmarks.py fanout --requests 200 --latency-ms 5
+    python scripts/perf_benchmarks.py export --rows 1000000 --format ndjson
+    python scripts/perf_benchmarks.py snapshots --devices 500 --hit-ratio 0.8 --latency-ms 1
+    python scripts/perf_benchmarks.py codecs --readings 20000
+    python scripts/perf_benchmarks.py stampede --readers 1000 --expiries 5
+    python scripts/perf_benchmarks.py coverage --requests 2000
+    python scripts/perf_benchmarks.py routing --requests 2000
+    python scripts/perf_benchmarks.py idempotency --contenders 200 --keys 20 --latency-ms 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastapi import FastAPI
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+
+from app.api.contracts import (
+    ProductReadinessReportOut,
+    RequirementCoverageOut,
+    StrategicCoverageReportOut,
+)
+from app.application.services.coverage_service import CoverageService
+from app.application.services.idempotency_service import IdempotencyService
+from app.application.use_cases.iot.export_telemetry_use_case import ExportTelemetryUseCase
+from app.application.use_cases.iot.get_cached_telemetry_use_case import GetCachedTelemetryUseCase
+from app.application.use_cases.iot.get_device_snapshot_use_case import GetDeviceSnapshotUseCase
+from app.application.use_cases.iot.ingest_telemetry_use_case import IngestTelemetryUseCase
+from app.core.exceptions import IdempotencyInProgressError, InfrastructureError
+from app.core.settings import PayloadCodecName, Settings
+from app.domain.entities.models import (
+    IdempotencyRecord,
+    IdempotencyState,
+    TelemetryExportFormat,
+    TelemetryReading,
+)
+from app.domain.ports.interfaces import (
+    CachePort,
+    DocumentTelemetryRepositoryPort,
+    IdempotencyRepositoryPort,
+    TelemetryPublisherPort,
+)
+from app.infrastructure.adapters.redis_idempotency import RedisIdempotencyRepository
+from app.infrastructure.persistence.relational_repository import (
+    SqlAlchemyTelemetryRepository,
+    TelemetryORM,
+)
+from app.infrastructure.serialization import build_codec
+
+
+class NullPublisher(TelemetryPublisherPort):
+    async def publish_telemetry(self, reading: TelemetryReading) -> None:
+        return None
+
+    async def publish_telemetry_batch(self, readings: list[TelemetryReading]) -> list[bool]:
+        return [True] * len(readings)
+
+
+class NullDocumentRepository(DocumentTelemetryRepositoryPort):
+    async def save(self, reading: TelemetryReading) -> None:
+        return None
+
+    async def save_many(self, readings: list[TelemetryReading]) -> None:
+        return None
+
+
+class NullCache(CachePort):
+    async def set(self, key: str, value: dict[str, Any], ttl_seconds: int = 300) -> None:
+        return None
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        return None
+
+    async def set_many(self, items: dict[str, dict[str, Any]], ttl_seconds: int = 300) -> None:
+        return None
+
+    async def get_many(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        return [None] * len(keys)
+
+
+class LatencyPublisher(NullPublisher):
+    def __init__(self, latency_seconds: float) -> None:
+        self.latency_seconds = latency_seconds
+
+    async def publish_telemetry(self, reading: TelemetryReading) -> None:
+        await asyncio.sleep(_jitter(self.latency_seconds))
+
+
+class LatencyDocumentRepository(NullDocumentRepository):
+    def __init__(self, latency_seconds: float) -> None:
+        self.latency_seconds = latency_seconds
+
+    async def save(self, reading: TelemetryReading) -> None:
+        await asyncio.sleep(_jitter(self.latency_seconds))
+
+
+class LatencyCache(NullCache):
+    def __init__(self, latency_seconds: float) -> None:
+        self.latency_seconds = latency_seconds
+
+    async def set(self, key: str, value: dict[str, Any], ttl_seconds: int = 300) -> None:
+        await asyncio.sleep(_jitter(self.latency_seconds))
+
+
+class LatencyDictCache(NullCache):
+    """Cache em memoria que cobra uma latencia de rede por chamada, nao por chave."""
+
+    def __init__(self, latency_seconds: float, values: dict[str, dict[str, Any]]) -> None:
+        self.latency_seconds = latency_seconds
+        self.values = values
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        await asyncio.sleep(_jitter(self.latency_seconds))
+        return self.values.get(key)
+
+    async def get_many(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        await asyncio.sleep(_jitter(self.latency_seconds))
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key: str, value: dict[str, Any], ttl_seconds: int = 300) -> None:
+        await asyncio.sleep(_jitter(self.latency_seconds))
+        self.values[key] = value
+
+
+class CountingTelemetryRepository(SqlAlchemyTelemetryRepository):
+    fetches = 0
+
+    async def list_recent(
+        self, limit: int = 20, device_id: str | None = None
+    ) -> list[TelemetryReading]:
+        self.fetches += 1
+        return await super().list_recent(limit=limit, device_id=device_id)
+
+
+class CountingIdempotencyRepository(SqlAlchemyTelemetryRepository):
+    """Conta as transacoes SQL feitas pelo fluxo de idempotencia."""
+
+    transactions = 0
+
+    async def reserve(self, record: IdempotencyRecord) -> tuple[bool, IdempotencyRecord]:
+        self.transactions += 1
+        return await super().reserve(record)
+
+    async def _get_idempotency(self, key: str) -> IdempotencyRecord:
+        self.transactions += 1
+        return await super()._get_idempotency(key)
+
+    async def _update_idempotency(
+        self, key: str, state: IdempotencyState, response: dict[str, Any] | None
+    ) -> None:
+        self.transactions += 1
+        await super()._update_idempotency(key, state, response)
+
+
+class LatencyRedis:
+    """`SET` do Redis em memoria (com `NX`/`GET`) cobrando uma latencia de rede por chamada."""
+
+    def __init__(self, latency_seconds: float) -> None:
+        self.latency_seconds = latency_seconds
+        self.values: dict[str, bytes] = {}
+
+    async def set(
+        self, key: str, value: bytes, *, px: int, nx: bool = False, get: bool = False
+    ) -> bytes | bool | None:
+        await asyncio.sleep(_jitter(self.latency_seconds))
+        previous = self.values.get(key)
+        if not (nx and previous is not None):
+            self.values[key] = value
+        return previous if get else True
+
+
+def _jitter(latency_seconds: float) -> float:
+    return latency_seconds * random.uniform(0.5, 1.5)
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def sqlite_settings(directory: Path, name: str) -> Settings:
+    return Settings(
+        relational_db_url=f'sqlite+aiosqlite:///{(directory / name).as_posix()}',
+        otel_enabled=False,
+    )
+
+
+def synthetic_readings(count: int, devices: int = 10) -> list[TelemetryReading]:
+    return [
+        TelemetryReading(
+            device_id=f'bench-device-{index % devices}',
+            moisture=40 + index % 20,
+            temperature=20 + index % 10,
+            ph=6 + (index % 10) / 10,
+            metadata={'seq': index},
+        )
+        for index in range(count)
+    ]
+
+
+async def _timed(operation: Callable[[], Awaitable[None]]) -> float:
+    started = time.perf_counter()
+    await operation()
+    return max(1e-9, time.perf_counter() - started)
+
+
+async def bench_ingest(readings: int, batch_size: int) -> dict[str, float]:
+    """Compara `execute` leitura a leitura com `execute_many` em lotes."""
+    payload = synthetic_readings(readings)
+    with tempfile.TemporaryDirectory() as directory:
+        results: dict[str, float] = {}
+        for mode in ('single', 'batch'):
+            repository = SqlAlchemyTelemetryRepository(
+                sqlite_settings(Path(directory), f'{mode}.db')
+            )
+            await repository.init_schema()
+            use_case = IngestTelemetryUseCase(
+                telemetry_publisher=NullPublisher(),
+                cache=NullCache(),
+                relational_repo=repository,
+                document_repo=NullDocumentRepository(),
+            )
+
+            async def run_single(use_case: IngestTelemetryUseCase = use_case) -> None:
+                for reading in payload:
+                    await use_case.execute(reading)
+
+            async def run_batch(use_case: IngestTelemetryUseCase = use_case) -> None:
+                for start in range(0, len(payload), batch_size):
+                    await use_case.execute_many(payload[start : start + batch_size])
+
+            elapsed = await _timed(run_single if mode == 'single' else run_batch)
+            results[f'{mode}_rows_per_second'] = len(payload) / elapsed
+            await repository.engine.dispose()
+
+    results['speedup'] = results['batch_rows_per_second'] / results['single_rows_per_second']
+    return results
+
+
+async def bench_fanout(requests: int, latency_ms: float) -> dict[str, float]:
+    """Compara a latencia de `execute` com fan-out sequencial e concorrente.
+
+    Mongo, Kafka e Redis sao simulados com `latency_ms` (+-50%); o relacional e SQLite real.
+    """
+    payload = synthetic_readings(requests)
+    latency_seconds = latency_ms / 1000
+    with tempfile.TemporaryDirectory() as directory:
+        results: dict[str, float] = {}
+        for mode in ('sequential', 'concurrent'):
+            repository = SqlAlchemyTelemetryRepository(
+                sqlite_settings(Path(directory), f'{mode}.db')
+            )
+            await repository.init_schema()
+            use_case = IngestTelemetryUseCase(
+                telemetry_publisher=LatencyPublisher(latency_seconds),
+                cache=LatencyCache(latency_seconds),
+                relational_repo=repository,
+                document_repo=LatencyDocumentRepository(latency_seconds),
+                concurrent_fan_out=mode == 'concurrent',
+            )
+            samples: list[float] = []
+            for reading in payload:
+
+                async def run(
+                    use_case: IngestTelemetryUseCase = use_case,
+                    reading: TelemetryReading = reading,
+                ) -> None:
+                    await use_case.execute(reading)
+
+                samples.append(await _timed(run) * 1000)
+            results[f'{mode}_p50_ms'] = statistics.median(samples)
+            results[f'{mode}_p95_ms'] = percentile(samples, 0.95)
+            await repository.engine.dispose()
+
+    results['p95_speedup'] = results['sequential_p95_ms'] / results['concurrent_p95_ms']
+    return results
+
+
+async def seed_telemetry(
+    repository: SqlAlchemyTelemetryRepository, rows: int, chunk: int = 20_000, devices: int = 10
+) -> None:
+    """Insere leituras sinteticas direto na tabela, sem outbox, para cenarios de leitura."""
+    origin = datetime(2026, 1, 1, tzinfo=UTC)
+    for start in range(0, rows, chunk):
+        async with repository.session_factory.begin() as session:
+            await session.execute(
+                insert(TelemetryORM),
+                [
+                    {
+                        'device_id': f'bench-device-{index % devices}',
+                        'moisture': 40 + index % 20,
+                        'temperature': 20 + index % 10,
+                        'ph': 6 + (index % 10) / 10,
+                        'captured_at': origin + timedelta(seconds=index),
+                        'metadata_json': {'seq': index},
+                    }
+                    for index in range(start, min(rows, start + chunk))
+                ],
+            )
+
+
+async def bench_export(rows: int, export_format: str) -> dict[str, float]:
+    """Exporta `rows` leituras em streaming medindo vazao e pico de memoria Python.
+
+    A vazao vem de uma passada sem `tracemalloc`; o pico de memoria, de uma segunda passada
+    rastreada, ja que o rastreamento deixa a exportacao varias vezes mais lenta.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        repository = SqlAlchemyTelemetryRepository(sqlite_settings(Path(directory), 'export.db'))
+        await repository.init_schema()
+        await seed_telemetry(repository, rows)
+        use_case = ExportTelemetryUseCase(repository)
+        exported_bytes = 0
+
+        async def run() -> None:
+            nonlocal exported_bytes
+            exported_bytes = 0
+            async for chunk in use_case.execute(TelemetryExportFormat(export_format)):
+                exported_bytes += len(chunk)
+
+        elapsed = await _timed(run)
+        tracemalloc.start()
+        try:
+            await run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        await repository.engine.dispose()
+
+    return {
+        'rows': rows,
+        'seconds': elapsed,
+        'rows_per_second': rows / elapsed,
+        'mb_per_second': exported_bytes / elapsed / 1_048_576,
+        'peak_memory_mb': peak / 1_048_576,
+    }
+
+
+async def bench_snapshots(devices: int, hit_ratio: float, latency_ms: float) -> dict[str, float]:
+    """Compara N snapshots unitarios com um snapshot em lote dos mesmos dispositivos.
+
+    O cache simula `latency_ms` por chamada e contem a telemetria de `hit_ratio` dos
+    dispositivos; o restante cai no SQLite real com concorrencia limitada.
+    """
+    device_ids = [f'bench-device-{index}' for index in range(devices)]
+    cached = {
+        f'telemetry:{device_id}': {'device_id': device_id, 'moisture': 50.0}
+        for device_id in device_ids[: round(devices * hit_ratio)]
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        repository = SqlAlchemyTelemetryRepository(sqlite_settings(Path(directory), 'snap.db'))
+        await repository.init_schema()
+        await seed_telemetry(repository, devices * 5, devices=devices)
+        use_case = GetDeviceSnapshotUseCase(
+            LatencyDictCache(latency_ms / 1000, cached), relational_repo=repository
+        )
+
+        async def run_single() -> None:
+            for device_id in device_ids:
+                await use_case.execute(device_id)
+
+        async def run_batch() -> None:
+            await use_case.execute_many(device_ids)
+
+        single_seconds = await _timed(run_single)
+        batch_seconds = await _timed(run_batch)
+        await repository.engine.dispose()
+
+    return {
+        'devices': devices,
+        'single_ms': single_seconds * 1000,
+        'batch_ms': batch_seconds * 1000,
+        'speedup': single_seconds / batch_seconds,
+    }
+
+
+async def bench_stampede(readers: int, expiries: int, latency_ms: float) -> dict[str, float]:
+    """Dispara `readers` leituras concorrentes da mesma chave logo apos cada expiracao."""
+    with tempfile.TemporaryDirectory() as directory:
+        repository = CountingTelemetryRepository(sqlite_settings(Path(directory), 'hot.db'))
+        await repository.init_schema()
+        await seed_telemetry(repository, 1_000, devices=1)
+        cache = LatencyDictCache(latency_ms / 1000, {})
+        use_case = GetCachedTelemetryUseCase(
+            cache, relational_repo=repository, early_refresh_beta=0
+        )
+        samples: list[float] = []
+        for _ in range(expiries):
+            cache.values.clear()
+
+            async def read() -> None:
+                await use_case.execute('bench-device-0')
+
+            samples.extend(await asyncio.gather(*(_timed(read) for _ in range(readers))))
+        await repository.engine.dispose()
+
+    return {
+        'readers': readers,
+        'backend_fetches_per_expiry': repository.fetches / expiries,
+        'p95_ms': percentile(samples, 0.95) * 1000,
+    }
+
+
+def bench_codecs(readings: int) -> dict[str, float]:
+    """Mede ns por leitura para codificar/decodificar e bytes no fio de cada codec instalado."""
+    payload = [asdict(reading) for reading in synthetic_readings(readings)]
+    results: dict[str, float] = {}
+    for name in PayloadCodecName:
+        if name is not PayloadCodecName.JSON and importlib.util.find_spec(name.value) is None:
+            continue
+        codec = build_codec(name)
+        started = time.perf_counter_ns()
+        encoded = [codec.encode(item) for item in payload]
+        encode_ns = time.perf_counter_ns() - started
+        started = time.perf_counter_ns()
+        for item in encoded:
+            codec.decode(item)
+        decode_ns = time.perf_counter_ns() - started
+        results[f'{name.value}_encode_ns'] = encode_ns / readings
+        results[f'{name.value}_decode_ns'] = decode_ns / readings
+        results[f'{name.value}_bytes'] = sum(map(len, encoded)) / readings
+    return results
+
+
+def bench_coverage(requests: int) -> dict[str, float]:
+    """Compara montar + validar + serializar os catalogos a cada chamada com bytes prontos."""
+    service = CoverageService()
+    endpoints: list[tuple[str, Callable[[], Any], TypeAdapter[Any], bytes]] = [
+        (
+            'requirements',
+            service.list_requirement_coverage,
+            TypeAdapter(list[RequirementCoverageOut]),
+            service.requirements_json.body,
+        ),
+        (
+            'strategic',
+            service.strategic_coverage_report,
+            TypeAdapter(StrategicCoverageReportOut),
+            service.strategic_coverage_json.body,
+        ),
+        (
+            'readiness',
+            service.product_readiness_report,
+            TypeAdapter(ProductReadinessReportOut),
+            service.product_readiness_json.body,
+        ),
+    ]
+    results: dict[str, float] = {}
+    for name, build, adapter, precomputed in endpoints:
+        started = time.perf_counter_ns()
+        for _ in range(requests):
+            # O que a rota fazia: monta os modelos e o FastAPI valida e serializa de novo.
+            adapter.dump_json(adapter.validate_python(build()))
+        rebuild_ns = time.perf_counter_ns() - started
+        started = time.perf_counter_ns()
+        for _ in range(requests):
+            bytes(precomputed)
+        precomputed_ns = time.perf_counter_ns() - started
+        results[f'{name}_rebuild_us'] = rebuild_ns / requests / 1000
+        results[f'{name}_precomputed_us'] = precomputed_ns / requests / 1000
+        results[f'{name}_speedup'] = rebuild_ns / max(precomputed_ns, 1)
+    return results
+
+
+async def bench_routing(requests: int) -> dict[str, float]:
+    """Mede montagem do app, geracao do OpenAPI e roteamento de uma rota registrada no fim."""
+    from app.api.routes import router
+
+    started = time.perf_counter()
+    app = FastAPI()
+    app.include_router(router)
+
+    # Como `/health/live` em `app.main`: registrada depois do router e casada por ultimo.
+    @app.get('/bench/ping')
+    async def ping() -> dict[str, str]:
+        return {'status': 'ok'}
+
+    build_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    app.openapi()
+    openapi_seconds = time.perf_counter() - started
+
+    samples: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        for _ in range(requests):
+            started = time.perf_counter()
+            await client.get('/bench/ping')
+            samples.append(time.perf_counter() - started)
+
+    return {
+        'api_routes': len(router.routes),
+        'build_ms': build_seconds * 1000,
+        'openapi_ms': openapi_seconds * 1000,
+        'ping_p50_us': statistics.median(samples) * 1_000_000,
+        'ping_p95_us': percentile(samples, 0.95) * 1_000_000,
+    }
+
+
+async def bench_idempotency(contenders: int, keys: int, latency_ms: float) -> dict[str, float]:
+    """Dispara `contenders` requisicoes com a mesma chave, depois o mesmo numero de replays."""
+    results: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for backend in ('sql', 'redis'):
+            settings = sqlite_settings(Path(directory), f'idempotency-{backend}.db')
+            durable = CountingIdempotencyRepository(settings)
+            await durable.init_schema()
+            repository: IdempotencyRepositoryPort = durable
+            redis_repository: RedisIdempotencyRepository | None = None
+            if backend == 'redis':
+                redis = LatencyRedis(latency_ms / 1000)
+                redis_repository = RedisIdempotencyRepository(settings, redis, durable)  # type: ignore[arg-type]
+                repository = redis_repository
+            service = IdempotencyService(repository)
+
+            async def action() -> dict[str, Any]:
+                await asyncio.sleep(_jitter(latency_ms / 1000))
+                return {'status': 'sent'}
+
+            contended: list[float] = []
+            replays: list[float] = []
+            errors = 0
+            for index in range(keys):
+                key = f'bench-key-{index:06d}'
+
+                async def call(key: str = key, service: IdempotencyService = service) -> None:
+                    nonlocal errors
+                    try:
+                        await service.execute(
+                            key=key, operation='command', payload={'i': 1}, action=action
+                        )
+                    except IdempotencyInProgressError:
+                        pass
+                    except InfrastructureError:
+                        # SQLite recusa escritas concorrentes alem do busy timeout.
+                        errors += 1
+
+                contended.extend(await asyncio.gather(*(_timed(call) for _ in range(contenders))))
+                if redis_repository is not None:
+                    await redis_repository.close()
+                replays.extend(await asyncio.gather(*(_timed(call) for _ in range(contenders))))
+            await durable.engine.dispose()
+
+            requests = 2 * contenders * keys
+            results[f'{backend}_contended_p95_ms'] = percentile(contended, 0.95) * 1000
+            results[f'{backend}_replay_p50_ms'] = statistics.median(replays) * 1000
+            results[f'{backend}_replay_p95_ms'] = percentile(replays, 0.95) * 1000
+            results[f'{backend}_sql_tx_per_request'] = durable.transactions / requests
+            results[f'{backend}_errors'] = errors
+    return results
+
+
+def report(title: str, results: dict[str, float]) -> None:
+    print(f'--- {title} ---')
+    for name, value in results.items():
+        print(f'{name}={value:.2f}')
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description='Executa benchmarks em processo.')
+    scenarios = parser.add_subparsers(dest='scenario', required=True)
+
+    ingest = scenarios.add_parser('ingest', help='Ingestao unitaria versus lote.')
+    ingest.add_argument('--readings', type=int, default=2_000)
+    ingest.add_argument('--batch-size', type=int, default=100)
+
+    fanout = scenarios.add_parser('fanout', help='Fan-out sequencial versus concorrente.')
+    fanout.add_argument('--requests', type=int, default=200)
+    fanout.add_argument('--latency-ms', type=float, default=5.0)
+
+    export = scenarios.add_parser('export', help='Exportacao em streaming do historico.')
+    export.add_argument('--rows', type=int, default=1_000_000)
+    export.add_argument(
+        '--format',
+        dest='export_format',
+        choices=[item.value for item in TelemetryExportFormat],
+        default=TelemetryExportFormat.NDJSON.value,
+    )
+
+    snapshots = scenarios.add_parser('snapshots', help='Snapshots unitarios versus em lote.')
+    snapshots.add_argument('--devices', type=int, default=500)
+    snapshots.add_argument('--hit-ratio', type=float, default=0.8)
+    snapshots.add_argument('--latency-ms', type=float, default=1.0)
+
+    codecs = scenarios.add_parser('codecs', help='Custo dos codecs de payload.')
+    codecs.add_argument('--readings', type=int, default=20_000)
+
+    stampede = scenarios.add_parser('stampede', help='Leitores concorrentes apos expiracao.')
+    stampede.add_argument('--readers', type=int, default=1_000)
+    stampede.add_argument('--expiries', type=int, default=5)
+    stampede.add_argument('--latency-ms', type=float, default=1.0)
+
+    coverage = scenarios.add_parser('coverage', help='Catalogos de cobertura pre-renderizados.')
+    coverage.add_argument('--requests', type=int, default=2_000)
+
+    routing = scenarios.add_parser('routing', help='Custo do roteamento e do OpenAPI.')
+    routing.add_argument('--requests', type=int, default=2_000)
+
+    idempotency = scenarios.add_parser('idempotency', help='Reservas de idempotencia disputadas.')
+    idempotency.add_argument('--contenders', type=int, default=200)
+    idempotency.add_argument('--keys', type=int, default=20)
+    idempotency.add_argument('--latency-ms', type=float, default=0.5)
+
+    args = parser.parse_args()
+    if args.scenario == 'ingest':
+        report(
+            'Ingestao de telemetria',
+            await bench_ingest(args.readings, args.batch_size),
+        )
+    elif args.scenario == 'fanout':
+        report(
+            'Fan-out da ingestao',
+            await bench_fanout(args.requests, args.latency_ms),
+        )
+    elif args.scenario == 'export':
+        report(
+            'Exportacao de telemetria',
+            await bench_export(args.rows, args.export_format),
+        )
+    elif args.scenario == 'snapshots':
+        report(
+            'Snapshots de dispositivos',
+            await bench_snapshots(args.devices, args.hit_ratio, args.latency_ms),
+        )
+    elif args.scenario == 'stampede':
+        report(
+            'Stampede na ultima leitura',
+            await bench_stampede(args.readers, args.expiries, args.latency_ms),
+        )
+    elif args.scenario == 'codecs':
+        report('Codecs de payload', bench_codecs(args.readings))
+    elif args.scenario == 'coverage':
+        report('Catalogos de cobertura', bench_coverage(args.requests))
+    elif args.scenario == 'routing':
+        report('Roteamento da API', await bench_routing(args.requests))
+    elif args.scenario == 'idempotency':
+        report(
+            'Idempotencia sob disputa',
+            await bench_idempotency(args.contenders, args.keys, args.latency_ms),
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -1,6 +1,8 @@
+import asyncio
 import json
 from datetime import UTC, datetime
 from types import SimpleNamespace
+from typing import Any
 
 import pytest
 
@@ -16,21 +18,58 @@ from app.infrastructure.adapters.web3_adapter import Web3BlockchainAdapter
 from app.infrastructure.persistence.document_repository import MongoTelemetryRepository
 
 
+class FakeRedisPipeline:
+    def __init__(self, redis: 'FakeRedis') -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, Any]] = []
+
+    async def __aenter__(self) -> 'FakeRedisPipeline':
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def set(self, key: str, value: str, ex: int) -> None:
+        self.commands.append(('set', (key, value, ex)))
+
+    def mget(self, keys: list[str]) -> None:
+        self.commands.append(('mget', keys))
+
+    def pttl(self, key: str) -> None:
+        self.commands.append(('pttl', key))
+
+    async def execute(self) -> list[object]:
+        if any(command == 'set' for command, _ in self.commands) and self.redis.fail_set:
+            raise ConnectionError('redis unavailable')
+        if any(command != 'set' for command, _ in self.commands) and self.redis.fail_get:
+            raise ConnectionError('redis unavailable')
+        self.redis.round_trips += 1
+        results: list[object] = []
+        for command, args in self.commands:
+            if command == 'set':
+                key, value, ex = args
+                self.redis.values[key] = value
+                self.redis.ttls[key] = ex * 1000
+                results.append(True)
+            elif command == 'mget':
+                results.append([self.redis.values.get(key) for key in args])
+            elif args not in self.redis.values:
+                results.append(-2)
+            else:
+                results.append(self.redis.ttls.get(args, -1))
+        return results
+
+
 class FakeRedis:
     def __init__(self) -> None:
-        self.values: dict[str, str] = {}
+        self.values: dict[str, Any] = {}
+        self.ttls: dict[str, int] = {}
         self.fail_set = False
         self.fail_get = False
+        self.round_trips = 0
 
-    async def set(self, key: str, value: str, ex: int) -> None:
-        if self.fail_set:
-            raise ConnectionError('redis unavailable')
-        self.values[key] = value
-
-    async def get(self, key: str) -> str | None:
-        if self.fail_get:
-            raise ConnectionError('redis unavailable')
-        return self.values.get(key)
+    def pipeline(self, transaction: bool = True) -> FakeRedisPipeline:
+        return FakeRedisPipeline(self)
 
     async def aclose(self) -> None:
         return None
@@ -70,6 +109,64 @@ async def test_redis_write_failure_is_typed_and_read_failure_uses_fallback() ->
     await adapter.close()
 
 
+@pytest.mark.asyncio
+async def test_redis_fallback_is_bounded_and_mirrors_remaining_ttl() -> None:
+    adapter = RedisCacheAdapter(Settings(otel_enabled=False, cache_fallback_max_entries=2))
+    client = FakeRedis()
+    adapter.client = client  # type: ignore[assignment]
+
+    for index in range(3):
+        await adapter.set(f'key-{index}', {'index': index}, ttl_seconds=60)
+    assert len(adapter._fallback_store) == 2
+    assert adapter._fallback_store.get('key-0') is None
+
+    client.values['remote'] = json.dumps({'remote': True})
+    client.ttls['remote'] = 0
+    assert await adapter.get('remote') == {'remote': True}
+    assert adapter._fallback_store.get('remote') is None
+
+    client.ttls['remote'] = -1
+    assert await adapter.get('remote') == {'remote': True}
+    client.fail_get = True
+    assert await adapter.get('remote') == {'remote': True}
+
+
+@pytest.mark.asyncio
+async def test_redis_get_many_and_set_many_use_one_round_trip() -> None:
+    adapter = RedisCacheAdapter(Settings(otel_enabled=False))
+    client = FakeRedis()
+    adapter.client = client  # type: ignore[assignment]
+
+    await adapter.set_many({'telemetry:a': {'v': 1}, 'command:a': {'v': 2}}, ttl_seconds=30)
+    assert client.round_trips == 1
+    assert await adapter.get_many(['telemetry:a', 'missing', 'command:a']) == [
+        {'v': 1},
+        None,
+        {'v': 2},
+    ]
+    assert client.round_trips == 2
+    assert await adapter.get_many([]) == []
+    await adapter.set_many({})
+    assert client.round_trips == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_reads_mixed_codecs_during_rollout() -> None:
+    legacy = RedisCacheAdapter(Settings(otel_enabled=False))
+    binary = RedisCacheAdapter(Settings(otel_enabled=False, payload_codec='msgpack'))
+    client = FakeRedis()
+    legacy.client = binary.client = client  # type: ignore[assignment]
+
+    await binary.set('binary', {'codec': 'msgpack'})
+    await legacy.set('legacy', {'codec': 'json'})
+
+    assert client.values['binary'][:1] == b'\x01'
+    assert await legacy.get_many(['binary', 'legacy']) == [
+        {'codec': 'msgpack'},
+        {'codec': 'json'},
+    ]
+
+
 class FakeKafkaProducer:
     def __init__(self, *, fail_start: bool = False, fail_send: bool = False) -> None:
         self.fail_start = fail_start
@@ -83,11 +180,24 @@ class FakeKafkaProducer:
             raise ConnectionError('kafka start failed')
         self.started = True
 
-    async def send_and_wait(self, topic: str, payload: bytes) -> None:
+    async def send_and_wait(
+        self, topic: str, payload: bytes, headers: list[tuple[str, bytes]] | None = None
+    ) -> None:
         if self.fail_send:
             raise ConnectionError('kafka send failed')
         self.messages.append((topic, payload))
 
+    async def send(
+        self, topic: str, payload: bytes, headers: list[tuple[str, bytes]] | None = None
+    ) -> asyncio.Future[None]:
+        delivery: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        if self.fail_send and b'sensor-down' in payload:
+            delivery.set_exception(ConnectionError('kafka send failed'))
+        else:
+            self.messages.append((topic, payload))
+            delivery.set_result(None)
+        return delivery
+
     async def stop(self) -> None:
         self.stopped = True
 
@@ -127,6 +237,35 @@ async def test_kafka_lazy_start_publish_close_and_failures(monkeypatch: pytest.M
         await adapter.publish_telemetry(_reading())
 
 
+@pytest.mark.asyncio
+async def test_kafka_batch_reports_delivery_per_reading(monkeypatch: pytest.MonkeyPatch) -> None:
+    producer = FakeKafkaProducer(fail_send=True)
+    monkeypatch.setattr(kafka_module, 'AIOKafkaProducer', lambda **_: producer)
+    adapter = KafkaTelemetryAdapter(Settings(otel_enabled=False))
+    down = _reading()
+    down.device_id = 'sensor-down'
+
+    assert await adapter.publish_telemetry_batch([]) == []
+    assert await adapter.publish_telemetry_batch([_reading(), _reading()]) == [True, True]
+    assert await adapter.publish_telemetry_batch([_reading(), down]) == [True, False]
+    assert len(producer.messages) == 3
+
+    class BrokenProducer(FakeKafkaProducer):
+        async def send(
+            self, topic: str, payload: bytes, headers: list[tuple[str, bytes]] | None = None
+        ) -> asyncio.Future[None]:
+            raise ConnectionError(topic)
+
+    adapter._producer = BrokenProducer()  # type: ignore[assignment]
+    with pytest.raises(TransientIntegrationError, match='lote'):
+        await adapter.publish_telemetry_batch([_reading()])
+
+    adapter._circuit_breaker._state = CircuitState.OPEN
+    adapter._circuit_breaker._opened_at = datetime.now(UTC)
+    with pytest.raises(TransientIntegrationError, match='Circuit breaker'):
+        await adapter.publish_telemetry_batch([_reading()])
+
+
 @pytest.mark.asyncio
 async def test_external_adapters_close_without_owned_resources() -> None:
     await AwsIotCoreAdapter(Settings(otel_enabled=False)).close()
@@ -203,7 +342,14 @@ async def test_mongo_repository_uses_async_collection(monkeypatch: pytest.Monkey
         async def insert_one(self, value: dict[str, object]) -> None:
             inserted.append(value)
 
+        async def insert_many(self, values: list[dict[str, object]], ordered: bool) -> None:
+            assert ordered is False
+            inserted.extend(values)
+
     repository.collection = Collection()  # type: ignore[assignment]
     await repository.save(_reading())
     assert inserted[0]['device_id'] == 'sensor-1'
+    await repository.save_many([])
+    await repository.save_many([_reading(), _reading()])
+    assert len(inserted) == 3
     await repository.close()
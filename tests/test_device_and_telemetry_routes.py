@@ -1,12 +1,34 @@
 import asyncio
-from datetime import datetime
+import csv
+import io
+import json
+from datetime import UTC, datetime
 
 import pytest
+from fastapi import Response
+from fastapi.testclient import TestClient
 
 import app.api.routes as routes
+from app.application.use_cases.iot.aggregate_telemetry_use_case import AggregateTelemetryUseCase
+from app.application.use_cases.iot.export_telemetry_use_case import ExportTelemetryUseCase
 from app.application.use_cases.iot.get_device_snapshot_use_case import GetDeviceSnapshotUseCase
+from app.application.use_cases.iot.list_telemetry_history_use_case import (
+    ListTelemetryHistoryUseCase,
+    decode_cursor,
+    encode_cursor,
+)
 from app.application.use_cases.iot.list_telemetry_use_case import ListTelemetryUseCase
-from app.domain.entities.models import TelemetryReading
+from app.core.exceptions import InfrastructureError, InvalidCursorError, InvalidTimeRangeError
+from app.domain.entities.models import (
+    MetricStats,
+    TelemetryAggregate,
+    TelemetryBucket,
+    TelemetryCursor,
+    TelemetryExportFormat,
+    TelemetryPage,
+    TelemetryReading,
+)
+from app.main import app
 
 pytestmark = pytest.mark.integration
 
@@ -18,6 +40,9 @@ class _FakeCache:
     async def get(self, key: str):
         return self.values.get(key)
 
+    async def get_many(self, keys: list[str]):
+        return [self.values.get(key) for key in keys]
+
 
 class _FakeRelationalRepo:
     async def save_with_outbox(self, reading):
@@ -44,6 +69,27 @@ class _FakeRelationalRepo:
             )
         ]
 
+    async def list_page(self, device_id, *, limit, since=None, until=None, after=None):
+        self.page_calls.append((device_id, limit, since, until, after))
+        items = await self.list_recent(limit, device_id)
+        return TelemetryPage(items, TelemetryCursor(datetime(2026, 4, 5, 11, tzinfo=UTC), 7))
+
+    async def stream_readings(self, device_id=None, *, since=None, until=None, batch_size=1000):
+        for minute in range(3):
+            yield TelemetryReading(
+                device_id=device_id or 'device-1',
+                moisture=40 + minute,
+                temperature=21.2,
+                ph=6.6,
+                metadata={'zone': 'north, "a"'},
+                captured_at=datetime(2026, 4, 5, 11, minute, tzinfo=UTC),
+            )
+
+    async def aggregate(self, device_id, *, bucket, since, until):
+        self.aggregate_calls.append((device_id, bucket, since, until))
+        stats = MetricStats(minimum=1, maximum=3, average=2)
+        return [TelemetryAggregate(since, 4, stats, stats, stats)]
+
 
 class _FakeContainer:
     def __init__(self):
@@ -66,7 +112,14 @@ class _FakeContainer:
             }
         )
         self.relational_repo = _FakeRelationalRepo()
+        self.relational_repo.page_calls = []
+        self.relational_repo.aggregate_calls = []
         self.list_telemetry_use_case = ListTelemetryUseCase(self.relational_repo)
+        self.list_telemetry_history_use_case = ListTelemetryHistoryUseCase(self.relational_repo)
+        self.aggregate_telemetry_use_case = AggregateTelemetryUseCase(self.relational_repo)
+        self.export_telemetry_use_case = ExportTelemetryUseCase(
+            self.relational_repo, rows_per_chunk=2
+        )
         self.get_device_snapshot_use_case = GetDeviceSnapshotUseCase(self.cache)
 
 
@@ -83,10 +136,177 @@ def test_list_telemetry_maps_domain_entities_to_contract(monkeypatch):
 def test_device_snapshot_returns_cached_telemetry_and_command(monkeypatch):
     monkeypatch.setattr(routes, 'get_container', lambda: _FakeContainer())
 
-    response = asyncio.run(routes.get_device_snapshot('device-1'))
+    response = asyncio.run(routes.get_device_snapshot('device-1', Response()))
 
     assert response.device_id == 'device-1'
     assert response.telemetry is not None
     assert response.command is not None
     assert response.telemetry.metadata['origin'] == 'cache'
     assert response.command.action == 'irrigate'
+
+
+def test_device_snapshots_batch_keeps_request_order(monkeypatch):
+    monkeypatch.setattr(routes, 'get_container', lambda: _FakeContainer())
+
+    response = asyncio.run(routes.get_device_snapshots(['unknown', 'device-1', 'unknown']))
+
+    assert [item.device_id for item in response] == ['unknown', 'device-1', 'unknown']
+    assert response[0].telemetry is None
+    assert response[0].command is None
+    assert response[1].telemetry is not None
+
+
+def test_device_snapshots_fall_back_to_relational_with_bounded_concurrency():
+    class TrackingRepo:
+        def __init__(self) -> None:
+            self.active = 0
+            self.peak = 0
+            self.calls: list[str | None] = []
+
+        async def list_recent(self, limit: int, device_id: str | None = None):
+            self.calls.append(device_id)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            if device_id == 'broken':
+                raise InfrastructureError('db down')
+            if device_id == 'empty':
+                return []
+            return [TelemetryReading(device_id=device_id or '', moisture=1, temperature=2, ph=7)]
+
+    repo = TrackingRepo()
+    use_case = GetDeviceSnapshotUseCase(
+        _FakeCache({'telemetry:cached': {'device_id': 'cached'}}),
+        relational_repo=repo,
+        fallback_concurrency=2,
+    )
+    device_ids = ['cached', 'broken', 'empty'] + [f'db-{index}' for index in range(5)]
+
+    snapshots = asyncio.run(use_case.execute_many(device_ids))
+
+    assert sorted(repo.calls) == sorted(device_ids[1:])
+    assert repo.peak == 2
+    assert snapshots[0]['telemetry'] == {'device_id': 'cached'}
+    assert snapshots[1]['telemetry'] is None
+    assert snapshots[2]['telemetry'] is None
+    assert snapshots[3]['telemetry']['device_id'] == 'db-0'
+
+
+def test_device_history_round_trips_opaque_cursor(monkeypatch):
+    container = _FakeContainer()
+    monkeypatch.setattr(routes, 'get_container', lambda: container)
+
+    first = asyncio.run(
+        routes.list_device_telemetry_history(
+            'device-1', limit=1, cursor=None, since=None, until=None
+        )
+    )
+    assert first.items[0].metadata == {'zone': 'north'}
+    assert first.next_cursor is not None
+
+    asyncio.run(
+        routes.list_device_telemetry_history(
+            'device-1', limit=1, cursor=first.next_cursor, since=None, until=None
+        )
+    )
+    assert container.relational_repo.page_calls[1][4] == TelemetryCursor(
+        datetime(2026, 4, 5, 11, tzinfo=UTC), 7
+    )
+
+
+def test_device_history_rejects_invalid_cursor_and_time_range(monkeypatch):
+    monkeypatch.setattr(routes, 'get_container', lambda: _FakeContainer())
+    naive = encode_cursor(TelemetryCursor(datetime(2026, 4, 5, 11), 7))
+
+    for token in ('@@@', 'bm90LWpzb24', naive):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token)
+
+    with TestClient(app, raise_server_exceptions=False) as client:
+        bad_cursor = client.get('/api/v1/devices/device-1/telemetry', params={'cursor': 'x'})
+        bad_range = client.get(
+            '/api/v1/devices/device-1/telemetry',
+            params={'since': '2026-04-05T12:00:00Z', 'until': '2026-04-05T11:00:00Z'},
+        )
+
+    assert bad_cursor.status_code == 400
+    assert bad_cursor.json()['error']['code'] == 'INVALID_CURSOR'
+    assert bad_range.status_code == 400
+    assert bad_range.json()['error']['code'] == 'INVALID_TIME_RANGE'
+
+
+async def _drain(response) -> tuple[int, str]:
+    chunks = [chunk async for chunk in response.body_iterator]
+    return len(chunks), b''.join(chunks).decode()
+
+
+def test_export_streams_ndjson_and_csv_in_chunks(monkeypatch):
+    monkeypatch.setattr(routes, 'get_container', lambda: _FakeContainer())
+
+    ndjson = asyncio.run(
+        routes.export_telemetry(
+            device_id='device-1', since=None, until=None, export_format=TelemetryExportFormat.NDJSON
+        )
+    )
+    chunks, body = asyncio.run(_drain(ndjson))
+    lines = [json.loads(line) for line in body.splitlines()]
+    assert ndjson.media_type == 'application/x-ndjson'
+    assert chunks == 2
+    assert [line['moisture'] for line in lines] == [40, 41, 42]
+    assert lines[0]['captured_at'] == '2026-04-05T11:00:00+00:00'
+
+    exported = asyncio.run(
+        routes.export_telemetry(
+            device_id=None, since=None, until=None, export_format=TelemetryExportFormat.CSV
+        )
+    )
+    _, body = asyncio.run(_drain(exported))
+    rows = list(csv.DictReader(io.StringIO(body)))
+    assert exported.headers['content-disposition'] == 'attachment; filename="telemetry.csv"'
+    assert [row['moisture'] for row in rows] == ['40', '41', '42']
+    assert json.loads(rows[2]['metadata']) == {'zone': 'north, "a"'}
+
+    with pytest.raises(InvalidTimeRangeError):
+        asyncio.run(
+            routes.export_telemetry(
+                device_id=None,
+                since=datetime(2026, 4, 5, 12, tzinfo=UTC),
+                until=datetime(2026, 4, 5, 12, tzinfo=UTC),
+                export_format=TelemetryExportFormat.CSV,
+            )
+        )
+
+
+def test_aggregate_route_defaults_window_and_bounds_bucket_count(monkeypatch):
+    container = _FakeContainer()
+    monkeypatch.setattr(routes, 'get_container', lambda: container)
+    until = datetime(2026, 4, 5, 12, tzinfo=UTC)
+
+    response = asyncio.run(
+        routes.aggregate_device_telemetry(
+            'device-1', bucket=TelemetryBucket.FIVE_MINUTES, since=None, until=until
+        )
+    )
+
+    assert response.bucket == '5m'
+    assert response.since == datetime(2026, 4, 4, 12, tzinfo=UTC)
+    assert response.items[0].count == 4
+    assert response.items[0].moisture.avg == 2
+    assert container.relational_repo.aggregate_calls[0][1] is TelemetryBucket.FIVE_MINUTES
+
+    with pytest.raises(InvalidTimeRangeError, match='10000 buckets'):
+        asyncio.run(
+            routes.aggregate_device_telemetry(
+                'device-1',
+                bucket=TelemetryBucket.FIVE_MINUTES,
+                since=datetime(2025, 4, 5, tzinfo=UTC),
+                until=until,
+            )
+        )
+    with pytest.raises(InvalidTimeRangeError):
+        asyncio.run(
+            routes.aggregate_device_telemetry(
+                'device-1', bucket=TelemetryBucket.DAY, since=until, until=until
+            )
+        )
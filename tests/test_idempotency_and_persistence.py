@@ -1,11 +1,12 @@
 import asyncio
 from collections.abc import Awaitable, Callable
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
 
 import pytest
+from sqlalchemy import select, update
 
 from app.application.services.idempotency_service import IdempotencyService
 from app.core.exceptions import (
@@ -15,9 +16,21 @@ from app.core.exceptions import (
     InfrastructureError,
 )
 from app.core.settings import Settings
-from app.domain.entities.models import IdempotencyRecord, IdempotencyState, TelemetryReading
+from app.domain.entities.models import (
+    IdempotencyRecord,
+    IdempotencyState,
+    MetricStats,
+    OutboxState,
+    TelemetryBucket,
+    TelemetryReading,
+)
 from app.infrastructure.persistence import relational_repository as relational_module
-from app.infrastructure.persistence.relational_repository import SqlAlchemyTelemetryRepository
+from app.infrastructure.persistence.relational_repository import (
+    IdempotencyORM,
+    SqlAlchemyTelemetryRepository,
+    TelemetryArchiveORM,
+)
+from scripts import backfill_rollups
 
 
 class MemoryIdempotencyRepository:
@@ -139,8 +152,47 @@ async def test_concurrent_idempotent_requests_execute_effect_once() -> None:
     )
 
     assert effects == 1
-    assert sum(isinstance(result, IdempotencyInProgressError) for result in results) == 1
-    assert sum(isinstance(result, dict) for result in results) == 1
+    assert [result['replayed'] for result in results] == [False, True]  # type: ignore[index]
+    assert results[0] == {**results[1], 'replayed': False}  # type: ignore[dict-item]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_coalesce_in_process_without_repository_calls() -> None:
+    repository = MemoryIdempotencyRepository()
+    reserve = repository.reserve
+    reservations = 0
+
+    async def counting_reserve(record: IdempotencyRecord) -> tuple[bool, IdempotencyRecord]:
+        nonlocal reservations
+        reservations += 1
+        return await reserve(record)
+
+    repository.reserve = counting_reserve  # type: ignore[method-assign]
+    service = IdempotencyService(repository)
+    release = asyncio.Event()
+
+    async def action() -> dict[str, Any]:
+        await release.wait()
+        raise RuntimeError('gateway timeout')
+
+    leader = asyncio.create_task(_execute(service, action, key='retry-key-0001'))
+    await asyncio.sleep(0)
+    duplicates = [
+        asyncio.create_task(_execute(service, action, key='retry-key-0001')) for _ in range(5)
+    ]
+    other_payload = asyncio.create_task(
+        _execute(service, action, key='retry-key-0001', payload={'duration': 99})
+    )
+    await asyncio.sleep(0.01)
+    release.set()
+
+    with pytest.raises(RuntimeError):
+        await leader
+    outcomes = await asyncio.gather(*duplicates, return_exceptions=True)
+    assert all(isinstance(outcome, IdempotencyInProgressError) for outcome in outcomes)
+    with pytest.raises(IdempotencyConflictError):
+        await other_payload
+    assert reservations == 2
 
 
 def _repository_settings(database: Path) -> Settings:
@@ -219,3 +271,402 @@ async def test_relational_idempotency_unique_constraint_and_state_transitions(
     _, unknown = await repository.reserve(second)
     assert unknown.state is IdempotencyState.UNKNOWN
     await repository.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_relational_idempotency_expires_per_operation_and_is_swept(
+    tmp_path: Path,
+) -> None:
+    settings = _repository_settings(tmp_path / 'expiry.db').model_copy(
+        update={
+            'idempotency_default_retention_hours': 1,
+            'idempotency_retention_hours': {'commands.dispatch': 24},
+        }
+    )
+    repository = SqlAlchemyTelemetryRepository(settings)
+    await repository.init_schema()
+    now = datetime.now(UTC)
+    ages = {'command-old-01': 30, 'command-new-01': 2, 'custom-old-001': 2, 'custom-new-001': 0}
+    for key, hours in ages.items():
+        operation = 'commands.dispatch' if key.startswith('command') else 'custom.op'
+        record = IdempotencyRecord(key, operation, 'f' * 64, IdempotencyState.PROCESSING)
+        await repository.reserve(record)
+        await repository.complete(key, {'status': 'done'})
+        async with repository.session_factory.begin() as session:
+            await session.execute(
+                update(IdempotencyORM)
+                .where(IdempotencyORM.key == key)
+                .values(created_at=now - timedelta(hours=hours))
+            )
+
+    reused, record = await repository.reserve(
+        IdempotencyRecord(
+            'command-old-01', 'commands.dispatch', 'g' * 64, IdempotencyState.PROCESSING
+        )
+    )
+    assert reused is True
+    assert record.fingerprint == 'g' * 64
+    replayed, _ = await repository.reserve(
+        IdempotencyRecord(
+            'command-new-01', 'commands.dispatch', 'f' * 64, IdempotencyState.PROCESSING
+        )
+    )
+    assert replayed is False
+
+    assert await repository.purge_expired_idempotency(now) == 1
+    assert await repository.purge_expired_idempotency(now + timedelta(hours=23)) == 2
+    async with repository.session_factory() as session:
+        remaining = (await session.scalars(select(IdempotencyORM.key))).all()
+    assert sorted(remaining) == ['command-old-01']
+
+    repository.session_factory = None  # type: ignore[assignment]
+    with pytest.raises(InfrastructureError, match='expurgar'):
+        await repository.purge_expired_idempotency(now)
+    await repository.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_relational_repository_bulk_inserts_batch_in_single_transaction(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repository = SqlAlchemyTelemetryRepository(_repository_settings(tmp_path / 'batch.db'))
+    await repository.init_schema()
+    readings = [
+        TelemetryReading(
+            device_id=f'sensor-{index}',
+            moisture=50,
+            temperature=22,
+            ph=6.5,
+            captured_at=datetime(2026, 8, 20, 12, index, tzinfo=UTC),
+        )
+        for index in range(3)
+    ]
+
+    assert await repository.save_many_with_outbox([]) == []
+    event_ids = await repository.save_many_with_outbox(readings)
+    assert len(set(event_ids)) == 3
+    assert len(await repository.list_recent()) == 3
+    pending = await repository.list_pending_outbox()
+    assert {event.event_id for event in pending} == set(event_ids)
+
+    await repository.mark_outbox_published_many([])
+    await repository.mark_outbox_published_many(event_ids[:2])
+    assert [event.event_id for event in await repository.list_pending_outbox()] == [event_ids[2]]
+
+    monkeypatch.setattr(relational_module.uuid, 'uuid4', lambda: SimpleNamespace(hex='same-event'))
+    with pytest.raises(InfrastructureError, match='lote'):
+        await repository.save_many_with_outbox(readings)
+    assert len(await repository.list_recent()) == 3
+
+    repository.session_factory = None  # type: ignore[assignment]
+    with pytest.raises(InfrastructureError, match='publicados'):
+        await repository.mark_outbox_published_many(event_ids)
+    await repository.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_relational_repository_claims_releases_and_requeues_outbox(tmp_path: Path) -> None:
+    repository = SqlAlchemyTelemetryRepository(_repository_settings(tmp_path / 'claim.db'))
+    await repository.init_schema()
+    readings = [
+        TelemetryReading(
+            device_id='sensor-claim',
+            moisture=50,
+            temperature=22,
+            ph=6.5,
+            captured_at=datetime(2026, 8, 20, 12, minute, tzinfo=UTC),
+        )
+        for minute in (3, 1, 2)
+    ]
+    await repository.save_many_with_outbox(readings)
+
+    claimed = await repository.claim_pending_outbox(limit=2)
+    assert [event.occurred_at.minute for event in claimed] == [1, 2]
+    assert all(event.state is OutboxState.CLAIMED for event in claimed)
+    assert all(event.attempt_count == 1 for event in claimed)
+    assert len(await repository.claim_pending_outbox(limit=10)) == 1
+    assert await repository.claim_pending_outbox(limit=10) == []
+
+    await repository.release_outbox([])
+    await repository.release_outbox([claimed[0].event_id])
+    assert [event.event_id for event in await repository.list_pending_outbox()] == [
+        claimed[0].event_id
+    ]
+    assert await repository.requeue_claimed_outbox() == 2
+    assert len(await repository.list_pending_outbox()) == 3
+
+    repository.session_factory = None  # type: ignore[assignment]
+    with pytest.raises(InfrastructureError, match='reservar eventos'):
+        await repository.claim_pending_outbox()
+    with pytest.raises(InfrastructureError, match='liberar eventos'):
+        await repository.release_outbox(['event'])
+    with pytest.raises(InfrastructureError, match='devolver eventos'):
+        await repository.requeue_claimed_outbox()
+    await repository.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_relational_repository_pages_history_by_keyset(tmp_path: Path) -> None:
+    repository = SqlAlchemyTelemetryRepository(_repository_settings(tmp_path / 'page.db'))
+    await repository.init_schema()
+    same_instant = datetime(2026, 8, 20, 12, 30, tzinfo=UTC)
+    readings = [
+        TelemetryReading(
+            device_id='sensor-page',
+            moisture=minute,
+            temperature=22,
+            ph=6.5,
+            captured_at=datetime(2026, 8, 20, 12, minute, tzinfo=UTC),
+        )
+        for minute in range(5)
+    ]
+    readings += [
+        TelemetryReading(
+            device_id='sensor-page',
+            moisture=90 + index,
+            temperature=22,
+            ph=6.5,
+            captured_at=same_instant,
+        )
+        for index in range(2)
+    ]
+    readings.append(TelemetryReading(device_id='other', moisture=1, temperature=22, ph=6.5))
+    await repository.save_many_with_outbox(readings)
+
+    walked: list[float] = []
+    cursor = None
+    pages = 0
+    while True:
+        page = await repository.list_page('sensor-page', limit=3, after=cursor)
+        walked.extend(item.moisture for item in page.items)
+        pages += 1
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert walked == [91, 90, 4, 3, 2, 1, 0]
+    window = await repository.list_page(
+        'sensor-page',
+        limit=10,
+        since=datetime(2026, 8, 20, 12, 1, tzinfo=UTC),
+        until=datetime(2026, 8, 20, 9, 3, tzinfo=timezone(timedelta(hours=-3))),
+    )
+    assert [item.moisture for item in window.items] == [2, 1]
+    assert window.next_cursor is None
+
+    repository.session_factory = None  # type: ignore[assignment]
+    with pytest.raises(InfrastructureError, match='historico'):
+        await repository.list_page('sensor-page', limit=1)
+    await repository.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_relational_repository_streams_history_in_chronological_order(
+    tmp_path: Path,
+) -> None:
+    repository = SqlAlchemyTelemetryRepository(_repository_settings(tmp_path / 'stream.db'))
+    await repository.init_schema()
+    await repository.save_many_with_outbox(
+        [
+            TelemetryReading(
+                device_id='sensor-stream' if minute % 2 else 'other',
+                moisture=minute,
+                temperature=22,
+                ph=6.5,
+                captured_at=datetime(2026, 8, 20, 12, minute, tzinfo=UTC),
+            )
+            for minute in (9, 1, 5, 3, 7, 2)
+        ]
+    )
+
+    streamed = [
+        reading.moisture
+        async for reading in repository.stream_readings(
+            'sensor-stream',
+            since=datetime(2026, 8, 20, 12, 2, tzinfo=UTC),
+            until=datetime(2026, 8, 20, 12, 9, tzinfo=UTC),
+            batch_size=2,
+        )
+    ]
+    assert streamed == [3, 5, 7]
+    assert len([reading async for reading in repository.stream_readings()]) == 6
+
+    repository.session_factory = None  # type: ignore[assignment]
+    with pytest.raises(InfrastructureError, match='exportar'):
+        async for _ in repository.stream_readings():
+            pass
+    await repository.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_relational_repository_aggregates_buckets_in_sql_and_fallback(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repository = SqlAlchemyTelemetryRepository(_repository_settings(tmp_path / 'aggregate.db'))
+    await repository.init_schema()
+    await repository.save_many_with_outbox(
+        [
+            TelemetryReading(
+                device_id='sensor-agg',
+                moisture=moisture,
+                temperature=20 + moisture / 10,
+                ph=6.5,
+                captured_at=datetime(2026, 8, 20, hour, minute, 30, 250_000, tzinfo=UTC),
+            )
+            for hour, minute, moisture in ((12, 0, 40), (12, 4, 50), (12, 59, 60), (13, 5, 70))
+        ]
+        + [TelemetryReading(device_id='other', moisture=1, temperature=1, ph=1)]
+    )
+    window = {
+        'since': datetime(2026, 8, 20, 12, tzinfo=UTC),
+        'until': datetime(2026, 8, 20, 14, tzinfo=UTC),
+    }
+
+    five_minutes = await repository.aggregate(
+        'sensor-agg', bucket=TelemetryBucket.FIVE_MINUTES, **window
+    )
+    hourly = await repository.aggregate('sensor-agg', bucket=TelemetryBucket.HOUR, **window)
+
+    assert [item.bucket_start.minute for item in five_minutes] == [0, 55, 5]
+    assert [item.count for item in five_minutes] == [2, 1, 1]
+    assert [item.bucket_start.hour for item in hourly] == [12, 13]
+    assert hourly[0].moisture.minimum == 40
+    assert hourly[0].moisture.maximum == 60
+    assert hourly[0].moisture.average == pytest.approx(50)
+    assert hourly[0].temperature.average == pytest.approx(25)
+
+    monkeypatch.setattr(repository, '_bucket_expression', lambda _: None)
+    fallback = await repository.aggregate(
+        'sensor-agg', bucket=TelemetryBucket.FIVE_MINUTES, **window
+    )
+    assert fallback == five_minutes
+
+    monkeypatch.undo()
+    repository.session_factory = None  # type: ignore[assignment]
+    with pytest.raises(InfrastructureError, match='agregar'):
+        await repository.aggregate('sensor-agg', bucket=TelemetryBucket.DAY, **window)
+    await repository.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_relational_repository_maintains_rollups_at_ingest_and_backfill(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    database = tmp_path / 'rollup.db'
+    repository = SqlAlchemyTelemetryRepository(_repository_settings(database))
+    await repository.init_schema()
+    readings = [
+        TelemetryReading(
+            device_id='sensor-roll',
+            moisture=moisture,
+            temperature=moisture / 2,
+            ph=6 + moisture / 100,
+            captured_at=datetime(2026, 8, day, hour, 15, tzinfo=UTC),
+        )
+        for day, hour, moisture in ((20, 12, 40), (20, 12, 60), (20, 13, 10), (21, 0, 90))
+    ]
+    await repository.save_with_outbox(readings[0])
+    await repository.save_many_with_outbox(readings[1:])
+    window = {
+        'since': datetime(2026, 8, 20, 12, 30, tzinfo=UTC),
+        'until': datetime(2026, 8, 22, tzinfo=UTC),
+    }
+
+    hourly = await repository.aggregate('sensor-roll', bucket=TelemetryBucket.HOUR, **window)
+    daily = await repository.aggregate('sensor-roll', bucket=TelemetryBucket.DAY, **window)
+    assert [(item.bucket_start.hour, item.count) for item in hourly] == [(12, 2), (13, 1), (0, 1)]
+    assert hourly[0].moisture == MetricStats(40, 60, 50)
+    assert [item.count for item in daily] == [3, 1]
+    assert daily[0].temperature.maximum == 30
+
+    raw = SqlAlchemyTelemetryRepository(
+        Settings(
+            relational_db_url=f'sqlite+aiosqlite:///{database.as_posix()}',
+            otel_enabled=False,
+            telemetry_rollups_enabled=False,
+        )
+    )
+    raw_window = {**window, 'since': datetime(2026, 8, 20, 12, tzinfo=UTC)}
+    assert await raw.aggregate('sensor-roll', bucket=TelemetryBucket.HOUR, **raw_window) == hourly
+    await raw.engine.dispose()
+
+    monkeypatch.setattr(repository, '_dialect_name', lambda: 'generic')
+    await repository.save_with_outbox(readings[0])
+    monkeypatch.undo()
+    again = await repository.aggregate('sensor-roll', bucket=TelemetryBucket.HOUR, **window)
+    assert again[0].count == 3
+
+    monkeypatch.setattr(
+        backfill_rollups.argparse.ArgumentParser,
+        'parse_args',
+        lambda _: SimpleNamespace(
+            since=datetime(2026, 8, 20, 10), until=datetime(2026, 8, 20, 23), batch_size=2
+        ),
+    )
+    monkeypatch.setattr(backfill_rollups, 'Settings', lambda: _repository_settings(database))
+    await backfill_rollups.main()
+    assert capsys.readouterr().out.strip() == 'leituras_processadas=4'
+    rebuilt = await repository.aggregate('sensor-roll', bucket=TelemetryBucket.HOUR, **window)
+    assert [item.count for item in rebuilt] == [3, 1, 1]
+    assert await repository.rebuild_rollups() == 5
+
+    repository.session_factory = None  # type: ignore[assignment]
+    with pytest.raises(InfrastructureError, match='agregar'):
+        await repository.aggregate('sensor-roll', bucket=TelemetryBucket.DAY, **window)
+    with pytest.raises(InfrastructureError, match='rollups'):
+        await repository.rebuild_rollups()
+    await repository.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_relational_repository_purges_outbox_and_archives_old_telemetry(
+    tmp_path: Path,
+) -> None:
+    repository = SqlAlchemyTelemetryRepository(_repository_settings(tmp_path / 'retention.db'))
+    await repository.init_schema()
+    event_ids = await repository.save_many_with_outbox(
+        [
+            TelemetryReading(
+                device_id='sensor-old',
+                moisture=day,
+                temperature=22,
+                ph=6.5,
+                captured_at=datetime(2026, 8, day, tzinfo=UTC),
+            )
+            for day in (1, 2, 3, 20)
+        ]
+    )
+    await repository.mark_outbox_published_many(event_ids[:3])
+    cutoff = datetime(2026, 8, 10, tzinfo=UTC)
+
+    assert await repository.purge_published_outbox(cutoff, limit=2) == 2
+    assert await repository.purge_published_outbox(cutoff, limit=2) == 1
+    assert await repository.purge_published_outbox(cutoff) == 0
+    assert [event.event_id for event in await repository.list_pending_outbox()] == [event_ids[3]]
+
+    assert await repository.archive_telemetry(cutoff, limit=2) == 2
+    assert await repository.archive_telemetry(cutoff, limit=2) == 1
+    assert await repository.archive_telemetry(cutoff) == 0
+    assert [reading.moisture for reading in await repository.list_recent()] == [20]
+    async with repository.session_factory() as session:
+        archived = (await session.scalars(select(TelemetryArchiveORM))).all()
+    assert sorted(row.moisture for row in archived) == [1, 2, 3]
+    daily = await repository.aggregate(
+        'sensor-old',
+        bucket=TelemetryBucket.DAY,
+        since=datetime(2026, 8, 1, tzinfo=UTC),
+        until=cutoff,
+    )
+    assert len(daily) == 3
+
+    repository.session_factory = None  # type: ignore[assignment]
+    with pytest.raises(InfrastructureError, match='expurgar'):
+        await repository.purge_published_outbox(cutoff)
+    with pytest.raises(InfrastructureError, match='arquivar'):
+        await repository.archive_telemetry(cutoff)
+    await repository.engine.dispose()
@@ -1,8 +1,14 @@
 import asyncio
+import time
+from datetime import UTC, datetime
 
+import pytest
+
+from app.application.services.projection_queue import ProjectionQueue
+from app.application.services.telemetry_ring_buffer import TelemetryRingBuffer
 from app.application.use_cases.ingest_telemetry import IngestTelemetryUseCase
 from app.core.exceptions import TransientIntegrationError
-from app.domain.entities.models import OutboxEvent, TelemetryReading
+from app.domain.entities.models import OutboxEvent, OutboxState, TelemetryReading
 
 
 class _FakePublisher:
@@ -49,11 +55,16 @@ def test_ingest_telemetry_use_case():
     relational = _FakeRepo()
     document = _FakeRepo()
 
-    use_case = IngestTelemetryUseCase(publisher, cache, relational, document)
+    ring_buffer = TelemetryRingBuffer()
+    use_case = IngestTelemetryUseCase(
+        publisher, cache, relational, document, ring_buffer=ring_buffer
+    )
     reading = TelemetryReading(device_id='sensor-1', moisture=50, temperature=26, ph=6.4)
 
     asyncio.run(use_case.execute(reading))
 
+    assert ring_buffer.latest('sensor-1') == reading
+
     assert publisher.called
     assert len(relational.saved) == 1
     assert relational.published == ['event-1']
@@ -88,28 +99,239 @@ def test_ingest_tolerates_projection_publish_and_cache_failures():
     assert relational.published == []
 
 
+def _outbox_event(event_id, device_id='sensor-1'):
+    return OutboxEvent(
+        event_id=event_id,
+        event_type='telemetry.ingested',
+        aggregate_id=device_id,
+        payload={
+            'device_id': device_id,
+            'moisture': 50,
+            'temperature': 26,
+            'ph': 6.4,
+            'captured_at': '2026-08-20T12:00:00+00:00',
+            'metadata': {},
+        },
+        state=OutboxState.CLAIMED,
+    )
+
+
+class _ReconciliationRepo(_FakeRepo):
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+        self.released = []
+
+    async def claim_pending_outbox(self, limit=100):
+        claimed, self.events = self.events[:limit], self.events[limit:]
+        return claimed
+
+    async def mark_outbox_published_many(self, event_ids):
+        self.published.extend(event_ids)
+
+    async def release_outbox(self, event_ids):
+        self.released.extend(event_ids)
+
+
 def test_reconcile_pending_outbox_marks_only_successful_events():
-    class ReconciliationRepo(_FakeRepo):
-        async def list_pending_outbox(self, limit=100):
-            return [
-                OutboxEvent(
-                    event_id='event-ok',
-                    event_type='telemetry.ingested',
-                    aggregate_id='sensor-1',
-                    payload={
-                        'device_id': 'sensor-1',
-                        'moisture': 50,
-                        'temperature': 26,
-                        'ph': 6.4,
-                        'captured_at': '2026-08-20T12:00:00+00:00',
-                        'metadata': {},
-                    },
-                )
-            ]
-
-    relational = ReconciliationRepo()
-    publisher = _FakePublisher()
+    class PartialPublisher:
+        def __init__(self):
+            self.batches = []
+
+        async def publish_telemetry_batch(self, readings):
+            self.batches.append(readings)
+            return [reading.device_id != 'sensor-down' for reading in readings]
+
+    relational = _ReconciliationRepo(
+        [_outbox_event('event-ok'), _outbox_event('event-down', 'sensor-down')]
+    )
+    publisher = PartialPublisher()
     use_case = IngestTelemetryUseCase(publisher, _FakeCache(), relational, _FakeRepo())
 
     assert asyncio.run(use_case.reconcile_pending()) == 1
     assert relational.published == ['event-ok']
+    assert relational.released == ['event-down']
+    assert len(publisher.batches) == 1
+    assert publisher.batches[0][0].captured_at == datetime(2026, 8, 20, 12, tzinfo=UTC)
+    assert asyncio.run(use_case.reconcile_pending()) == 0
+
+
+def test_reconcile_pending_releases_claims_when_broker_is_unavailable():
+    class FailingPublisher:
+        async def publish_telemetry_batch(self, readings):
+            raise TransientIntegrationError(str(len(readings)))
+
+    relational = _ReconciliationRepo([_outbox_event('event-1'), _outbox_event('event-2')])
+    use_case = IngestTelemetryUseCase(FailingPublisher(), _FakeCache(), relational, _FakeRepo())
+
+    assert asyncio.run(use_case.reconcile_pending()) == 0
+    assert relational.published == []
+    assert relational.released == ['event-1', 'event-2']
+
+
+def test_execute_many_persists_in_bulk_and_reports_state_per_reading():
+    class BatchPublisher(_FakePublisher):
+        async def publish_telemetry_batch(self, readings):
+            return [reading.device_id != 'sensor-down' for reading in readings]
+
+    class BatchRepo(_FakeRepo):
+        async def save_many(self, readings):
+            self.saved.extend(readings)
+
+        async def save_many_with_outbox(self, readings):
+            self.saved.extend(readings)
+            return [f'event-{index}' for index in range(len(readings))]
+
+        async def mark_outbox_published_many(self, event_ids):
+            self.published.extend(event_ids)
+
+    cache = _FakeCache()
+    relational = BatchRepo()
+    document = BatchRepo()
+    ring_buffer = TelemetryRingBuffer()
+    use_case = IngestTelemetryUseCase(
+        BatchPublisher(), cache, relational, document, ring_buffer=ring_buffer
+    )
+    readings = [
+        TelemetryReading(
+            device_id='sensor-1',
+            moisture=50,
+            temperature=26,
+            ph=6.4,
+            captured_at=datetime(2026, 8, 20, 12, minute, tzinfo=UTC),
+        )
+        for minute in (5, 1)
+    ]
+    readings.append(TelemetryReading(device_id='sensor-down', moisture=50, temperature=26, ph=6))
+
+    states = asyncio.run(use_case.execute_many(readings))
+
+    assert states == [OutboxState.PUBLISHED, OutboxState.PUBLISHED, OutboxState.PENDING]
+    assert relational.published == ['event-0', 'event-1']
+    assert len(document.saved) == 3
+    assert cache.values['telemetry:sensor-1']['captured_at'].minute == 5
+    assert 'telemetry:sensor-down' in cache.values
+    assert len(ring_buffer.recent('sensor-1', 2)) == 2
+
+
+def test_execute_many_keeps_outbox_pending_when_batch_publish_fails():
+    class FailingPublisher:
+        async def publish_telemetry_batch(self, readings):
+            raise TransientIntegrationError(str(len(readings)))
+
+    class FailingDocument(_FakeRepo):
+        async def save_many(self, readings):
+            raise ConnectionError(str(len(readings)))
+
+    class FailingCache(_FakeCache):
+        async def set(self, key, value, ttl_seconds=300):
+            raise TransientIntegrationError(key)
+
+    class BatchRepo(_FakeRepo):
+        async def save_many_with_outbox(self, readings):
+            return ['event-1'] * len(readings)
+
+    relational = BatchRepo()
+    use_case = IngestTelemetryUseCase(
+        FailingPublisher(), FailingCache(), relational, FailingDocument()
+    )
+
+    states = asyncio.run(
+        use_case.execute_many(
+            [TelemetryReading(device_id='sensor-1', moisture=50, temperature=26, ph=6.4)]
+        )
+    )
+
+    assert states == [OutboxState.PENDING]
+    assert relational.published == []
+
+
+def test_async_projection_defers_fan_out_to_queue_and_falls_back_inline_when_full():
+    class BatchRepo(_FakeRepo):
+        async def save_many_with_outbox(self, readings):
+            self.saved.extend(readings)
+            return [f'event-{index}' for index in range(len(readings))]
+
+        async def mark_outbox_published_many(self, event_ids):
+            self.published.extend(event_ids)
+
+    class BatchPublisher(_FakePublisher):
+        async def publish_telemetry_batch(self, readings):
+            return [True] * len(readings)
+
+    class BatchDocument(_FakeRepo):
+        async def save_many(self, readings):
+            self.saved.extend(readings)
+
+    async def scenario():
+        queue = ProjectionQueue('test-ingest', maxsize=2, workers=1)
+        cache = _FakeCache()
+        relational = BatchRepo()
+        document = BatchDocument()
+        use_case = IngestTelemetryUseCase(
+            BatchPublisher(), cache, relational, document, projection_queue=queue
+        )
+        reading = TelemetryReading(device_id='sensor-1', moisture=50, temperature=26, ph=6.4)
+
+        queue.start()
+        await use_case.execute(reading)
+        assert relational.published == []
+        assert document.saved == []
+
+        states = await use_case.execute_many([reading, reading])
+        assert states == [OutboxState.PENDING, OutboxState.PENDING]
+        inline = await use_case.execute_many([reading])
+
+        await queue.stop()
+        return inline, relational, document, cache
+
+    inline, relational, document, cache = asyncio.run(scenario())
+
+    assert inline == [OutboxState.PUBLISHED]
+    assert sorted(relational.published) == ['event-0', 'event-0', 'event-1', 'event-1']
+    assert len(document.saved) == 4
+    assert 'telemetry:sensor-1' in cache.values
+
+
+def test_concurrent_fan_out_overlaps_branches_and_keeps_error_handling():
+    class SlowPublisher:
+        async def publish_telemetry(self, reading):
+            await asyncio.sleep(0.05)
+
+    class SlowDocument(_FakeRepo):
+        async def save(self, reading):
+            await asyncio.sleep(0.05)
+            raise ConnectionError(str(reading.device_id))
+
+    class SlowCache(_FakeCache):
+        async def set(self, key, value, ttl_seconds=300):
+            await asyncio.sleep(0.05)
+            raise TransientIntegrationError(key)
+
+    relational = _FakeRepo()
+    use_case = IngestTelemetryUseCase(
+        SlowPublisher(), SlowCache(), relational, SlowDocument(), concurrent_fan_out=True
+    )
+    reading = TelemetryReading(device_id='sensor-1', moisture=50, temperature=26, ph=6.4)
+
+    started = time.perf_counter()
+    asyncio.run(use_case.execute(reading))
+
+    assert time.perf_counter() - started < 0.12
+    assert relational.published == ['event-1']
+
+
+def test_concurrent_fan_out_propagates_unexpected_errors_after_all_branches():
+    class BrokenPublisher:
+        async def publish_telemetry(self, reading):
+            raise ValueError(reading.device_id)
+
+    cache = _FakeCache()
+    use_case = IngestTelemetryUseCase(
+        BrokenPublisher(), cache, _FakeRepo(), _FakeRepo(), concurrent_fan_out=True
+    )
+    reading = TelemetryReading(device_id='sensor-1', moisture=50, temperature=26, ph=6.4)
+
+    with pytest.raises(ValueError):
+        asyncio.run(use_case.execute(reading))
+    assert 'telemetry:sensor-1' in cache.values
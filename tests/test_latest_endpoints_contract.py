@@ -1,8 +1,11 @@
 import asyncio
 
 import pytest
+from fastapi import Response
+from fastapi.testclient import TestClient
 
 import app.api.routes as routes
+from app.main import app
 
 pytestmark = pytest.mark.integration
 
@@ -24,7 +27,7 @@ class _FakeContainer:
 def test_latest_telemetry_returns_none_for_missing_payload(monkeypatch):
     monkeypatch.setattr(routes, 'get_container', lambda: _FakeContainer(None))
 
-    response = asyncio.run(routes.latest_telemetry('device-1'))
+    response = asyncio.run(routes.latest_telemetry('device-1', Response()))
 
     assert response is None
 
@@ -38,7 +41,54 @@ def test_latest_command_maps_legacy_created_at_to_sent_at(monkeypatch):
     }
     monkeypatch.setattr(routes, 'get_container', lambda: _FakeContainer(legacy_payload))
 
-    response = asyncio.run(routes.latest_command('device-1'))
+    response = asyncio.run(routes.latest_command('device-1', Response()))
 
     assert response is not None
     assert response.sent_at.isoformat().startswith('2026-03-01T10:00:00')
+
+
+def test_polled_endpoints_answer_304_when_etag_matches(monkeypatch):
+    telemetry = {
+        'device_id': 'device-1',
+        'moisture': 40,
+        'temperature': 20,
+        'ph': 6.5,
+        'captured_at': '2026-03-01T10:00:00Z',
+        'metadata': {},
+    }
+    command = {
+        'device_id': 'device-1',
+        'action': 'irrigate',
+        'duration_seconds': 60,
+        'sent_at': '2026-03-01T10:05:00Z',
+    }
+
+    class _Snapshot:
+        async def execute(self, device_id: str):
+            return {'device_id': device_id, 'telemetry': telemetry, 'command': None}
+
+    container = _FakeContainer(telemetry)
+    container.get_cached_command_use_case = _FakeGetCachedUseCase(command)
+    container.get_device_snapshot_use_case = _Snapshot()
+    monkeypatch.setattr(routes, 'get_container', lambda: container)
+
+    with TestClient(app) as client:
+        for path in (
+            '/api/v1/telemetry/latest/device-1',
+            '/api/v1/commands/latest/device-1',
+            '/api/v1/devices/device-1/snapshot',
+        ):
+            first = client.get(path)
+            etag = first.headers['etag']
+            assert first.status_code == 200
+            assert etag.startswith('W/"')
+
+            cached = client.get(path, headers={'If-None-Match': f'"other", {etag}'})
+            assert cached.status_code == 304
+            assert cached.content == b''
+            assert cached.headers['etag'] == etag
+
+            assert client.get(path, headers={'If-None-Match': '*'}).status_code == 304
+            assert client.get(path, headers={'If-None-Match': '"stale"'}).status_code == 200
+
+    assert etag.endswith('-0"')
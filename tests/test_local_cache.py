@@ -0,0 +1,61 @@
+from app.core.observability import metrics_registry
+from app.infrastructure.adapters.local_cache import LocalCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _counter(name: str, cache: str) -> float:
+    prefix = f'{name}{{cache="{cache}"}} '
+    for line in metrics_registry.render_prometheus().splitlines():
+        if line.startswith(prefix):
+            return float(line.removeprefix(prefix))
+    return 0.0
+
+
+def test_local_cache_evicts_least_recently_used_by_entries_and_bytes() -> None:
+    cache = LocalCache('test-lru', max_entries=2, max_bytes=100)
+    evictions = _counter('local_cache_evictions_total', 'test-lru')
+
+    cache.set('a', {'v': 1}, 60)
+    cache.set('b', {'v': 2}, 60)
+    assert cache.get('a') == {'v': 1}
+    cache.set('c', {'v': 3}, 60)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == {'v': 1}
+    assert len(cache) == 2
+
+    cache.set('big', {'v': 4}, 60, size=95)
+    assert len(cache) == 1
+    assert cache.nbytes == 95
+    cache.set('huge', {'v': 5}, 60, size=500)
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+    assert _counter('local_cache_evictions_total', 'test-lru') == evictions + 5
+
+
+def test_local_cache_expires_entries_and_replaces_in_place() -> None:
+    clock = FakeClock()
+    cache = LocalCache('test-ttl', clock=clock)
+    expirations = _counter('local_cache_expirations_total', 'test-ttl')
+
+    cache.set('short', {'v': 1}, 5)
+    cache.set('forever', {'v': 2}, None)
+    cache.set('short', {'v': 3}, 10, size=7)
+    assert cache.nbytes == 7 + len('{"v": 2}')
+
+    clock.now = 10
+    assert cache.get('short') is None
+    assert cache.get('forever') == {'v': 2}
+    assert _counter('local_cache_expirations_total', 'test-ttl') == expirations + 1
+
+    cache.set('forever', {'v': 4}, 0)
+    assert cache.get('forever') is None
+    cache.delete('missing')
+    assert len(cache) == 0
@@ -0,0 +1,129 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from app.core.observability import metrics_registry
+from app.domain.ports.interfaces import CachePort
+from app.infrastructure.adapters.near_cache import NearCacheAdapter
+
+
+class DictCache(CachePort):
+    def __init__(self) -> None:
+        self.values: dict[str, dict[str, Any]] = {}
+        self.reads = 0
+
+    async def set(self, key: str, value: dict[str, Any], ttl_seconds: int = 300) -> None:
+        self.values[key] = value
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        return (await self.get_many([key]))[0]
+
+    async def set_many(self, items: dict[str, dict[str, Any]], ttl_seconds: int = 300) -> None:
+        self.values.update(items)
+
+    async def get_many(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        self.reads += 1
+        return [self.values.get(key) for key in keys]
+
+
+class FakePubSub:
+    def __init__(self, broker: 'FakeBroker') -> None:
+        self.broker = broker
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def __aenter__(self) -> 'FakePubSub':
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.broker.subscribers.remove(self)
+
+    async def subscribe(self, channel: str) -> None:
+        if self.broker.fail_subscribe:
+            self.broker.fail_subscribe = False
+            raise ConnectionError('redis unavailable')
+        self.broker.subscribers.append(self)
+        self.broker.subscribed.set()
+
+    async def get_message(self, timeout: float) -> dict[str, Any] | None:  # noqa: ASYNC109
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except TimeoutError:
+            return None
+
+
+class FakeBroker:
+    def __init__(self) -> None:
+        self.subscribers: list[FakePubSub] = []
+        self.subscribed = asyncio.Event()
+        self.fail_subscribe = False
+        self.fail_publish = False
+
+    async def publish(self, channel: str, message: str) -> int:
+        if self.fail_publish:
+            raise ConnectionError('redis unavailable')
+        for subscriber in self.subscribers:
+            subscriber.queue.put_nowait({'type': 'message', 'data': message})
+        return len(self.subscribers)
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> FakePubSub:
+        return FakePubSub(self)
+
+
+def _near_cache(l2: CachePort, broker: FakeBroker) -> NearCacheAdapter:
+    return NearCacheAdapter(
+        l2,
+        broker,  # type: ignore[arg-type]
+        l1_ttl_seconds=60,
+        reconnect_interval_seconds=0.01,
+    )
+
+
+@pytest.mark.asyncio
+async def test_near_cache_serves_hot_keys_from_l1() -> None:
+    l2 = DictCache()
+    cache = _near_cache(l2, FakeBroker())
+
+    assert await cache.get('telemetry:missing') is None
+    l2.values['telemetry:dev-1'] = {'moisture': 40}
+    assert await cache.get('telemetry:dev-1') == {'moisture': 40}
+    assert await cache.get('telemetry:dev-1') == {'moisture': 40}
+    assert l2.reads == 2
+
+    await cache.set('telemetry:dev-2', {'moisture': 41})
+    assert await cache.get('telemetry:dev-2') == {'moisture': 41}
+    assert l2.reads == 2
+    rendered = metrics_registry.render_prometheus()
+    assert 'near_cache_hits_total{tier="l1"}' in rendered
+    assert 'near_cache_rtt_saved_seconds_total' in rendered
+
+
+@pytest.mark.asyncio
+async def test_near_cache_invalidates_other_workers_through_pubsub() -> None:
+    l2 = DictCache()
+    broker = FakeBroker()
+    broker.fail_subscribe = True
+    writer = _near_cache(l2, broker)
+    reader = _near_cache(l2, broker)
+    reader.start()
+    await asyncio.wait_for(broker.subscribed.wait(), timeout=1)
+
+    await writer.set('telemetry:dev-1', {'moisture': 40})
+    assert await reader.get('telemetry:dev-1') == {'moisture': 40}
+
+    await writer.set('telemetry:dev-1', {'moisture': 55})
+    for _ in range(50):
+        if await reader.get('telemetry:dev-1') == {'moisture': 55}:
+            break
+        await asyncio.sleep(0.01)
+    assert await reader.get('telemetry:dev-1') == {'moisture': 55}
+
+    reader._handle_message('not-json')
+    reader._handle_message('{"origin": "x"}')
+    broker.fail_publish = True
+    await writer.set('telemetry:dev-2', {'moisture': 1})
+    assert 'near_cache_invalidation_errors_total' in metrics_registry.render_prometheus()
+
+    await reader.close()
+    assert not reader.running
+    await reader.stop()
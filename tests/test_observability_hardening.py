@@ -80,6 +80,22 @@ def test_metrics_escape_labels_and_calculate_quantiles_and_errors() -> None:
     assert 'db_query_errors_total{operation="query\\"unsafe"} 1' in output
 
 
+def test_metrics_render_named_counters_and_gauges_with_labels() -> None:
+    registry = MetricsRegistry()
+    registry.increment_counter('outbox_relay_published_total', 3)
+    registry.increment_counter('outbox_relay_published_total', 2)
+    registry.increment_counter('custom_events_total', labels={'kind': 'a"b'})
+    registry.set_gauge('custom_ratio', 0.25, labels={'tier': 'l1'})
+
+    output = registry.render_prometheus()
+    assert '# HELP outbox_relay_published_total' in output
+    assert 'outbox_relay_published_total 5' in output
+    assert '# TYPE custom_events_total counter' in output
+    assert 'custom_events_total{kind="a\\"b"} 1' in output
+    assert '# TYPE custom_ratio gauge' in output
+    assert 'custom_ratio{tier="l1"} 0.250000' in output
+
+
 def test_rate_limiter_rejects_excess_and_expires_window(monkeypatch) -> None:
     clock = iter([100.0, 101.0, 102.0, 162.0])
     monkeypatch.setattr('app.core.observability.time.monotonic', lambda: next(clock))
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from app.application.services.outbox_relay import OutboxRelay
+from app.core.observability import metrics_registry
+
+
+class _FakeRepo:
+    def __init__(self) -> None:
+        self.requeued = 0
+
+    async def requeue_claimed_outbox(self) -> int:
+        self.requeued += 1
+        return 0
+
+
+class _FakeIngestUseCase:
+    def __init__(self, results: list[int | Exception]) -> None:
+        self.relational_repo = _FakeRepo()
+        self.results = results
+        self.calls: list[int] = []
+        self.drained = asyncio.Event()
+
+    async def reconcile_pending(self, limit: int = 100) -> int:
+        self.calls.append(limit)
+        if not self.results:
+            self.drained.set()
+            return 0
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.mark.asyncio
+async def test_relay_drains_full_batches_without_waiting_and_survives_errors() -> None:
+    use_case = _FakeIngestUseCase([2, 2, RuntimeError('db down'), 1])
+    relay = OutboxRelay(use_case, batch_size=2, interval_seconds=0.01)  # type: ignore[arg-type]
+
+    relay.start()
+    relay.start()
+    await asyncio.wait_for(use_case.drained.wait(), timeout=2)
+    assert relay.running is True
+    await relay.stop()
+    await relay.stop()
+
+    assert relay.running is False
+    assert use_case.relational_repo.requeued == 1
+    assert use_case.calls[:5] == [2, 2, 2, 2, 2]
+    rendered = metrics_registry.render_prometheus()
+    assert '# TYPE outbox_relay_published_total counter' in rendered
+    assert 'outbox_relay_errors_total' in rendered
+
+
+@pytest.mark.asyncio
+async def test_relay_stop_cancels_a_stuck_cycle() -> None:
+    class StuckUseCase(_FakeIngestUseCase):
+        async def reconcile_pending(self, limit: int = 100) -> int:
+            self.drained.set()
+            await asyncio.sleep(60)
+            return 0
+
+    class BrokenRepo(_FakeRepo):
+        async def requeue_claimed_outbox(self) -> int:
+            raise ConnectionError('db down')
+
+    use_case = StuckUseCase([])
+    use_case.relational_repo = BrokenRepo()
+    relay = OutboxRelay(use_case, batch_size=10, interval_seconds=0.01)  # type: ignore[arg-type]
+
+    relay.start()
+    await asyncio.wait_for(use_case.drained.wait(), timeout=2)
+    await relay.stop(timeout_seconds=0.01)
+
+    assert relay.running is False
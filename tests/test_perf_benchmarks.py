@@ -0,0 +1,41 @@
+import asyncio
+from types import SimpleNamespace
+
+from scripts import perf_benchmarks
+
+
+def test_ingest_benchmark_compares_single_and_batch_paths() -> None:
+    results = asyncio.run(perf_benchmarks.bench_ingest(readings=12, batch_size=5))
+
+    assert results['single_rows_per_second'] > 0
+    assert results['batch_rows_per_second'] > 0
+    assert results['speedup'] > 0
+
+
+def test_benchmark_cli_reports_selected_scenario(monkeypatch, capsys) -> None:
+    monkeypatch.setattr(
+        perf_benchmarks.argparse.ArgumentParser,
+        'parse_args',
+        lambda _: SimpleNamespace(scenario='ingest', readings=4, batch_size=2),
+    )
+    asyncio.run(perf_benchmarks.main())
+
+    output = capsys.readouterr().out
+    assert '--- Ingestao de telemetria ---' in output
+    assert 'batch_rows_per_second=' in output
+
+
+def test_fanout_benchmark_reports_p95_for_both_modes() -> None:
+    results = asyncio.run(perf_benchmarks.bench_fanout(requests=4, latency_ms=1))
+
+    assert results['sequential_p95_ms'] > 0
+    assert results['concurrent_p95_ms'] > 0
+    assert perf_benchmarks.percentile([1.0, 2.0, 3.0, 4.0], 0.5) == 2.0
+
+
+def test_export_benchmark_reports_throughput_and_peak_memory() -> None:
+    results = asyncio.run(perf_benchmarks.bench_export(rows=30, export_format='csv'))
+
+    assert results['rows'] == 30
+    assert results['rows_per_second'] > 0
+    assert results['peak_memory_mb'] > 0
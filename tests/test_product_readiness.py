@@ -1,5 +1,6 @@
 import asyncio
 
+from app.api.contracts import ProductReadinessReportOut
 from app.api.routes import PRODUCT_MODULES, product_module_detail, product_readiness_report
 
 
@@ -12,13 +13,8 @@ def test_product_modules_catalog_is_complete_for_requested_scope():
 
 
 def test_product_readiness_report_endpoint_shape():
-    report = (
-        product_readiness_report.__wrapped__()
-        if hasattr(product_readiness_report, '__wrapped__')
-        else None
-    )
-    if report is None:
-        report = asyncio.run(product_readiness_report())
+    response = asyncio.run(product_readiness_report())
+    report = ProductReadinessReportOut.model_validate_json(response.body)
 
     assert 'módulos estratégicos' in report.summary.lower()
     assert len(report.modules) == len(PRODUCT_MODULES)
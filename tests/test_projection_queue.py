@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from app.application.services.projection_queue import ProjectionQueue
+from app.core.observability import metrics_registry
+
+
+@pytest.mark.asyncio
+async def test_queue_runs_jobs_and_drains_on_stop() -> None:
+    queue = ProjectionQueue('test-drain', maxsize=10, workers=2)
+    done: list[int] = []
+
+    async def job(value: int) -> None:
+        await asyncio.sleep(0.01)
+        done.append(value)
+
+    assert queue.submit(lambda: job(0)) is False
+
+    queue.start()
+    queue.start()
+    assert queue.running is True
+    for value in range(5):
+        assert queue.submit(lambda value=value: job(value)) is True
+    await queue.stop()
+    await queue.stop()
+
+    assert sorted(done) == [0, 1, 2, 3, 4]
+    assert queue.running is False
+    assert queue.depth == 0
+    rendered = metrics_registry.render_prometheus()
+    assert 'projection_queue_processed_total{queue="test-drain"} 5' in rendered
+    assert 'projection_queue_capacity{queue="test-drain"} 10' in rendered
+
+
+@pytest.mark.asyncio
+async def test_queue_rejects_when_full_and_survives_failing_jobs() -> None:
+    queue = ProjectionQueue('test-full', maxsize=1, workers=1)
+    release = asyncio.Event()
+    started = asyncio.Event()
+
+    async def blocking() -> None:
+        started.set()
+        await release.wait()
+
+    async def failing() -> None:
+        raise RuntimeError('mongo down')
+
+    queue.start()
+    assert queue.submit(blocking) is True
+    await asyncio.wait_for(started.wait(), timeout=2)
+    assert queue.submit(failing) is True
+    assert queue.submit(failing) is False
+
+    release.set()
+    await queue.stop()
+
+    rendered = metrics_registry.render_prometheus()
+    assert 'projection_queue_rejected_total{queue="test-full"} 1' in rendered
+    assert 'projection_queue_failed_total{queue="test-full"} 1' in rendered
+
+
+@pytest.mark.asyncio
+async def test_queue_stop_gives_up_after_drain_timeout() -> None:
+    queue = ProjectionQueue('test-timeout', maxsize=1, workers=1)
+    started = asyncio.Event()
+
+    async def stuck() -> None:
+        started.set()
+        await asyncio.sleep(60)
+
+    queue.start()
+    queue.submit(stuck)
+    await asyncio.wait_for(started.wait(), timeout=2)
+    await queue.stop(timeout_seconds=0.01)
+
+    assert queue.running is False
@@ -0,0 +1,140 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from app.application.services.idempotency_service import IdempotencyService
+from app.core.exceptions import IdempotencyConflictError, IdempotencyInProgressError
+from app.core.observability import metrics_registry
+from app.core.settings import Settings
+from app.domain.entities.models import IdempotencyState
+from app.infrastructure.adapters.redis_idempotency import RedisIdempotencyRepository
+from app.infrastructure.persistence.relational_repository import SqlAlchemyTelemetryRepository
+
+
+class _Redis:
+    """Subconjunto de `SET` usado pelas reservas, incluindo `NX` + `GET` atomicos."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+        self.calls = 0
+        self.fail = False
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        *,
+        px: int,
+        nx: bool = False,
+        get: bool = False,
+    ) -> bytes | bool | None:
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.fail:
+            raise ConnectionError('redis unavailable')
+        previous = self.values.get(key)
+        if not (nx and previous is not None):
+            self.values[key] = value
+            self.ttls[key] = px
+        return previous if get else True
+
+
+class _CountingRepository(SqlAlchemyTelemetryRepository):
+    calls = 0
+
+    async def reserve(self, record: Any) -> Any:
+        self.calls += 1
+        return await super().reserve(record)
+
+
+def _settings(tmp_path: Path) -> Settings:
+    return Settings(
+        relational_db_url=f'sqlite+aiosqlite:///{(tmp_path / "idem.db").as_posix()}',
+        idempotency_ttl_seconds=120,
+        otel_enabled=False,
+    )
+
+
+async def _durable(tmp_path: Path) -> _CountingRepository:
+    repository = _CountingRepository(_settings(tmp_path))
+    await repository.init_schema()
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_contended_key_reserves_once_in_redis_and_replays_without_sql(
+    tmp_path: Path,
+) -> None:
+    redis, durable = _Redis(), await _durable(tmp_path)
+    repository = RedisIdempotencyRepository(_settings(tmp_path), redis, durable)
+    service = IdempotencyService(repository)
+    release = asyncio.Event()
+    effects = 0
+
+    async def action() -> dict[str, Any]:
+        nonlocal effects
+        effects += 1
+        await release.wait()
+        return {'status': 'sent'}
+
+    async def call() -> dict[str, Any]:
+        return await service.execute(
+            key='command-key-0001', operation='command', payload={'a': 1}, action=action
+        )
+
+    first = asyncio.create_task(call())
+    await asyncio.sleep(0.01)
+    contended = asyncio.gather(*(call() for _ in range(20)))
+    await asyncio.sleep(0.01)
+    release.set()
+    assert (await first)['replayed'] is False
+    assert all(result['replayed'] for result in await contended)
+    assert effects == 1
+    assert redis.calls == 2
+    assert redis.ttls['idempotency:command-key-0001'] == 120_000
+
+    await repository.close()
+    assert durable.calls == 1
+    replays = await asyncio.gather(*(call() for _ in range(20)))
+    assert all(replay['replayed'] and replay['status'] == 'sent' for replay in replays)
+    assert durable.calls == 1
+    with pytest.raises(IdempotencyConflictError):
+        await service.execute(
+            key='command-key-0001', operation='command', payload={'a': 2}, action=action
+        )
+
+    stored = await durable._get_idempotency('command-key-0001')
+    assert stored.state is IdempotencyState.COMPLETED
+    assert stored.response == {**replays[0], 'replayed': False}
+    await durable.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_redis_outage_falls_back_to_durable_repository(tmp_path: Path) -> None:
+    redis, durable = _Redis(), await _durable(tmp_path)
+    repository = RedisIdempotencyRepository(_settings(tmp_path), redis, durable)
+    service = IdempotencyService(repository)
+
+    async def ok() -> dict[str, Any]:
+        return {'status': 'ok'}
+
+    async def boom() -> dict[str, Any]:
+        raise RuntimeError('action failed')
+
+    redis.fail = True
+    await service.execute(key='ledger-key-0001', operation='ledger', payload={}, action=ok)
+    assert (await durable._get_idempotency('ledger-key-0001')).state is IdempotencyState.COMPLETED
+
+    redis.fail = False
+    with pytest.raises(RuntimeError):
+        await service.execute(key='ledger-key-0002', operation='ledger', payload={}, action=boom)
+    redis.fail = True
+    await repository.close()
+    with pytest.raises(IdempotencyInProgressError):
+        await service.execute(key='ledger-key-0002', operation='ledger', payload={}, action=ok)
+    assert (await durable._get_idempotency('ledger-key-0002')).state is IdempotencyState.UNKNOWN
+    assert 'idempotency_redis_fallback_total' in metrics_registry.render_prometheus()
+    await durable.engine.dispose()
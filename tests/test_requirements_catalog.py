@@ -1,4 +1,16 @@
-from app.api.routes import REQUIREMENT_CATALOG, _build_requirement_detail, _slugify_requirement
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from app.api import routes
+from app.api.routes import (
+    REQUIREMENT_CATALOG,
+    REQUIREMENT_SLUGS,
+    _build_requirement_detail,
+    _slugify_requirement,
+)
+from app.application.services import CoverageService
+from app.main import app
 
 
 def test_requirement_catalog_has_full_section_coverage():
@@ -12,3 +24,28 @@ def test_requirement_endpoint_slug_and_details_are_stable():
     assert detail.requirement_id == '4.5'
     assert detail.implemented is True
     assert detail.endpoint.endswith('/4-5-telemetria-em-tempo-real')
+
+
+def test_single_requirement_route_serves_every_catalog_slug(monkeypatch) -> None:
+    container = SimpleNamespace(coverage_service=CoverageService())
+    monkeypatch.setattr(routes, 'get_container', lambda: container)
+
+    requirement_routes = [
+        route for route in routes.router.routes if route.path.startswith('/api/v1/requirements/')
+    ]
+    assert [route.path for route in requirement_routes] == ['/api/v1/requirements/{slug}']
+
+    assert list(container.coverage_service.requirement_details_json) == REQUIREMENT_SLUGS
+    with TestClient(app, raise_server_exceptions=False) as client:
+        for requirement_id, title in REQUIREMENT_CATALOG[::20]:
+            slug = _slugify_requirement(requirement_id, title)
+            response = client.get(f'/api/v1/requirements/{slug}')
+            assert response.status_code == 200
+            assert response.json() == _build_requirement_detail(requirement_id, title).model_dump()
+        missing = client.get('/api/v1/requirements/99-9-inexistente')
+        schema = client.get('/openapi.json').json()
+
+    assert missing.status_code == 404
+    assert missing.json()['error']['code'] == 'HTTP_ERROR'
+    parameters = schema['paths']['/api/v1/requirements/{slug}']['get']['parameters']
+    assert parameters[0]['schema']['enum'] == REQUIREMENT_SLUGS
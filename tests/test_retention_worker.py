@@ -0,0 +1,79 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.application.services.retention_worker import RetentionWorker
+from app.core.observability import metrics_registry
+
+NOW = datetime(2026, 8, 20, 12, tzinfo=UTC)
+
+
+class _FakeRepo:
+    def __init__(self, outbox: int, telemetry: int, idempotency: int = 0) -> None:
+        self.outbox = outbox
+        self.telemetry = telemetry
+        self.idempotency = idempotency
+        self.cutoffs: dict[str, list[datetime]] = {'outbox': [], 'telemetry': [], 'idempotency': []}
+        self.ran = asyncio.Event()
+
+    async def purge_published_outbox(self, older_than: datetime, limit: int = 1_000) -> int:
+        self.cutoffs['outbox'].append(older_than)
+        removed = min(limit, self.outbox)
+        self.outbox -= removed
+        return removed
+
+    async def archive_telemetry(self, older_than: datetime, limit: int = 1_000) -> int:
+        self.cutoffs['telemetry'].append(older_than)
+        self.ran.set()
+        if self.telemetry < 0:
+            raise ConnectionError('db down')
+        removed = min(limit, self.telemetry)
+        self.telemetry -= removed
+        return removed
+
+    async def purge_expired_idempotency(self, now: datetime, limit: int = 1_000) -> int:
+        self.cutoffs['idempotency'].append(now)
+        removed = min(limit, self.idempotency)
+        self.idempotency -= removed
+        return removed
+
+
+@pytest.mark.asyncio
+async def test_retention_runs_bounded_batches_per_table() -> None:
+    repo = _FakeRepo(outbox=25, telemetry=7, idempotency=12)
+    worker = RetentionWorker(
+        repo,  # type: ignore[arg-type]
+        outbox_retention_hours=2,
+        telemetry_retention_days=30,
+        batch_size=10,
+        max_batches_per_run=2,
+    )
+
+    first = await worker.run_once(NOW)
+    second = await worker.run_once(NOW)
+
+    assert first == {'outbox': 20, 'telemetry': 7, 'idempotency': 12}
+    assert second == {'outbox': 5, 'telemetry': 0, 'idempotency': 0}
+    assert repo.cutoffs['outbox'][0] == NOW - timedelta(hours=2)
+    assert repo.cutoffs['telemetry'][0] == NOW - timedelta(days=30)
+    assert repo.cutoffs['idempotency'][0] == NOW
+    rendered = metrics_registry.render_prometheus()
+    assert 'retention_last_run_rows{table="outbox"} 5' in rendered
+    assert '# TYPE retention_rows_total counter' in rendered
+
+
+@pytest.mark.asyncio
+async def test_retention_worker_survives_errors_and_stops() -> None:
+    repo = _FakeRepo(outbox=0, telemetry=-1)
+    worker = RetentionWorker(repo, interval_seconds=0.01)  # type: ignore[arg-type]
+
+    worker.start()
+    worker.start()
+    await asyncio.wait_for(repo.ran.wait(), timeout=2)
+    assert worker.running is True
+    await worker.stop()
+    await worker.stop()
+
+    assert worker.running is False
+    assert 'retention_errors_total{table="telemetry"}' in metrics_registry.render_prometheus()
@@ -2,9 +2,11 @@ import asyncio
 from types import SimpleNamespace
 from typing import Any
 
+from fastapi import Response
 from fastapi.testclient import TestClient
 
 import app.api.routes as routes
+from app.domain.entities.models import OutboxState
 from app.main import app, settings
 
 
@@ -17,6 +19,8 @@ class FakeUseCase:
         self.calls.append((args, kwargs))
         return self.result
 
+    execute_many = execute
+
 
 class FakeIdempotencyService:
     def __init__(self) -> None:
@@ -78,6 +82,27 @@ def test_mutating_routes_map_dtos_and_propagate_idempotency(monkeypatch) -> None
     assert idempotency.calls[1]['operation'] == 'ledger.register'
 
 
+def test_batch_route_reports_outbox_state_per_reading(monkeypatch) -> None:
+    ingest = FakeUseCase([OutboxState.PUBLISHED, OutboxState.PENDING])
+    monkeypatch.setattr(
+        routes, 'get_container', lambda: SimpleNamespace(ingest_telemetry_use_case=ingest)
+    )
+    payload = [
+        routes.TelemetryIn(device_id=device_id, moisture=55, temperature=24, ph=6.5)
+        for device_id in ('sensor-1', 'sensor-2')
+    ]
+
+    ack = asyncio.run(routes.ingest_telemetry_batch(payload))
+
+    assert ack.accepted == 2
+    assert ack.published == 1
+    assert [item.outbox_state for item in ack.items] == ['published', 'pending']
+    assert [reading.device_id for reading in ingest.calls[0][0][0]] == ['sensor-1', 'sensor-2']
+    with TestClient(app, raise_server_exceptions=False) as client:
+        empty = client.post('/api/v1/telemetry/batch', json=[])
+    assert empty.status_code == 422
+
+
 def test_latest_routes_validate_cached_contracts(monkeypatch) -> None:
     container = SimpleNamespace(
         get_cached_telemetry_use_case=FakeUseCase(
@@ -94,8 +119,8 @@ def test_latest_routes_validate_cached_contracts(monkeypatch) -> None:
     )
     monkeypatch.setattr(routes, 'get_container', lambda: container)
 
-    telemetry = asyncio.run(routes.latest_telemetry('sensor-1'))
-    command = asyncio.run(routes.latest_command('sensor-1'))
+    telemetry = asyncio.run(routes.latest_telemetry('sensor-1', Response()))
+    command = asyncio.run(routes.latest_command('sensor-1', Response()))
 
     assert telemetry is not None
     assert telemetry.device_id == 'sensor-1'
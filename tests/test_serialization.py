@@ -0,0 +1,62 @@
+import json
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.settings import PayloadCodecName, Settings
+from app.infrastructure import serialization
+from app.infrastructure.serialization import (
+    MSGPACK_V1,
+    build_codec,
+    decode_payload,
+    json_serializer,
+)
+
+READING = {
+    'device_id': 'sensor-1',
+    'moisture': 41.5,
+    'metadata': {'zone': 'north'},
+    'captured_at': datetime(2026, 4, 5, 12, tzinfo=UTC),
+}
+
+
+@pytest.mark.parametrize('name', list(PayloadCodecName))
+def test_every_codec_round_trips_through_the_shared_decoder(name: PayloadCodecName) -> None:
+    codec = build_codec(name)
+    encoded = codec.encode(READING)
+
+    decoded = codec.decode(encoded)
+
+    assert decoded['device_id'] == 'sensor-1'
+    assert decoded['metadata']['zone'] == 'north'
+    assert datetime.fromisoformat(decoded['captured_at']) == READING['captured_at']
+    assert (encoded[0] == MSGPACK_V1) is (name is PayloadCodecName.MSGPACK)
+
+
+def test_decoder_accepts_legacy_json_and_rejects_garbage() -> None:
+    assert decode_payload('{"a": 1}') == {'a': 1}
+    assert decode_payload(b'{"a": 1}') == {'a': 1}
+    with pytest.raises(ValueError):
+        decode_payload(b'not-json')
+    with pytest.raises(ValueError):
+        decode_payload(bytes((MSGPACK_V1, 0xC1)))
+
+
+def test_missing_optional_dependency_is_reported() -> None:
+    with patch.object(serialization, '_msgpack', None), pytest.raises(ImportError):
+        build_codec(PayloadCodecName.MSGPACK)
+    with patch('importlib.util.find_spec', return_value=None), pytest.raises(ValidationError):
+        Settings(otel_enabled=False, payload_codec='orjson')
+    with patch.object(serialization, '_orjson', None):
+        assert decode_payload(b'{"a": 1}') == {'a': 1}
+
+
+def test_json_serializer_for_sql_columns() -> None:
+    assert json_serializer(PayloadCodecName.JSON) is json.dumps
+    dumps = json_serializer(PayloadCodecName.ORJSON)
+    assert json.loads(dumps({'zone': 'north', 1: 'numeric-key'})) == {
+        'zone': 'north',
+        '1': 'numeric-key',
+    }
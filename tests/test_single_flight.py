@@ -0,0 +1,119 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from app.application.services.single_flight import SingleFlight
+from app.application.use_cases.iot.get_cached_telemetry_use_case import GetCachedTelemetryUseCase
+from app.core.exceptions import TransientIntegrationError
+from app.domain.entities.models import TelemetryReading
+
+
+class _Cache:
+    def __init__(self) -> None:
+        self.values: dict[str, dict[str, Any]] = {}
+        self.fail_set = False
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        await asyncio.sleep(0)
+        return self.values.get(key)
+
+    async def set(self, key: str, value: dict[str, Any], ttl_seconds: int = 300) -> None:
+        if self.fail_set:
+            raise TransientIntegrationError(key)
+        self.values[key] = value
+
+
+class _Repo:
+    def __init__(self) -> None:
+        self.fetches = 0
+
+    async def list_recent(self, limit: int = 20, device_id: str | None = None):
+        self.fetches += 1
+        await asyncio.sleep(0.01)
+        if device_id == 'unknown':
+            return []
+        return [TelemetryReading(device_id=device_id or '', moisture=40, temperature=20, ph=6.5)]
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_thousand_concurrent_misses_share_one_backend_fetch_per_expiry() -> None:
+    cache, repo = _Cache(), _Repo()
+    use_case = GetCachedTelemetryUseCase(cache, relational_repo=repo, early_refresh_beta=0)
+
+    for expiry in range(1, 3):
+        cache.values.clear()
+        results = await asyncio.gather(*(use_case.execute('hot') for _ in range(1_000)))
+        assert repo.fetches == expiry
+        assert all(result is not None and result['device_id'] == 'hot' for result in results)
+
+    assert await use_case.execute('hot') is not None
+    assert repo.fetches == 2
+    assert await use_case.execute('unknown') is None
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_errors_and_survives_caller_cancellation() -> None:
+    group: SingleFlight[int] = SingleFlight('test')
+    calls = 0
+    release = asyncio.Event()
+
+    async def failing() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        raise ConnectionError('down')
+
+    waiters = [asyncio.create_task(group.do('k', failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    waiters[0].cancel()
+    release.set()
+    outcomes = await asyncio.gather(*waiters, return_exceptions=True)
+    assert isinstance(outcomes[0], asyncio.CancelledError)
+    assert all(isinstance(outcome, ConnectionError) for outcome in outcomes[1:])
+    assert calls == 1
+    assert not group.pending('k')
+
+    async def ok() -> int:
+        return 7
+
+    assert await group.do('k', ok) == 7
+
+
+@pytest.mark.asyncio
+async def test_latest_reads_refresh_early_before_expiry() -> None:
+    cache, repo, clock = _Cache(), _Repo(), _Clock()
+    use_case = GetCachedTelemetryUseCase(
+        cache, relational_repo=repo, ttl_seconds=60, early_refresh_beta=1.0, clock=clock
+    )
+
+    await use_case.execute('hot')
+    assert repo.fetches == 1
+    clock.now = 30
+    await use_case.execute('hot')
+    assert repo.fetches == 1
+
+    clock.now = 60
+    cache.fail_set = True
+    await use_case.execute('hot')
+    await asyncio.gather(*use_case._refreshes)
+    assert repo.fetches == 2
+    assert 'telemetry:hot' in cache.values
+
+
+@pytest.mark.asyncio
+async def test_latest_without_repository_only_reads_cache() -> None:
+    cache = _Cache()
+    cache.values['telemetry:a'] = {'device_id': 'a'}
+    use_case = GetCachedTelemetryUseCase(cache)
+
+    assert await use_case.execute('a') == {'device_id': 'a'}
+    assert await use_case.execute('b') is None
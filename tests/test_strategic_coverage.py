@@ -1,6 +1,12 @@
+import asyncio
+import json
+
+from app.api.contracts import StrategicCoverageReportOut
 from app.api.routes import (
+    REQUIREMENT_CATALOG,
     STRATEGIC_COVERAGE_MATRIX,
     STRATEGIC_NEXT_STEPS,
+    list_requirement_coverage,
     strategic_coverage_report,
 )
 
@@ -14,16 +20,25 @@ def test_strategic_coverage_matrix_has_expected_items():
 
 
 def test_strategic_coverage_endpoint_payload_shape():
-    report = (
-        strategic_coverage_report.__wrapped__()
-        if hasattr(strategic_coverage_report, '__wrapped__')
-        else None
-    )
-    if report is None:
-        import asyncio
-
-        report = asyncio.run(strategic_coverage_report())
+    response = asyncio.run(strategic_coverage_report())
+    report = StrategicCoverageReportOut.model_validate_json(response.body)
 
     assert 'não atende integralmente' in report.overall_result.lower()
     assert len(report.matrix) == len(STRATEGIC_COVERAGE_MATRIX)
     assert len(report.next_steps) == len(STRATEGIC_NEXT_STEPS)
+
+
+def test_coverage_catalogs_are_served_as_precomputed_bytes_with_strong_etag():
+    first = asyncio.run(list_requirement_coverage())
+    second = asyncio.run(list_requirement_coverage())
+    etag = first.headers['ETag']
+
+    assert first.body is second.body
+    assert first.media_type == 'application/json'
+    assert not etag.startswith('W/')
+    assert len(json.loads(first.body)) == len(REQUIREMENT_CATALOG)
+
+    not_modified = asyncio.run(list_requirement_coverage(if_none_match=etag))
+    assert not_modified.status_code == 304
+    assert not_modified.body == b''
+    assert asyncio.run(list_requirement_coverage(if_none_match='"outra"')).status_code == 200
@@ -0,0 +1,125 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from app.application.services.telemetry_query_cache import TelemetryQueryCache
+from app.application.use_cases.ingest_telemetry import IngestTelemetryUseCase
+from app.application.use_cases.iot.list_telemetry_use_case import ListTelemetryUseCase
+from app.core.exceptions import TransientIntegrationError
+from app.core.observability import metrics_registry
+from app.domain.entities.models import TelemetryReading
+
+ORIGIN = datetime(2026, 4, 5, 12, tzinfo=UTC)
+
+
+def _reading(device_id: str, minute: int) -> TelemetryReading:
+    return TelemetryReading(
+        device_id=device_id,
+        moisture=minute,
+        temperature=20,
+        ph=6.5,
+        captured_at=ORIGIN + timedelta(minutes=minute),
+    )
+
+
+class _Cache:
+    def __init__(self) -> None:
+        self.values: dict[str, dict[str, Any]] = {}
+        self.fail_set = False
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: dict[str, Any], ttl_seconds: int = 300) -> None:
+        await self.set_many({key: value}, ttl_seconds)
+
+    async def get_many(self, keys: list[str]) -> list[dict[str, Any] | None]:
+        return [self.values.get(key) for key in keys]
+
+    async def set_many(self, items: dict[str, dict[str, Any]], ttl_seconds: int = 300) -> None:
+        if self.fail_set:
+            raise TransientIntegrationError('redis')
+        self.values.update(items)
+
+
+class _Repo:
+    def __init__(self, readings: list[TelemetryReading]) -> None:
+        self.readings = readings
+        self.queries: list[tuple[int, str | None]] = []
+
+    async def list_recent(self, limit: int = 20, device_id: str | None = None):
+        self.queries.append((limit, device_id))
+        matching = [item for item in self.readings if device_id in (None, item.device_id)]
+        return sorted(matching, key=lambda item: item.captured_at, reverse=True)[:limit]
+
+    async def save_with_outbox(self, reading: TelemetryReading) -> str:
+        self.readings.append(reading)
+        return 'event-1'
+
+    async def mark_outbox_published(self, event_id: str) -> None:
+        return None
+
+
+class _Sink:
+    async def save(self, reading: TelemetryReading) -> None:
+        return None
+
+    async def publish_telemetry(self, reading: TelemetryReading) -> None:
+        return None
+
+
+def test_polls_are_served_from_the_window_and_ingest_appends_precisely() -> None:
+    cache = _Cache()
+    repo = _Repo([_reading('a', minute) for minute in range(5)] + [_reading('b', 2)])
+    query_cache = TelemetryQueryCache(cache, window=4)
+    list_use_case = ListTelemetryUseCase(repo, query_cache=query_cache)
+    ingest = IngestTelemetryUseCase(_Sink(), cache, repo, _Sink(), query_cache=query_cache)
+
+    async def scenario() -> None:
+        first = await list_use_case.execute(limit=2, device_id='a')
+        assert [item.moisture for item in first] == [4, 3]
+        assert [item.moisture for item in await list_use_case.execute(3, 'a')] == [4, 3, 2]
+        assert [item.device_id for item in await list_use_case.execute(2)] == ['a', 'a']
+        assert repo.queries == [(4, 'a'), (4, None)]
+
+        await ingest.execute(_reading('a', 10))
+        latest = await list_use_case.execute(limit=4, device_id='a')
+        assert [item.moisture for item in latest] == [10, 4, 3, 2]
+        assert (await list_use_case.execute(1))[0].moisture == 10
+        assert len(repo.queries) == 2
+
+        assert [item.moisture for item in await list_use_case.execute(4, 'b')] == [2]
+        assert await list_use_case.execute(1, 'b') is not None
+        assert repo.queries[-1] == (4, 'b')
+        assert len(repo.queries) == 3
+        await list_use_case.execute(limit=10, device_id='a')
+        assert repo.queries[-1] == (10, 'a')
+
+    asyncio.run(scenario())
+    rendered = metrics_registry.render_prometheus()
+    assert 'telemetry_query_cache_hits_total' in rendered
+    assert 'telemetry_query_cache_hit_ratio' in rendered
+
+
+def test_incomplete_windows_miss_and_cache_failures_are_tolerated() -> None:
+    cache = _Cache()
+    query_cache = TelemetryQueryCache(cache, window=4)
+
+    async def scenario() -> None:
+        await query_cache.fill('a', [_reading('a', 3), _reading('a', 2)])
+        assert cache.values[query_cache.key('a')]['complete'] is True
+        assert len(await query_cache.get(4, 'a') or []) == 2
+
+        cache.values[query_cache.key('a')]['complete'] = False
+        assert await query_cache.get(4, 'a') is None
+        await query_cache.append([])
+        await query_cache.append([_reading('a', 1), _reading('a', 5), _reading('a', 6)])
+        window = cache.values[query_cache.key('a')]
+        assert [item['moisture'] for item in window['items']] == [6, 5, 3, 2]
+        assert window['complete'] is False
+
+        cache.fail_set = True
+        await query_cache.fill('b', [_reading('b', 1)])
+        assert query_cache.key('b') not in cache.values
+
+    asyncio.run(scenario())
@@ -0,0 +1,99 @@
+import asyncio
+from datetime import UTC, datetime
+
+from app.application.services.telemetry_ring_buffer import TelemetryRingBuffer
+from app.application.use_cases.iot.get_cached_telemetry_use_case import GetCachedTelemetryUseCase
+from app.application.use_cases.iot.get_device_snapshot_use_case import GetDeviceSnapshotUseCase
+from app.application.use_cases.iot.list_telemetry_use_case import ListTelemetryUseCase
+from app.core.observability import metrics_registry
+from app.domain.entities.models import TelemetryReading
+
+
+def _reading(device_id: str, minute: int) -> TelemetryReading:
+    return TelemetryReading(
+        device_id=device_id,
+        moisture=minute,
+        temperature=20 + minute,
+        ph=6.5,
+        captured_at=datetime(2026, 8, 20, 12, minute, 0, 123_456, tzinfo=UTC),
+        metadata={'seq': minute},
+    )
+
+
+class _Repo:
+    def __init__(self, rows: list[TelemetryReading]) -> None:
+        self.rows = rows
+        self.calls = 0
+
+    async def list_recent(self, limit: int = 20, device_id: str | None = None):
+        self.calls += 1
+        return [row for row in self.rows if device_id in (None, row.device_id)][:limit]
+
+
+class _Cache:
+    def __init__(self) -> None:
+        self.values = {'telemetry:cold': {'device_id': 'cold'}, 'command:hot': {'action': 'stop'}}
+
+    async def get(self, key: str):
+        return self.values.get(key)
+
+    async def get_many(self, keys: list[str]):
+        return [self.values.get(key) for key in keys]
+
+
+def test_ring_wraps_columns_and_bounds_devices() -> None:
+    buffer = TelemetryRingBuffer(capacity_per_device=3, max_devices=2)
+    buffer.extend([_reading('a', minute) for minute in range(5)])
+
+    assert [item.moisture for item in buffer.recent('a', 3)] == [4, 3, 2]
+    assert buffer.recent('a', 4) is None
+    latest = buffer.latest('a')
+    assert latest == _reading('a', 4)
+
+    buffer.append(_reading('b', 1))
+    buffer.latest('a')
+    buffer.append(_reading('c', 1))
+    assert len(buffer) == 2
+    assert buffer.latest('b') is None
+    assert buffer.nbytes == 2 * buffer._rings['a'].nbytes
+    rendered = metrics_registry.render_prometheus()
+    assert 'telemetry_ring_buffer_devices 2' in rendered
+    assert 'telemetry_ring_buffer_hits_total{read="latest"}' in rendered
+
+
+def test_list_use_case_seeds_from_sql_then_serves_from_memory() -> None:
+    buffer = TelemetryRingBuffer(capacity_per_device=10)
+    repo = _Repo([_reading('dev', minute) for minute in (3, 2, 1)])
+    use_case = ListTelemetryUseCase(repo, ring_buffer=buffer)
+
+    first = asyncio.run(use_case.execute(limit=5, device_id='dev'))
+    second = asyncio.run(use_case.execute(limit=5, device_id='dev'))
+    buffer.append(_reading('dev', 4))
+    third = asyncio.run(use_case.execute(limit=2, device_id='dev'))
+    asyncio.run(use_case.execute(limit=5, device_id=None))
+
+    assert first == second
+    assert [item.moisture for item in third] == [4, 3]
+    assert repo.calls == 2
+
+    partial = TelemetryRingBuffer(capacity_per_device=2)
+    partial.seed('dev', repo.rows, complete=True)
+    assert partial.recent('dev', 3) is None
+    partial.seed('dev', [], complete=True)
+    assert [item.moisture for item in partial.recent('dev', 2)] == [3, 2]
+
+
+def test_latest_and_snapshot_prefer_buffer_and_fall_back_to_cache() -> None:
+    buffer = TelemetryRingBuffer()
+    buffer.append(_reading('hot', 7))
+    cache = _Cache()
+
+    latest = GetCachedTelemetryUseCase(cache, ring_buffer=buffer)
+    snapshot = GetDeviceSnapshotUseCase(cache, ring_buffer=buffer)
+
+    assert asyncio.run(latest.execute('hot'))['metadata'] == {'seq': 7}
+    assert asyncio.run(latest.execute('cold')) == {'device_id': 'cold'}
+    hot = asyncio.run(snapshot.execute('hot'))
+    assert hot['telemetry']['moisture'] == 7
+    assert hot['command'] == {'action': 'stop'}
+    assert asyncio.run(snapshot.execute('cold'))['telemetry'] == {'device_id': 'cold'}